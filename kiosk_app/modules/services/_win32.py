@@ -0,0 +1,496 @@
+# modules/services/_win32.py
+"""
+Gemeinsame Win32 Prototypen und Prozess-Snapshots fuer das Einbetten lokaler Apps.
+Wird von local_app_service und dem Fenster-Spion genutzt; nur unter Windows importierbar.
+"""
+from __future__ import annotations
+
+import ctypes
+from ctypes import wintypes
+import threading
+import time
+from collections import defaultdict, deque
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Set
+
+# ================= Win32 Binding =================
+
+def _load_user32_attr(name: str):
+    try:
+        return getattr(ctypes.windll.user32, name)  # type: ignore[attr-defined]
+    except Exception:
+        return None
+
+def _load_kernel32_attr(name: str):
+    try:
+        return getattr(ctypes.windll.kernel32, name)  # type: ignore[attr-defined]
+    except Exception:
+        return None
+
+user32 = ctypes.windll.user32   # type: ignore[attr-defined]
+kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+
+HWND   = wintypes.HWND
+DWORD  = wintypes.DWORD
+BOOL   = wintypes.BOOL
+LPARAM = wintypes.LPARAM
+UINT   = wintypes.UINT
+
+# LONG_PTR und LRESULT kompatibel fuer Python 3.13
+if ctypes.sizeof(ctypes.c_void_p) == 8:
+    _LONG_PTR_T = ctypes.c_longlong
+else:
+    _LONG_PTR_T = ctypes.c_long
+LONG_PTR = _LONG_PTR_T
+
+WPARAM = wintypes.WPARAM
+try:
+    LRESULT = wintypes.LRESULT  # type: ignore[attr-defined]
+except AttributeError:
+    LRESULT = LONG_PTR
+
+EnumWindowsProc = ctypes.WINFUNCTYPE(BOOL, HWND, LPARAM)
+
+GetWindowThreadProcessId = user32.GetWindowThreadProcessId
+GetWindowThreadProcessId.argtypes = [HWND, ctypes.POINTER(DWORD)]
+GetWindowThreadProcessId.restype  = DWORD
+
+EnumWindows = user32.EnumWindows
+EnumWindows.argtypes = [EnumWindowsProc, LPARAM]
+EnumWindows.restype  = BOOL
+
+EnumChildWindows = user32.EnumChildWindows
+EnumChildWindows.argtypes = [HWND, EnumWindowsProc, LPARAM]
+EnumChildWindows.restype  = BOOL
+
+IsWindow = user32.IsWindow
+IsWindow.argtypes = [HWND]
+IsWindow.restype  = BOOL
+
+IsWindowVisible = user32.IsWindowVisible
+IsWindowVisible.argtypes = [HWND]
+IsWindowVisible.restype  = BOOL
+
+GetClassNameW = user32.GetClassNameW
+GetClassNameW.argtypes = [HWND, ctypes.c_wchar_p, ctypes.c_int]
+GetClassNameW.restype  = ctypes.c_int
+
+GetWindowTextW = user32.GetWindowTextW
+GetWindowTextW.argtypes = [HWND, ctypes.c_wchar_p, ctypes.c_int]
+GetWindowTextW.restype  = ctypes.c_int
+
+GetAncestor = user32.GetAncestor
+GetAncestor.argtypes = [HWND, UINT]
+GetAncestor.restype  = HWND
+GA_ROOT = 2
+
+ShowWindow = user32.ShowWindow
+ShowWindow.argtypes = [HWND, ctypes.c_int]
+ShowWindow.restype  = BOOL
+SW_SHOW = 5
+SW_SHOWNOACTIVATE = 4
+SW_RESTORE = 9
+
+MoveWindow = user32.MoveWindow
+MoveWindow.argtypes = [HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, BOOL]
+MoveWindow.restype  = BOOL
+
+SendMessageW = user32.SendMessageW
+SendMessageW.argtypes = [HWND, UINT, WPARAM, LPARAM]
+SendMessageW.restype  = LRESULT
+
+PostMessageW = user32.PostMessageW
+PostMessageW.argtypes = [HWND, UINT, WPARAM, LPARAM]
+PostMessageW.restype  = BOOL
+
+RedrawWindow = user32.RedrawWindow
+RedrawWindow.argtypes = [HWND, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint]
+RedrawWindow.restype  = BOOL
+
+WM_SIZE = 0x0005
+WM_WINDOWPOSCHANGING = 0x0046
+WM_WINDOWPOSCHANGED  = 0x0047
+WM_SETREDRAW = 0x000B
+SIZE_RESTORED = 0
+
+RDW_INVALIDATE   = 0x0001
+RDW_ERASE        = 0x0004
+RDW_ALLCHILDREN  = 0x0080
+RDW_UPDATENOW    = 0x0100
+RDW_NOFRAME      = 0x0800
+
+GetWindowLongPtrW = user32.GetWindowLongPtrW
+GetWindowLongPtrW.argtypes = [HWND, ctypes.c_int]
+GetWindowLongPtrW.restype  = LONG_PTR
+
+SetWindowLongPtrW = user32.SetWindowLongPtrW
+SetWindowLongPtrW.argtypes = [HWND, ctypes.c_int, LONG_PTR]
+SetWindowLongPtrW.restype  = LONG_PTR
+
+SetWindowPos = user32.SetWindowPos
+SetWindowPos.argtypes = [HWND, HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_uint]
+SetWindowPos.restype  = BOOL
+
+SetParent = user32.SetParent
+SetParent.argtypes = [HWND, HWND]
+SetParent.restype = HWND
+
+GWL_STYLE = -16
+WS_CHILD = 0x40000000
+WS_POPUP = 0x80000000
+WS_CAPTION = 0x00C00000
+WS_THICKFRAME = 0x00040000
+WS_MINIMIZEBOX = 0x00020000
+WS_MAXIMIZEBOX = 0x00010000
+WS_CLIPSIBLINGS = 0x04000000
+WS_CLIPCHILDREN = 0x02000000
+
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+SWP_NOZORDER = 0x0004
+SWP_NOOWNERZORDER = 0x0200
+SWP_NOACTIVATE = 0x0010
+SWP_FRAMECHANGED = 0x0020
+SWP_ASYNCWINDOWPOS = 0x4000
+SWP_NOSENDCHANGING = 0x0400
+
+# Toolhelp fuer Kindprozesse
+TH32CS_SNAPPROCESS = 0x00000002
+
+CreateToolhelp32Snapshot = kernel32.CreateToolhelp32Snapshot
+CreateToolhelp32Snapshot.argtypes = [DWORD, DWORD]
+CreateToolhelp32Snapshot.restype  = wintypes.HANDLE
+
+ULONG_PTR = ctypes.c_ulonglong if ctypes.sizeof(ctypes.c_void_p) == 8 else ctypes.c_ulong
+
+class PROCESSENTRY32(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", DWORD),
+        ("cntUsage", DWORD),
+        ("th32ProcessID", DWORD),
+        ("th32DefaultHeapID", ULONG_PTR),
+        ("th32ModuleID", DWORD),
+        ("cntThreads", DWORD),
+        ("th32ParentProcessID", DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", DWORD),
+        ("szExeFile", ctypes.c_wchar * 260),
+    ]
+
+Process32FirstW = kernel32.Process32FirstW
+Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32)]
+Process32FirstW.restype  = BOOL
+
+Process32NextW = kernel32.Process32NextW
+Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32)]
+Process32NextW.restype  = BOOL
+
+# WaitForInputIdle kann fehlen
+WaitForInputIdle = _load_user32_attr("WaitForInputIdle")
+if WaitForInputIdle:
+    WaitForInputIdle.argtypes = [wintypes.HANDLE, DWORD]
+    WaitForInputIdle.restype  = DWORD  # 0 OK, 0x102 Timeout
+
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+WAIT_FAILED = 0xFFFFFFFF
+
+# WinEvent Hook, um neue Fenster ohne Dauer-Polling zu bemerken
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, DWORD, HWND, wintypes.LONG, wintypes.LONG, DWORD, DWORD
+)
+
+SetWinEventHook = _load_user32_attr("SetWinEventHook")
+if SetWinEventHook:
+    SetWinEventHook.argtypes = [DWORD, DWORD, wintypes.HMODULE, WINEVENTPROC, DWORD, DWORD, DWORD]
+    SetWinEventHook.restype  = wintypes.HANDLE
+
+UnhookWinEvent = _load_user32_attr("UnhookWinEvent")
+if UnhookWinEvent:
+    UnhookWinEvent.argtypes = [wintypes.HANDLE]
+    UnhookWinEvent.restype  = BOOL
+
+GetMessageW = user32.GetMessageW
+GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), HWND, UINT, UINT]
+GetMessageW.restype  = BOOL
+
+TranslateMessage = user32.TranslateMessage
+TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+TranslateMessage.restype  = BOOL
+
+DispatchMessageW = user32.DispatchMessageW
+DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+DispatchMessageW.restype  = LRESULT
+
+PostThreadMessageW = user32.PostThreadMessageW
+PostThreadMessageW.argtypes = [DWORD, UINT, WPARAM, LPARAM]
+PostThreadMessageW.restype  = BOOL
+
+GetCurrentThreadId = kernel32.GetCurrentThreadId
+GetCurrentThreadId.argtypes = []
+GetCurrentThreadId.restype  = DWORD
+
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_SHOW = 0x8002
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WM_QUIT = 0x0012
+
+# NtQuerySystemInformation liefert alle Prozesse in einem Puffer
+class UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ("Length", wintypes.USHORT),
+        ("MaximumLength", wintypes.USHORT),
+        ("Buffer", ctypes.c_void_p),
+    ]
+
+
+class SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    # Nur der Kopf bis zur Eltern PID, der Rest wird ueber NextEntryOffset uebersprungen
+    _fields_ = [
+        ("NextEntryOffset", wintypes.ULONG),
+        ("NumberOfThreads", wintypes.ULONG),
+        ("WorkingSetPrivateSize", ctypes.c_longlong),
+        ("HardFaultCount", wintypes.ULONG),
+        ("NumberOfThreadsHighWatermark", wintypes.ULONG),
+        ("CycleTime", ctypes.c_ulonglong),
+        ("CreateTime", ctypes.c_longlong),
+        ("UserTime", ctypes.c_longlong),
+        ("KernelTime", ctypes.c_longlong),
+        ("ImageName", UNICODE_STRING),
+        ("BasePriority", wintypes.LONG),
+        ("UniqueProcessId", ctypes.c_void_p),
+        ("InheritedFromUniqueProcessId", ctypes.c_void_p),
+    ]
+
+
+def _load_ntdll_attr(name: str):
+    try:
+        return getattr(ctypes.windll.ntdll, name)  # type: ignore[attr-defined]
+    except Exception:
+        return None
+
+
+NtQuerySystemInformation = _load_ntdll_attr("NtQuerySystemInformation")
+if NtQuerySystemInformation:
+    NtQuerySystemInformation.argtypes = [wintypes.ULONG, ctypes.c_void_p, wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)]
+    NtQuerySystemInformation.restype  = wintypes.LONG
+
+SystemProcessInformation = 5
+STATUS_INFO_LENGTH_MISMATCH = -0x3FFFFFFC  # 0xC0000004 als NTSTATUS
+_NTQ_INITIAL_SIZE = 0x80000
+
+# ================= Prozesse abfragen =================
+
+_ExeLoader = Callable[[], Dict[int, str]]
+
+
+def _ntquery_buffer():
+    size = _NTQ_INITIAL_SIZE
+    ret_len = wintypes.ULONG(0)
+    for _ in range(6):
+        buf = ctypes.create_string_buffer(size)
+        status = int(NtQuerySystemInformation(SystemProcessInformation, buf, size, ctypes.byref(ret_len)))
+        if status == STATUS_INFO_LENGTH_MISMATCH:
+            # Prozessliste kann zwischen den Aufrufen wachsen, daher Reserve
+            size = max(size * 2, int(ret_len.value) + 0x10000)
+            continue
+        if status < 0:
+            return None
+        return buf
+    return None
+
+
+def _ntquery_entries(buf):
+    offset = 0
+    while True:
+        info = SYSTEM_PROCESS_INFORMATION.from_buffer(buf, offset)
+        yield info
+        step = int(info.NextEntryOffset)
+        if not step:
+            return
+        offset += step
+
+
+def _snapshot_ntquery() -> Optional[tuple[Dict[int, int], Dict[int, List[int]], _ExeLoader]]:
+    """Gesamte Prozessliste mit einem Kernel Aufruf; None wenn nicht verfuegbar."""
+    if NtQuerySystemInformation is None:
+        return None
+    buf = _ntquery_buffer()
+    if buf is None:
+        return None
+
+    parent_map: Dict[int, int] = {}
+    children_map: Dict[int, List[int]] = defaultdict(list)
+    for info in _ntquery_entries(buf):
+        pid = int(info.UniqueProcessId or 0)
+        ppid = int(info.InheritedFromUniqueProcessId or 0)
+        parent_map[pid] = ppid
+        if pid != ppid:
+            children_map[ppid].append(pid)
+
+    def load_exes() -> Dict[int, str]:
+        # Namen erst bei Bedarf aus dem gehaltenen Puffer dekodieren
+        exe_map: Dict[int, str] = {}
+        for info in _ntquery_entries(buf):
+            name_len = int(info.ImageName.Length) // 2
+            name = ctypes.wstring_at(info.ImageName.Buffer, name_len) if info.ImageName.Buffer and name_len else ""
+            exe_map[int(info.UniqueProcessId or 0)] = name
+        return exe_map
+
+    return parent_map, children_map, load_exes
+
+
+def _snapshot_toolhelp() -> tuple[Dict[int, int], Dict[int, List[int]], _ExeLoader]:
+    hSnap = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if int(hSnap) == -1 or hSnap is None:
+        return {}, {}, dict
+
+    parent_map: Dict[int, int] = {}
+    exe_map: Dict[int, str] = {}
+    # Kinder je Elternprozess, im selben Durchlauf aufgebaut
+    children_map: Dict[int, List[int]] = defaultdict(list)
+
+    try:
+        entry = PROCESSENTRY32()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32)
+        if Process32FirstW(hSnap, ctypes.byref(entry)):
+            while True:
+                pid = int(entry.th32ProcessID)
+                ppid = int(entry.th32ParentProcessID)
+                parent_map[pid] = ppid
+                # Toolhelp ueberschreibt den Eintrag, Namen muessen hier kopiert werden
+                exe_map[pid] = entry.szExeFile
+                if pid != ppid:
+                    children_map[ppid].append(pid)
+                if not Process32NextW(hSnap, ctypes.byref(entry)):
+                    break
+    finally:
+        kernel32.CloseHandle(hSnap)
+
+    return parent_map, children_map, lambda: exe_map
+
+
+def _snapshot_raw() -> tuple[Dict[int, int], Dict[int, List[int]], _ExeLoader]:
+    try:
+        data = _snapshot_ntquery()
+    except Exception:
+        data = None
+    if data is not None:
+        return data
+    return _snapshot_toolhelp()
+
+
+def snapshot_processes() -> tuple[Dict[int, int], Dict[int, str], Dict[int, List[int]]]:
+    parent_map, children_map, load_exes = _snapshot_raw()
+    return parent_map, load_exes(), children_map
+
+
+# Obergrenze gegen ausufernde oder durch PID Wiederverwendung verfaelschte Baeume
+PID_TREE_MAX = 512
+
+
+def collect_pid_tree(root_pid: int,
+                     children_map: Dict[int, List[int]],
+                     limit: int = PID_TREE_MAX) -> Set[int]:
+    """Root PID plus Nachfahren in Breitensuche; linear ueber children_map, hoechstens limit PIDs."""
+    result: Set[int] = {root_pid}
+    queue = deque((root_pid,))
+    while queue and len(result) < limit:
+        p = queue.popleft()
+        for child in children_map.get(p, ()):
+            # visited Pruefung schuetzt vor Zyklen durch PID Wiederverwendung
+            if child not in result:
+                result.add(child)
+                if len(result) >= limit:
+                    break
+                queue.append(child)
+    return result
+
+# Kurzlebiger Cache, damit Suchschleife und Heartbeat nicht jeden Tick einen
+# kompletten Snapshot ziehen. Baum und EXE Namen werden getrennt memoisiert,
+# die Namen nur dekodiert, wenn jemand sie braucht.
+_SNAP_MAX_AGE = 0.5
+_SNAP_CACHE: Dict[str, object] = {"t": 0.0, "tree": None, "exes": None, "load_exes": None, "version": 0}
+_SNAP_LOCK = Lock()
+
+
+def _refresh_locked(max_age: float) -> None:
+    now = time.monotonic()
+    if _SNAP_CACHE["tree"] is not None and now - float(_SNAP_CACHE["t"]) < max_age:  # type: ignore[arg-type]
+        return
+    parent_map, children_map, load_exes = _snapshot_raw()
+    _SNAP_CACHE["t"] = now
+    _SNAP_CACHE["tree"] = (parent_map, children_map)
+    _SNAP_CACHE["exes"] = None
+    _SNAP_CACHE["load_exes"] = load_exes
+    _SNAP_CACHE["version"] = int(_SNAP_CACHE["version"]) + 1  # type: ignore[arg-type]
+
+
+def snapshot_parents(max_age: float = _SNAP_MAX_AGE) -> tuple[int, Dict[int, int], Dict[int, List[int]]]:
+    """(version, parent_map, children_map); version steigt bei jedem frischen Snapshot."""
+    with _SNAP_LOCK:
+        _refresh_locked(max_age)
+        parent_map, children_map = _SNAP_CACHE["tree"]  # type: ignore[misc]
+        return int(_SNAP_CACHE["version"]), parent_map, children_map  # type: ignore[arg-type]
+
+
+def _exes_locked() -> Dict[int, str]:
+    exe_map = _SNAP_CACHE["exes"]
+    if exe_map is None:
+        exe_map = _SNAP_CACHE["load_exes"]()  # type: ignore[operator]
+        _SNAP_CACHE["exes"] = exe_map
+        # Rohpuffer wird nicht mehr gebraucht
+        _SNAP_CACHE["load_exes"] = None
+    return exe_map  # type: ignore[return-value]
+
+
+def snapshot_exes(max_age: float = _SNAP_MAX_AGE) -> Dict[int, str]:
+    with _SNAP_LOCK:
+        _refresh_locked(max_age)
+        return _exes_locked()
+
+
+def snapshot_processes_cached(
+    max_age: float = _SNAP_MAX_AGE,
+) -> tuple[Dict[int, int], Dict[int, str], Dict[int, List[int]]]:
+    # Ein Lock fuer alles, sonst koennen Baum und EXE Namen aus zwei Snapshots stammen
+    with _SNAP_LOCK:
+        _refresh_locked(max_age)
+        parent_map, children_map = _SNAP_CACHE["tree"]  # type: ignore[misc]
+        return parent_map, _exes_locked(), children_map
+
+
+def invalidate_process_snapshot() -> None:
+    with _SNAP_LOCK:
+        _SNAP_CACHE["t"] = 0.0
+        _SNAP_CACHE["tree"] = None
+        _SNAP_CACHE["exes"] = None
+        _SNAP_CACHE["load_exes"] = None
+
+# ================= Fenstertexte =================
+
+# Scratch Puffer je Thread; GetWindowTextW/GetClassNameW schreiben synchron hinein
+_TEXT_SCRATCH = threading.local()
+
+
+def _scratch_buffers():
+    bufs = getattr(_TEXT_SCRATCH, "bufs", None)
+    if bufs is None:
+        bufs = (ctypes.create_unicode_buffer(512), ctypes.create_unicode_buffer(256))
+        _TEXT_SCRATCH.bufs = bufs
+    return bufs
+
+
+def window_text(hwnd) -> str:
+    tbuf = _scratch_buffers()[0]
+    GetWindowTextW(hwnd, tbuf, 512)
+    return tbuf.value or ""
+
+
+def class_name(hwnd) -> str:
+    cbuf = _scratch_buffers()[1]
+    GetClassNameW(hwnd, cbuf, 256)
+    return cbuf.value or ""
@@ -9,9 +9,11 @@ import time
 import re
 import shlex
 import os
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from threading import Thread, Event
-from typing import Optional, Set, Dict, List
+from typing import Callable, Optional, Set, Dict, List, Tuple
 
 from modules.qt import Qt, QtCore, QtGui, QtWidgets, Signal
 
@@ -26,212 +28,296 @@ from modules.utils.logger import get_logger
 
 # ================= Win32 Binding =================
 
-def _load_user32_attr(name: str):
+from modules.services._win32 import (
+    HWND, DWORD, LPARAM, LONG_PTR, WPARAM, EnumWindowsProc, GetWindowThreadProcessId,
+    EnumWindows, EnumChildWindows, IsWindow, IsWindowVisible,
+    ShowWindow, SW_SHOWNOACTIVATE, SW_RESTORE,
+    MoveWindow, SendMessageW, RedrawWindow, WM_SIZE, WM_SETREDRAW, SIZE_RESTORED,
+    RDW_INVALIDATE, RDW_ALLCHILDREN, RDW_UPDATENOW, RDW_NOFRAME, GetWindowLongPtrW,
+    SetWindowLongPtrW, SetWindowPos, SetParent, GWL_STYLE, WS_CHILD, WS_POPUP,
+    WS_CAPTION, WS_THICKFRAME, WS_MINIMIZEBOX, WS_MAXIMIZEBOX, WS_CLIPSIBLINGS,
+    WS_CLIPCHILDREN, SWP_NOSIZE, SWP_NOMOVE, SWP_NOZORDER, SWP_NOOWNERZORDER,
+    SWP_NOACTIVATE, SWP_FRAMECHANGED, SWP_ASYNCWINDOWPOS, SWP_NOSENDCHANGING,
+    WaitForInputIdle, WAIT_OBJECT_0, WAIT_TIMEOUT, WAIT_FAILED, WINEVENTPROC, SetWinEventHook,
+    UnhookWinEvent, GetMessageW, TranslateMessage, DispatchMessageW, PostThreadMessageW,
+    GetCurrentThreadId, EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, WINEVENT_OUTOFCONTEXT,
+    WINEVENT_SKIPOWNPROCESS, OBJID_WINDOW, CHILDID_SELF, WM_QUIT, collect_pid_tree,
+    snapshot_parents, snapshot_exes, window_text, class_name,
+    invalidate_process_snapshot,
+)
+
+# ================= Fenster Enumeration =================
+
+# (score, hwnd, pid, title, class)
+_Candidate = Tuple[int, int, int, str, str]
+
+# Gewichte fuer die Kandidatenwahl
+_SCORE_CLASS = 5
+_SCORE_EXE = 20
+
+
+class _EnumContext:
+    __slots__ = ("own_pids", "global_scope", "title_search", "class_search", "exe_ok",
+                 "own_needs_exe", "stop_on_own", "best_own", "best_global", "pid_buf", "pid_ref")
+
+    def __init__(self, own_pids, global_scope, title_rx, class_rx, exe_ok, stop_on_own):
+        self.own_pids = own_pids
+        self.global_scope = global_scope
+        # Gebundene Methoden vorab aufloesen, der Callback laeuft pro Fenster
+        self.title_search = title_rx.search if title_rx else None
+        self.class_search = class_rx.search if class_rx else None
+        self.exe_ok = exe_ok
+        # Ohne Titel/Klassen Filter ist die EXE auch im eigenen Baum das einzige Kriterium
+        self.own_needs_exe = not _narrows(title_rx) and not _narrows(class_rx)
+        # Ein PID Ausgabepuffer je Sweep statt DWORD + byref pro Fenster
+        self.pid_buf = DWORD(0)
+        self.pid_ref = ctypes.byref(self.pid_buf)
+        self.stop_on_own = stop_on_own
+        self.best_own: Optional[_Candidate] = None
+        self.best_global: Optional[_Candidate] = None
+
+
+# Muster, die jeden Text treffen (".*" ist der Default fuer window_title_pattern)
+_MATCH_ALL_PATTERNS = frozenset({".*", "^.*", "^.*$"})
+
+
+def _narrows(matcher: Optional[_TextMatcher]) -> bool:
+    return matcher is not None and matcher.pattern not in _MATCH_ALL_PATTERNS
+
+
+# Zustand des laufenden Sweeps; EnumWindows ruft synchron im selben Thread zurueck
+_ENUM_STATE = threading.local()
+
+
+def _enum_cb(hwnd, _lparam):
+    ctx: Optional[_EnumContext] = getattr(_ENUM_STATE, "ctx", None)
+    if ctx is None or not hwnd:
+        return ctx is not None
+    # HWND kommt ueber WINFUNCTYPE bereits als Python int an
     try:
-        return getattr(ctypes.windll.user32, name)  # type: ignore[attr-defined]
-    except Exception:
-        return None
+        # EnumWindows liefert nur Top-Level Fenster, keine Root Pruefung noetig
+        if not IsWindowVisible(hwnd):
+            return True
 
-def _load_kernel32_attr(name: str):
-    try:
-        return getattr(ctypes.windll.kernel32, name)  # type: ignore[attr-defined]
+        GetWindowThreadProcessId(hwnd, ctx.pid_ref)
+        pid = ctx.pid_buf.value
+        own = pid in ctx.own_pids
+        if not own and not ctx.global_scope:
+            return True
+
+        # EXE Plausibilitaet: ausserhalb des eigenen Prozessbaums Pflicht, innerhalb nur
+        # Bonus, wenn Titel oder Klasse das Fenster eingrenzen
+        exe_hit = ctx.exe_ok(pid)
+        if not exe_hit and (not own or ctx.own_needs_exe):
+            return True
+
+        title = window_text(hwnd)
+        # Titel zuerst pruefen, Klasse nur fuer verbleibende Kandidaten abfragen
+        title_search = ctx.title_search
+        if title_search is not None and not title_search(title):
+            return True
+
+        cls = class_name(hwnd)
+        class_search = ctx.class_search
+        if class_search is not None and not class_search(cls):
+            return True
+
+        score = len(title) + (_SCORE_CLASS if cls else 0) + (_SCORE_EXE if exe_hit else 0)
+        if own:
+            best = ctx.best_own
+            if best is None or score > best[0]:
+                ctx.best_own = (score, hwnd, pid, title, cls)
+            # Sicherer Treffer im eigenen Prozessbaum: Rest der Fensterliste nicht mehr ansehen
+            if ctx.stop_on_own and title and exe_hit:
+                return False
+        else:
+            best = ctx.best_global
+            if best is None or score > best[0]:
+                ctx.best_global = (score, hwnd, pid, title, cls)
     except Exception:
-        return None
+        pass
+    return True
+
+
+# Ein einziges Trampolin fuer alle Sweeps statt WINFUNCTYPE pro Aufruf
+_ENUM_PROC = EnumWindowsProc(_enum_cb)
 
-user32 = ctypes.windll.user32   # type: ignore[attr-defined]
-kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-
-HWND   = wintypes.HWND
-DWORD  = wintypes.DWORD
-BOOL   = wintypes.BOOL
-LPARAM = wintypes.LPARAM
-UINT   = wintypes.UINT
-
-# LONG_PTR und LRESULT kompatibel fuer Python 3.13
-if ctypes.sizeof(ctypes.c_void_p) == 8:
-    _LONG_PTR_T = ctypes.c_longlong
-else:
-    _LONG_PTR_T = ctypes.c_long
-LONG_PTR = _LONG_PTR_T
-
-WPARAM = wintypes.WPARAM
-try:
-    LRESULT = wintypes.LRESULT  # type: ignore[attr-defined]
-except AttributeError:
-    LRESULT = LONG_PTR
-
-EnumWindowsProc = ctypes.WINFUNCTYPE(BOOL, HWND, LPARAM)
-
-GetWindowThreadProcessId = user32.GetWindowThreadProcessId
-GetWindowThreadProcessId.argtypes = [HWND, ctypes.POINTER(DWORD)]
-GetWindowThreadProcessId.restype  = DWORD
-
-EnumWindows = user32.EnumWindows
-EnumWindows.argtypes = [EnumWindowsProc, LPARAM]
-EnumWindows.restype  = BOOL
-
-EnumChildWindows = user32.EnumChildWindows
-EnumChildWindows.argtypes = [HWND, EnumWindowsProc, LPARAM]
-EnumChildWindows.restype  = BOOL
-
-IsWindow = user32.IsWindow
-IsWindow.argtypes = [HWND]
-IsWindow.restype  = BOOL
-
-IsWindowVisible = user32.IsWindowVisible
-IsWindowVisible.argtypes = [HWND]
-IsWindowVisible.restype  = BOOL
-
-GetClassNameW = user32.GetClassNameW
-GetClassNameW.argtypes = [HWND, ctypes.c_wchar_p, ctypes.c_int]
-GetClassNameW.restype  = ctypes.c_int
-
-GetWindowTextW = user32.GetWindowTextW
-GetWindowTextW.argtypes = [HWND, ctypes.c_wchar_p, ctypes.c_int]
-GetWindowTextW.restype  = ctypes.c_int
-
-GetAncestor = user32.GetAncestor
-GetAncestor.argtypes = [HWND, UINT]
-GetAncestor.restype  = HWND
-GA_ROOT = 2
-
-ShowWindow = user32.ShowWindow
-ShowWindow.argtypes = [HWND, ctypes.c_int]
-ShowWindow.restype  = BOOL
-SW_SHOW = 5
-SW_SHOWNOACTIVATE = 4
-SW_RESTORE = 9
-
-MoveWindow = user32.MoveWindow
-MoveWindow.argtypes = [HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, BOOL]
-MoveWindow.restype  = BOOL
-
-SendMessageW = user32.SendMessageW
-SendMessageW.argtypes = [HWND, UINT, WPARAM, LPARAM]
-SendMessageW.restype  = LRESULT
-
-PostMessageW = user32.PostMessageW
-PostMessageW.argtypes = [HWND, UINT, WPARAM, LPARAM]
-PostMessageW.restype  = BOOL
-
-RedrawWindow = user32.RedrawWindow
-RedrawWindow.argtypes = [HWND, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint]
-RedrawWindow.restype  = BOOL
-
-WM_SIZE = 0x0005
-WM_WINDOWPOSCHANGING = 0x0046
-WM_WINDOWPOSCHANGED  = 0x0047
-WM_SETREDRAW = 0x000B
-SIZE_RESTORED = 0
-
-RDW_INVALIDATE   = 0x0001
-RDW_ERASE        = 0x0004
-RDW_ALLCHILDREN  = 0x0080
-RDW_UPDATENOW    = 0x0100
-RDW_NOFRAME      = 0x0800
-
-GetWindowLongPtrW = user32.GetWindowLongPtrW
-GetWindowLongPtrW.argtypes = [HWND, ctypes.c_int]
-GetWindowLongPtrW.restype  = LONG_PTR
-
-SetWindowLongPtrW = user32.SetWindowLongPtrW
-SetWindowLongPtrW.argtypes = [HWND, ctypes.c_int, LONG_PTR]
-SetWindowLongPtrW.restype  = LONG_PTR
-
-SetWindowPos = user32.SetWindowPos
-SetWindowPos.argtypes = [HWND, HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_uint]
-SetWindowPos.restype  = BOOL
-
-SetParent = user32.SetParent
-SetParent.argtypes = [HWND, HWND]
-SetParent.restype = HWND
-
-GWL_STYLE = -16
-WS_CHILD = 0x40000000
-WS_POPUP = 0x80000000
-WS_CAPTION = 0x00C00000
-WS_THICKFRAME = 0x00040000
-WS_MINIMIZEBOX = 0x00020000
-WS_MAXIMIZEBOX = 0x00010000
-WS_CLIPSIBLINGS = 0x04000000
-WS_CLIPCHILDREN = 0x02000000
-
-SWP_NOSIZE = 0x0001
-SWP_NOMOVE = 0x0002
-SWP_NOZORDER = 0x0004
-SWP_NOOWNERZORDER = 0x0200
-SWP_NOACTIVATE = 0x0010
-SWP_FRAMECHANGED = 0x0020
-SWP_ASYNCWINDOWPOS = 0x4000
-SWP_NOSENDCHANGING = 0x0400
-
-# Toolhelp fuer Kindprozesse
-TH32CS_SNAPPROCESS = 0x00000002
-
-CreateToolhelp32Snapshot = kernel32.CreateToolhelp32Snapshot
-CreateToolhelp32Snapshot.argtypes = [DWORD, DWORD]
-CreateToolhelp32Snapshot.restype  = wintypes.HANDLE
-
-ULONG_PTR = ctypes.c_ulonglong if ctypes.sizeof(ctypes.c_void_p) == 8 else ctypes.c_ulong
-
-class PROCESSENTRY32(ctypes.Structure):
-    _fields_ = [
-        ("dwSize", DWORD),
-        ("cntUsage", DWORD),
-        ("th32ProcessID", DWORD),
-        ("th32DefaultHeapID", ULONG_PTR),
-        ("th32ModuleID", DWORD),
-        ("cntThreads", DWORD),
-        ("th32ParentProcessID", DWORD),
-        ("pcPriClassBase", ctypes.c_long),
-        ("dwFlags", DWORD),
-        ("szExeFile", ctypes.c_wchar * 260),
-    ]
-
-Process32FirstW = kernel32.Process32FirstW
-Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32)]
-Process32FirstW.restype  = BOOL
-
-Process32NextW = kernel32.Process32NextW
-Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32)]
-Process32NextW.restype  = BOOL
-
-# WaitForInputIdle kann fehlen
-_WaitForInputIdle = _load_user32_attr("WaitForInputIdle")
-if _WaitForInputIdle:
-    _WaitForInputIdle.argtypes = [wintypes.HANDLE, DWORD]
-    _WaitForInputIdle.restype  = DWORD  # 0 OK, 0x102 Timeout
-
-# ================= Prozesse abfragen =================
-
-def snapshot_processes() -> tuple[Dict[int, int], Dict[int, str]]:
-    hSnap = CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
-    if int(hSnap) == -1 or hSnap is None:
-        return {}, {}
-
-    parent_map: Dict[int, int] = {}
-    exe_map: Dict[int, str] = {}
 
+def enum_best_windows(own_pids: Set[int],
+                      global_scope: bool,
+                      title_rx: Optional[_TextMatcher],
+                      class_rx: Optional[_TextMatcher],
+                      exe_ok: Callable[[int], bool],
+                      stop_on_own: bool = False) -> Tuple[Optional[_Candidate], Optional[_Candidate]]:
+    """
+    Bester sichtbarer Top-Level Kandidat aus dem eigenen Prozessbaum und, bei global_scope,
+    bester fremder Kandidat mit passender EXE. Ein Durchlauf, Maximum laeuft im Callback mit.
+    stop_on_own beendet die Enumeration beim ersten betitelten EXE Treffer im eigenen Baum.
+    """
+    ctx = _EnumContext(own_pids, global_scope, title_rx, class_rx, exe_ok, stop_on_own)
+    prev = getattr(_ENUM_STATE, "ctx", None)
+    _ENUM_STATE.ctx = ctx
     try:
-        entry = PROCESSENTRY32()
-        entry.dwSize = ctypes.sizeof(PROCESSENTRY32)
-        if not Process32FirstW(hSnap, ctypes.byref(entry)):
-            return parent_map, exe_map
-        while True:
-            pid = int(entry.th32ProcessID)
-            ppid = int(entry.th32ParentProcessID)
-            name = entry.szExeFile
-            parent_map[pid] = ppid
-            exe_map[pid] = name
-            if not Process32NextW(hSnap, ctypes.byref(entry)):
-                break
+        EnumWindows(_ENUM_PROC, 0)
     finally:
-        kernel32.CloseHandle(hSnap)
+        _ENUM_STATE.ctx = prev
+    return ctx.best_own, ctx.best_global
+
 
-    return parent_map, exe_map
+class _WinEventHub:
+    """
+    Ein gemeinsamer WinEvent Hook fuer alle Widgets. OUTOFCONTEXT Hooks werden nur im
+    registrierenden Thread zugestellt, daher ein Thread mit Message Pump, der jedes
+    angemeldete Abo weckt. Der Thread laeuft nur, solange es Abonnenten gibt.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subs: Tuple["_WindowShowWatcher", ...] = ()
+        self._stop: Optional[Event] = None    # Stopp-Signal des aktuellen Pump Threads
+        self._hooked: Optional[Event] = None  # Pump Thread mit registriertem Hook
+        self._tid = 0
+
+    @property
+    def active(self) -> bool:
+        hooked = self._hooked
+        return hooked is not None and hooked is self._stop
+
+    def subscribe(self, watcher: "_WindowShowWatcher") -> bool:
+        if SetWinEventHook is None or UnhookWinEvent is None:
+            return False
+        with self._lock:
+            self._subs = self._subs + (watcher,)
+            if self._stop is None:
+                # Nicht auf den Hook warten, bis dahin sweept die Suche wie ohne Events
+                self._stop = Event()
+                Thread(target=self._pump, args=(self._stop,),
+                       name="LocalAppWinEvents", daemon=True).start()
+        return True
+
+    def unsubscribe(self, watcher: "_WindowShowWatcher"):
+        with self._lock:
+            self._subs = tuple(w for w in self._subs if w is not watcher)
+            if self._subs or self._stop is None:
+                return
+            self._stop.set()
+            self._stop = None
+            tid, self._tid = self._tid, 0
+        if tid:
+            try:
+                PostThreadMessageW(tid, WM_QUIT, 0, 0)
+            except Exception:
+                pass
+
+    def _pump(self, stop: Event):
+        def _on_event(_hook, _event, hwnd, id_object, id_child, _thread_id, _time):
+            # Nur ganze Fenster, keine Controls oder Carets
+            if hwnd and id_object == OBJID_WINDOW and id_child == CHILDID_SELF:
+                for watcher in self._subs:
+                    watcher.wake.set()
+
+        proc = WINEVENTPROC(_on_event)  # Referenz halten, sonst sammelt der GC den Callback ein
+        try:
+            hook = SetWinEventHook(
+                EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, None, proc,
+                0, 0, WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,
+            )
+        except Exception:
+            hook = None
+        if not hook:
+            return
+
+        try:
+            # SetWinEventHook legt die Message Queue an; ab hier kommt WM_QUIT sicher an
+            with self._lock:
+                if stop.is_set():
+                    return
+                self._tid = int(GetCurrentThreadId())
+                self._hooked = stop
+            msg = wintypes.MSG()
+            while GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                TranslateMessage(ctypes.byref(msg))
+                DispatchMessageW(ctypes.byref(msg))
+        finally:
+            UnhookWinEvent(hook)
+            with self._lock:
+                if self._hooked is stop:
+                    self._hooked = None
+
+
+_WIN_EVENTS = _WinEventHub()
+
+
+class _WindowShowWatcher:
+    """
+    Abo eines Widgets am gemeinsamen WinEvent Hook; weckt die Fenstersuche,
+    sobald irgendwo ein Fenster erzeugt oder sichtbar wird.
+    """
+
+    def __init__(self):
+        self.wake = Event()
+
+    @property
+    def active(self) -> bool:
+        return _WIN_EVENTS.active
+
+    def start(self) -> bool:
+        return _WIN_EVENTS.subscribe(self)
+
+    def stop(self):
+        self.wake.set()
+        _WIN_EVENTS.unsubscribe(self)
+
+    def consume(self) -> bool:
+        hit = self.wake.is_set()
+        if hit:
+            self.wake.clear()
+        return hit
 
 # ================= Hilfen =================
 
+# re.escape maskiert auch Leerzeichen, daher eigene Pruefung auf Metazeichen
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+
+class _TextMatcher:
+    """
+    Case-insensitiver Filter fuer Titel und Klassen.
+    Literale Muster laufen ueber casefold + in, nur echte Regex nutzen die Engine.
+    """
+
+    __slots__ = ("pattern", "_needle", "_rx")
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        if not (_REGEX_META & set(pattern)):
+            self._needle: Optional[str] = pattern.casefold()
+            self._rx = None
+        else:
+            self._needle = None
+            self._rx = re.compile(pattern, re.I)
+
+    def search(self, text: str) -> bool:
+        if self._needle is not None:
+            return self._needle in text.casefold()
+        return self._rx.search(text) is not None  # type: ignore[union-attr]
+
+
+# Timer Takt der Einbettungs-Zustandsmaschine
+_POLL_INTERVAL_MS = 150
+# Voll-Sweep Intervall, wenn der WinEvent Hook aktiv ist
+_EVENT_FALLBACK_SWEEP_S = 1.5
+_INPUT_IDLE_TIMEOUT_S = 2.0
+_LAUNCH_GRACE_S = 0.6
+_SEARCH_TIMEOUT_S = 30.0
+
+def _strip_quotes(token: str) -> str:
+    if len(token) >= 2 and token[0] == token[-1] == '"':
+        return token[1:-1]
+    return token
+
+
+@lru_cache(maxsize=128)
 def _expected_exe_from_cmd(cmd: str) -> str:
     # Pfad bereinigen und nur Dateiname nehmen
     c = (cmd or "").strip().strip('"')
@@ -239,7 +325,7 @@ def _expected_exe_from_cmd(cmd: str) -> str:
 
 # ================= Datenmodell =================
 
-@dataclass
+@dataclass(slots=True)
 class LocalAppSpec:
     launch_cmd: str
     args: Optional[str] = ""                  # Parameter fuer EXE Start
@@ -289,31 +375,64 @@ class LocalAppWidget(QWidget):
         self._embedded_hwnd: Optional[int] = None
 
         self._stop_evt = Event()
-        self._worker: Optional[Thread] = None
-        self._starting = False
+        # Ablauf ohne eigenen Thread: idle -> wait_idle -> searching -> embedded
+        self._phase = "idle"
+        self._phase_t0 = 0.0
+        self._search_deadline = 0.0
+        self._last_sweep = 0.0
+        self._last_search_log = 0.0
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(_POLL_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self._poll_step)
 
         self._resize_timer = QTimer(self)
         self._resize_timer.setInterval(120)
         self._resize_timer.setSingleShot(True)
         self._resize_timer.timeout.connect(self._apply_resize)
+        # (hwnd, w, h) der letzten an das Fenster geschickten Groesse
+        self._last_applied: Optional[Tuple[Optional[int], int, int]] = None
+
+        self._win_watcher: Optional[_WindowShowWatcher] = None
+        # Signalisiert das Prozessende ueber das Prozesshandle (nur Windows Qt)
+        self._exit_notifier = None
+        # Einmal kompilierte Titel/Klassen Filter je Muster
+        self._matchers: Dict[str, _TextMatcher] = {}
+        # (snapshot_version, root_pid) -> pid_set der letzten Suche
+        self._pid_set_cache: Optional[Tuple[Tuple[int, int], Set[int]]] = None
 
         self._last_find_attempt_ms = 0
         self._reattach_cooldown_ms = 800
 
+        # Mindestabstand zwischen zwei Starts, sonst startet eine sofort endende App in Schleife
+        self._last_start_t = 0.0
+        self._restart_cooldown_s = 5.0
+        self._restart_pending = False
+
         # Erwartete EXE zur Plausibilitaet
         self._expected_exe: str = _expected_exe_from_cmd(getattr(self.spec, "launch_cmd", ""))
 
     # ---------- API ----------
     def start(self):
-        if self._starting or (self._worker and self._worker.is_alive()):
+        if self._phase != "idle":
             return
-        self._starting = True
         self._stop_evt.clear()
-        self._worker = Thread(target=self._run, name="LocalAppEmbedder", daemon=True)
-        self._worker.start()
+        invalidate_process_snapshot()
+        self._last_start_t = time.monotonic()
+        try:
+            self._launch_process()
+        except Exception:
+            self.log.error("Fehler im LocalApp Embedder", exc_info=True, extra={"source": "local"})
+            return
+        self._set_phase("wait_idle")
+        self._poll_timer.start()
 
     def stop(self):
         self._stop_evt.set()
+        self._poll_timer.stop()
+        self._stop_watcher()
+        # Vor terminate abkoppeln, sonst loest das Prozessende einen Neustart aus
+        self._disarm_exit_notifier()
+        self._phase = "idle"
         self._detach_ui()
         try:
             if self._proc and self._proc.poll() is None:
@@ -328,32 +447,30 @@ class LocalAppWidget(QWidget):
         self._proc = None
         self._pid = None
         self._embedded_hwnd = None
-        self._starting = False
 
     def heartbeat(self):
-        if self._proc and self._proc.poll() is not None:
-            self.log.warning("Prozess ist beendet, starte neu", extra={"source": "local"})
-            self._proc = None
-            self._pid = None
-            self._embedded_hwnd = None
-            self._detach_ui()
-            if not self._starting:
-                self.start()
+        # Mit Exit Notifier meldet sich das Prozessende selbst, poll() entfaellt
+        if self._proc and self._exit_notifier is None and self._proc.poll() is not None:
+            self._restart_after_exit()
             return
 
         if self._embedded_hwnd and not bool(IsWindow(HWND(self._embedded_hwnd))):
             self.log.warning("Fenster verloren, versuche Reattach", extra={"source": "local"})
             self._embedded_hwnd = None
+            self._phase = "idle"
             self._detach_ui()
 
-        if self._proc and self._proc.poll() is None and not self._embedded_hwnd:
+        if self._proc and self._phase == "idle" and not self._embedded_hwnd:
             now = int(time.time() * 1000)
             if now - self._last_find_attempt_ms >= self._reattach_cooldown_ms:
                 self._last_find_attempt_ms = now
-                self._find_and_embed(timeout_s=1.0)
+                # Kurze Nachsuche, laeuft ueber den Timer statt den GUI Thread zu blockieren
+                self._begin_search(timeout_s=1.0)
 
     def force_attach(self, hwnd: int):
         self.log.info(f"manuelles Attach auf hwnd={hwnd}", extra={"source": "local"})
+        self._set_phase("embedded")
+        self._end_search()
         self._embed_hwnd(hwnd)
 
     def force_fit(self):
@@ -368,25 +485,18 @@ class LocalAppWidget(QWidget):
         super().showEvent(ev)
         self._resize_timer.start()
 
-    # ---------- Worker ----------
-    def _run(self):
-        try:
-            self._launch_process()
-            self._find_and_embed(timeout_s=30.0)
-        except Exception:
-            self.log.error("Fehler im LocalApp Embedder", exc_info=True, extra={"source": "local"})
-        finally:
-            self._starting = False
-
+    # ---------- Ablauf ----------
     def _launch_process(self):
         cmd_path = (getattr(self.spec, "launch_cmd", "") or "").strip()
         if not cmd_path:
             raise RuntimeError("launch_cmd fehlt")
         args_str = (getattr(self.spec, "args", "") or "").strip()
 
-        argv: List[str] = [cmd_path]
+        # Direkt starten, nie ueber cmd.exe: sonst haengt die PID Zuordnung an der Shell
+        argv: List[str] = [_strip_quotes(cmd_path)]
         if args_str:
-            argv.extend(shlex.split(args_str, posix=False))
+            # posix=False laesst Quotes im Token stehen; Popen quotet selbst erneut
+            argv.extend(_strip_quotes(a) for a in shlex.split(args_str, posix=False))
 
         self.log.info(f"starte: {argv}", extra={"source": "local"})
         flags = 0
@@ -394,73 +504,221 @@ class LocalAppWidget(QWidget):
             flags |= getattr(subprocess, "CREATE_NO_WINDOW", 0)
         self._proc = subprocess.Popen(argv, shell=False, creationflags=flags)  # nosec
         self._pid = int(self._proc.pid)
+        invalidate_process_snapshot()
+        self._arm_exit_notifier()
+
+    def _arm_exit_notifier(self):
+        self._disarm_exit_notifier()
+        notifier_cls = getattr(QtCore, "QWinEventNotifier", None)
+        h = getattr(self._proc, "_handle", None)
+        if notifier_cls is None or h is None:
+            return
+        try:
+            notifier = notifier_cls(int(h), self)
+            notifier.activated.connect(self._on_process_exit)
+            notifier.setEnabled(True)
+        except Exception:
+            self.log.debug("QWinEventNotifier nicht verfuegbar, Heartbeat pollt", extra={"source": "local"})
+            return
+        self._exit_notifier = notifier
+
+    def _disarm_exit_notifier(self):
+        notifier = self._exit_notifier
+        self._exit_notifier = None
+        if notifier is not None:
+            try:
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+            except Exception:
+                pass
+
+    def _on_process_exit(self, *_args):
+        if self._proc is None or self._proc.poll() is None:
+            return
+        self._restart_after_exit()
+
+    def _restart_after_exit(self):
+        self._disarm_exit_notifier()
+        self._poll_timer.stop()
+        self._stop_watcher()
+        self._phase = "idle"
+        self._proc = None
+        self._pid = None
+        self._embedded_hwnd = None
+        self._detach_ui()
 
+        wait_s = self._restart_cooldown_s - (time.monotonic() - self._last_start_t)
+        if wait_s <= 0:
+            self.log.warning("Prozess ist beendet, starte neu", extra={"source": "local"})
+            self.start()
+            return
+        if self._restart_pending:
+            return
+        self.log.warning(
+            "Prozess ist beendet, Neustart in %.1f s", wait_s, extra={"source": "local"}
+        )
+        self._restart_pending = True
+        QTimer.singleShot(int(wait_s * 1000), self._deferred_restart)
+
+    def _deferred_restart(self):
+        self._restart_pending = False
+        # zwischenzeitlich gestoppt oder schon neu gestartet
+        if self._stop_evt.is_set() or self._proc is not None:
+            return
+        self.start()
+
+    def _wait_input_idle(self, timeout_ms: int) -> int:
+        """Ergebnis von WaitForInputIdle; WAIT_FAILED wenn nicht verfuegbar."""
         try:
-            if _WaitForInputIdle is not None:
+            if WaitForInputIdle is not None:
                 h = getattr(self._proc, "_handle", None)
                 if h is not None:
-                    _WaitForInputIdle(wintypes.HANDLE(int(h)), DWORD(2000))
+                    return int(WaitForInputIdle(wintypes.HANDLE(int(h)), DWORD(timeout_ms)))
         except Exception:
             pass
+        return WAIT_FAILED
 
-        t0 = time.time()
-        while time.time() - t0 < 0.6 and self._proc and self._proc.poll() is None:
-            time.sleep(0.05)
+    def _set_phase(self, phase: str):
+        self._phase = phase
+        self._phase_t0 = time.monotonic()
+
+    def _poll_step(self):
+        """Ein Timer Tick: hoechstens ein Fenster Sweep, nie blockierend."""
+        if self._stop_evt.is_set():
+            self._poll_timer.stop()
+            return
+        try:
+            if self._phase == "wait_idle":
+                self._step_wait_idle()
+            elif self._phase == "searching":
+                self._step_search()
+            else:
+                self._poll_timer.stop()
+        except Exception:
+            self.log.error("Fehler im LocalApp Embedder", exc_info=True, extra={"source": "local"})
+            self._end_search()
+
+    def _step_wait_idle(self):
+        proc = self._proc
+        if proc is None:
+            self._end_search()
+            return
+        if proc.poll() is not None:
+            self.log.warning(
+                f"Prozess direkt nach Start beendet, rc={proc.returncode}",
+                extra={"source": "local"},
+            )
+            self._end_search()
+            return
+
+        elapsed = time.monotonic() - self._phase_t0
+        rc = self._wait_input_idle(0)
+        if rc == WAIT_OBJECT_0:
+            # GUI Prozess meldet Startbereitschaft, Gnadenfrist ist ueberfluessig
+            self._begin_search(timeout_s=_SEARCH_TIMEOUT_S)
+        elif rc == WAIT_TIMEOUT and elapsed < _INPUT_IDLE_TIMEOUT_S:
+            return
+        elif elapsed >= _LAUNCH_GRACE_S:
+            # Kein Message Loop oder Timeout: nach kurzer Gnadenfrist trotzdem suchen
+            self._begin_search(timeout_s=_SEARCH_TIMEOUT_S)
+
+    def _begin_search(self, timeout_s: float):
+        self._set_phase("searching")
+        self._search_deadline = time.monotonic() + timeout_s
+        self._last_sweep = 0.0
+        self._last_search_log = 0.0
+        # Lange Suchen lassen sich von WinEvents wecken, kurze Nachsuchen pollen nur
+        if timeout_s > _EVENT_FALLBACK_SWEEP_S and self._win_watcher is None:
+            watcher = _WindowShowWatcher()
+            if watcher.start():
+                self._win_watcher = watcher
+        self._poll_timer.start()
+        self._step_search()
+
+    def _end_search(self):
+        self._poll_timer.stop()
+        self._stop_watcher()
+        if self._phase != "embedded":
+            self._phase = "idle"
+
+    def _stop_watcher(self):
+        watcher = self._win_watcher
+        self._win_watcher = None
+        if watcher is not None:
+            watcher.stop()
+
+    def _step_search(self):
+        if self._proc is not None and self._proc.poll() is not None:
+            self.log.warning("Prozess beendet waehrend der Fenstersuche", extra={"source": "local"})
+            self._end_search()
+            return
+
+        now = time.monotonic()
+        if now >= self._search_deadline:
+            self.log.warning("kein Fenster zum Einbetten gefunden", extra={"source": "local"})
+            self._end_search()
+            return
+
+        watcher = self._win_watcher
+        if watcher is not None and watcher.active and self._last_sweep:
+            # Neues Fenster weckt sofort, sonst seltener Voll-Sweep als Rueckfallebene
+            if not watcher.consume() and now - self._last_sweep < _EVENT_FALLBACK_SWEEP_S:
+                return
+        self._last_sweep = now
 
-    # ---------- Finden und Einbetten ----------
-    def _find_and_embed(self, timeout_s: float):
         title_pat = getattr(self.spec, "window_title_pattern", None)
         class_pat = getattr(self.spec, "window_class_pattern", None)
-        title_rx = re.compile(title_pat, re.I) if title_pat else None
-        class_rx = re.compile(class_pat, re.I) if class_pat else None
+        title_rx = self._matcher(title_pat)
+        class_rx = self._matcher(class_pat)
         follow_children = bool(getattr(self.spec, "follow_children", True))
         allow_global = bool(getattr(self.spec, "allow_global_fallback", False))
+        # Globaler Fallback nur mit Titel oder Klassenfilter
+        use_global = allow_global and bool(title_rx or class_rx)
 
-        t_end = time.time() + timeout_s
-        last_log = 0.0
-
-        while not self._stop_evt.is_set() and time.time() < t_end:
-            pid_set = self._build_pid_set(self._pid) if follow_children else ({self._pid} if self._pid else set())
-            hwnd = self._pick_window(pid_set, title_rx, class_rx)
-
-            if not hwnd and allow_global and (title_rx or class_rx):
-                # Global nur, wenn EXE zur erwarteten EXE passt
-                hwnd = self._pick_window_global(title_rx, class_rx)
+        pid_set = self._build_pid_set(self._pid) if follow_children else ({self._pid} if self._pid else set())
+        hwnd = self._pick_window(pid_set, title_rx, class_rx, allow_global=use_global)
 
-            if hwnd:
-                self._embed_hwnd(hwnd)
-                return
+        if hwnd:
+            self._set_phase("embedded")
+            self._end_search()
+            self._embed_hwnd(hwnd)
+            return
 
-            now = time.time()
-            if now - last_log > 2.5:
-                self.log.info(
-                    f"suche Fenster; pid_set={sorted(list(pid_set))} "
-                    f"filter_title={'ja' if title_rx else 'nein'} filter_class={'ja' if class_rx else 'nein'} "
-                    f"global={'ja' if allow_global else 'nein'} expected_exe={self._expected_exe}",
-                    extra={"source": "local"}
-                )
-                last_log = now
-            time.sleep(0.15)
+        if now - self._last_search_log > 2.5:
+            self.log.info(
+                f"suche Fenster; pid_set={sorted(list(pid_set))} "
+                f"filter_title={'ja' if title_rx else 'nein'} filter_class={'ja' if class_rx else 'nein'} "
+                f"global={'ja' if allow_global else 'nein'} expected_exe={self._expected_exe}",
+                extra={"source": "local"}
+            )
+            self._last_search_log = now
 
-        self.log.warning("kein Fenster zum Einbetten gefunden", extra={"source": "local"})
+    # ---------- Finden und Einbetten ----------
+    def _matcher(self, pattern: Optional[str]) -> Optional[_TextMatcher]:
+        if not pattern:
+            return None
+        m = self._matchers.get(pattern)
+        if m is None:
+            m = _TextMatcher(pattern)
+            self._matchers[pattern] = m
+        return m
 
     def _build_pid_set(self, root_pid: Optional[int]) -> Set[int]:
         if not root_pid:
             return set()
         try:
-            parent_map, _ = snapshot_processes()
+            version, _, children_map = snapshot_parents()
         except Exception:
             return {int(root_pid)}
 
-        result: Set[int] = {int(root_pid)}
-        queue: List[int] = [int(root_pid)]
-        while queue:
-            p = queue.pop()
-            for child, parent in parent_map.items():
-                if parent == p and child not in result:
-                    result.add(child)
-                    queue.append(child)
-        return result
+        # Prozessbaum nur neu aufbauen, wenn ein frischer Snapshot vorliegt
+        key = (version, int(root_pid))
+        cached = self._pid_set_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        pid_set = collect_pid_tree(int(root_pid), children_map)
+        self._pid_set_cache = (key, pid_set)
+        return pid_set
 
     def _exe_matches_expected(self, pid: int, exe_map: Dict[int, str]) -> bool:
         expected = self._expected_exe
@@ -471,130 +729,34 @@ class LocalAppWidget(QWidget):
 
     def _pick_window(self,
                      pid_set: Set[int],
-                     title_rx: Optional[re.Pattern],
-                     class_rx: Optional[re.Pattern]) -> Optional[int]:
-        if not pid_set:
+                     title_rx: Optional[_TextMatcher],
+                     class_rx: Optional[_TextMatcher],
+                     allow_global: bool = False) -> Optional[int]:
+        if not pid_set and not allow_global:
             return None
 
         # Einmaliges Mapping holen
-        _, exe_map = snapshot_processes()
-
-        candidates: List[int] = []
-        titles: Dict[int, str] = {}
-        classes: Dict[int, str] = {}
-        pids: Dict[int, int] = {}
-
-        def _cb(hwnd, _lparam):
-            try:
-                if not IsWindowVisible(hwnd):
-                    return True
-                root = GetAncestor(hwnd, GA_ROOT)
-                if not root or root != hwnd:
-                    return True
-
-                proc_id = DWORD(0)
-                GetWindowThreadProcessId(hwnd, ctypes.byref(proc_id))
-                pid = int(proc_id.value)
-                if pid not in pid_set:
-                    return True
-
-                # EXE Plausibilitaet
-                if not self._exe_matches_expected(pid, exe_map):
-                    return True
-
-                tbuf = ctypes.create_unicode_buffer(512)
-                GetWindowTextW(hwnd, tbuf, 512)
-                title = tbuf.value or ""
-
-                cbuf = ctypes.create_unicode_buffer(256)
-                GetClassNameW(hwnd, cbuf, 256)
-                cls = cbuf.value or ""
-
-                if title_rx and not title_rx.search(title):
-                    return True
-                if class_rx and not class_rx.search(cls):
-                    return True
-
-                candidates.append(int(hwnd))
-                titles[int(hwnd)] = title
-                classes[int(hwnd)] = cls
-                pids[int(hwnd)] = pid
-            except Exception:
-                pass
-            return True
-
-        EnumWindows(EnumWindowsProc(_cb), 0)
-
-        if candidates:
-            def score(h: int) -> int:
-                return len(titles.get(h, "")) + (5 if classes.get(h) else 0)
-            best = max(candidates, key=score)
-            self.log.info(
-                f"kandidat(pid): hwnd={best} pid={pids.get(best)} title='{titles.get(best,'')}' class='{classes.get(best,'')}'",
-                extra={"source": "local"}
-            )
-            return best
-
+        exe_map = snapshot_exes()
+        # Ein Sweep fuer beide Stufen, die Treffer im eigenen Prozessbaum haben Vorrang.
+        # Mit explizitem Filter ist ein betitelter Treffer der eigenen PID eindeutig genug.
+        best_own, best_global = enum_best_windows(
+            pid_set, allow_global, title_rx, class_rx,
+            lambda pid: self._exe_matches_expected(pid, exe_map),
+            stop_on_own=bool(title_rx or class_rx),
+        )
+        if best_own is not None:
+            return self._log_candidate(best_own, "pid")
+        if best_global is not None:
+            return self._log_candidate(best_global, "global")
         return None
 
-    def _pick_window_global(self,
-                            title_rx: Optional[re.Pattern],
-                            class_rx: Optional[re.Pattern]) -> Optional[int]:
-        # Global nur mit EXE Filter
-        _, exe_map = snapshot_processes()
-
-        candidates: List[int] = []
-        titles: Dict[int, str] = {}
-        classes: Dict[int, str] = {}
-        pids: Dict[int, int] = {}
-
-        def _cb(hwnd, _lparam):
-            try:
-                if not IsWindowVisible(hwnd):
-                    return True
-                root = GetAncestor(hwnd, GA_ROOT)
-                if not root or root != hwnd:
-                    return True
-
-                proc_id = DWORD(0)
-                GetWindowThreadProcessId(hwnd, ctypes.byref(proc_id))
-                pid = int(proc_id.value)
-
-                if not self._exe_matches_expected(pid, exe_map):
-                    return True
-
-                tbuf = ctypes.create_unicode_buffer(512)
-                GetWindowTextW(hwnd, tbuf, 512)
-                title = tbuf.value or ""
-                cbuf = ctypes.create_unicode_buffer(256)
-                GetClassNameW(hwnd, cbuf, 256)
-                cls = cbuf.value or ""
-
-                if title_rx and not title_rx.search(title):
-                    return True
-                if class_rx and not class_rx.search(cls):
-                    return True
-
-                candidates.append(int(hwnd))
-                titles[int(hwnd)] = title
-                classes[int(hwnd)] = cls
-                pids[int(hwnd)] = pid
-            except Exception:
-                pass
-            return True
-
-        EnumWindows(EnumWindowsProc(_cb), 0)
-
-        if candidates:
-            def score(h: int) -> int:
-                return len(titles.get(h, "")) + (5 if classes.get(h) else 0)
-            best = max(candidates, key=score)
-            self.log.info(
-                f"kandidat(global): hwnd={best} pid={pids.get(best)} title='{titles.get(best,'')}' class='{classes.get(best,'')}'",
-                extra={"source": "local"}
-            )
-            return best
-        return None
+    def _log_candidate(self, cand: _Candidate, scope: str) -> int:
+        score, hwnd, pid, title, cls = cand
+        self.log.info(
+            f"kandidat({scope}): hwnd={hwnd} pid={pid} title='{title}' class='{cls}' score={score}",
+            extra={"source": "local"}
+        )
+        return hwnd
 
     # ---------- Einbetten ----------
     def _embed_hwnd(self, hwnd: int):
@@ -660,6 +822,7 @@ class LocalAppWidget(QWidget):
                     extra={"source": "local"},
                 )
                 self._embedded_hwnd = None
+                self._phase = "idle"
 
         QTimer.singleShot(0, attach_ui)
 
@@ -694,8 +857,8 @@ class LocalAppWidget(QWidget):
     def _find_preferred_child(self, root_hwnd: int) -> Optional[int]:
         class_pat = getattr(self.spec, "child_window_class_pattern", None)
         title_pat = getattr(self.spec, "child_window_title_pattern", None)
-        class_rx = re.compile(class_pat, re.I) if class_pat else None
-        title_rx = re.compile(title_pat, re.I) if title_pat else None
+        class_rx = self._matcher(class_pat)
+        title_rx = self._matcher(title_pat)
 
         best = None
         best_score = -1
@@ -705,12 +868,8 @@ class LocalAppWidget(QWidget):
             try:
                 if not IsWindowVisible(hwnd):
                     return True
-                tbuf = ctypes.create_unicode_buffer(512)
-                GetWindowTextW(hwnd, tbuf, 512)
-                title = tbuf.value or ""
-                cbuf = ctypes.create_unicode_buffer(256)
-                GetClassNameW(hwnd, cbuf, 256)
-                cls = cbuf.value or ""
+                title = window_text(hwnd)
+                cls = class_name(hwnd)
 
                 score = 0
                 if class_rx and class_rx.search(cls):
@@ -730,6 +889,14 @@ class LocalAppWidget(QWidget):
         return best
 
     def _apply_resize(self, force: bool = False):
+        w = max(1, int(self.width()))
+        h = max(1, int(self.height()))
+        # Unveraenderte Groesse nicht erneut ans eingebettete Fenster schicken
+        key = (self._embedded_hwnd, w, h)
+        if not force and key == self._last_applied:
+            return
+        self._last_applied = key
+
         if self._container:
             self._container.setMinimumSize(QSize(1, 1))
             self._container.resize(self.size())
@@ -737,9 +904,6 @@ class LocalAppWidget(QWidget):
         if not self._embedded_hwnd:
             return
 
-        w = max(1, int(self.width()))
-        h = max(1, int(self.height()))
-
         try:
             SendMessageW(HWND(self._embedded_hwnd), WM_SETREDRAW, WPARAM(0), LPARAM(0))
             SetWindowPos(HWND(self._embedded_hwnd), HWND(0), 0, 0, 64, 64,
@@ -3,9 +3,10 @@ import types
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
-base_str = str(BASE_DIR)
-if base_str not in sys.path:
-    sys.path.insert(0, base_str)
+
+# sys.path nur anfassen, wenn noetig; jede Aenderung verwirft die Finder Caches
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
 
 
 class _DummySignal:
@@ -16,49 +17,75 @@ class _DummySignal:
         self._handler = handler
 
     def emit(self, *args, **kwargs):
-        if self._handler:
-            try:
-                self._handler(*args, **kwargs)
-            except Exception:
-                pass
+        handler = self._handler
+        if handler is None:
+            return
+        handler(*args, **kwargs)
 
 
 def _dummy_signal_factory(*_args, **_kwargs):  # type: ignore
     return _DummySignal()
 
 
-class _Flag(int):
-    def __new__(cls, value: int) -> "_Flag":
-        return int.__new__(cls, value)  # type: ignore[arg-type]
-
-    def __or__(self, other):
-        return self.__class__(int(self) | int(other))
-
-    def __and__(self, other):
-        return self.__class__(int(self) & int(other))
-
-    def __invert__(self):
-        return self.__class__(~int(self))
-
-
 def _flag_namespace(**values):
+    # Plain ints genuegen, Bitoperationen laufen so direkt in C
     ns = types.SimpleNamespace()
     for name, value in values.items():
-        setattr(ns, name, _Flag(value))
+        setattr(ns, name, value)
     return ns
 
 
-def _install_qtcore_stub():
-    if "PyQt6.QtCore" in sys.modules:
-        return sys.modules["PyQt6.QtCore"]
-
-    qtcore = types.ModuleType("PyQt6.QtCore")
-    qtcore.__package__ = "PyQt6"
-
+# Einmal beim Import gebaut und von jeder (Neu-)Installation geteilt
+_QT_FLAG_GROUPS = {
+    "AlignmentFlag": _flag_namespace(
+        AlignCenter=0x1,
+        AlignHCenter=0x1,
+        AlignLeft=0x2,
+        AlignRight=0x4,
+        AlignVCenter=0x8,
+    ),
+    "WindowType": _flag_namespace(
+        Window=0x0,
+        Dialog=0x10,
+        FramelessWindowHint=0x20,
+        WindowStaysOnTopHint=0x40,
+        WindowContextHelpButtonHint=0x80,
+        SplashScreen=0x100,
+    ),
+    "WindowState": _flag_namespace(WindowMinimized=0x1),
+    "WidgetAttribute": _flag_namespace(
+        WA_NativeWindow=0x1,
+        WA_DontCreateNativeAncestors=0x2,
+        WA_DeleteOnClose=0x4,
+        WA_TranslucentBackground=0x8,
+        WA_TransparentForMouseEvents=0x10,
+    ),
+    "KeyboardModifier": _flag_namespace(ShiftModifier=0x1),
+    "MouseButton": _flag_namespace(LeftButton=0x1),
+    "FocusPolicy": _flag_namespace(StrongFocus=0x1),
+    "MatchFlag": _flag_namespace(MatchExactly=0x1),
+    "TransformationMode": _flag_namespace(SmoothTransformation=0x1),
+    "WindowModality": _flag_namespace(NonModal=0x0),
+}
+
+# Gruppen plus Kurzformen wie Qt.AlignCenter in einem flachen Dict
+_QT_ATTR_DICT = dict(_QT_FLAG_GROUPS)
+for _group in _QT_FLAG_GROUPS.values():
+    _QT_ATTR_DICT.update(vars(_group))
+del _group
+
+
+def _populate_qtcore(qtcore):
     class QObject:  # type: ignore
         def __init__(self, *_args, **_kwargs):
             pass
 
+        def moveToThread(self, thread):
+            self._thread = thread
+
+        def deleteLater(self):
+            pass
+
     class QTimer:  # type: ignore
         def __init__(self, *_args, **_kwargs):
             self.timeout = _dummy_signal_factory()
@@ -67,6 +94,12 @@ def _install_qtcore_stub():
         def setInterval(self, value):
             self._interval = value
 
+        def setSingleShot(self, *_args):
+            pass
+
+        def isActive(self):
+            return False
+
         def start(self):
             pass
 
@@ -80,6 +113,39 @@ def _install_qtcore_stub():
             except Exception:
                 pass
 
+    class QThread(QObject):  # type: ignore
+        def __init__(self, *_args, **_kwargs):
+            self.started = _dummy_signal_factory()
+            self.finished = _dummy_signal_factory()
+            self._running = False
+
+        def start(self):
+            self._running = True
+
+        def quit(self):
+            self._running = False
+
+        def wait(self, *_args):
+            return True
+
+        def isRunning(self):
+            return self._running
+
+        def isFinished(self):
+            return not self._running
+
+    class QFileSystemWatcher(QObject):  # type: ignore
+        def __init__(self, *_args, **_kwargs):
+            self.fileChanged = _dummy_signal_factory()
+            self._paths = []
+
+        def addPath(self, path):
+            self._paths.append(path)
+            return True
+
+        def files(self):
+            return list(self._paths)
+
     class QUrl:  # type: ignore
         def __init__(self, url: str = ""):
             self._url = url
@@ -153,8 +219,16 @@ def _install_qtcore_stub():
         def processEvents(self, *_args, **_kwargs):
             pass
 
+        def __getattr__(self, name):
+            # Signale wie aboutToQuit
+            sig = _dummy_signal_factory()
+            object.__setattr__(self, name, sig)
+            return sig
+
     qtcore.QObject = QObject
     qtcore.QTimer = QTimer
+    qtcore.QThread = QThread
+    qtcore.QFileSystemWatcher = QFileSystemWatcher
     qtcore.QUrl = QUrl
     qtcore.QPoint = QPoint
     qtcore.QSize = QSize
@@ -176,72 +250,11 @@ def _install_qtcore_stub():
     qtcore.qInstallMessageHandler = qInstallMessageHandler  # type: ignore[attr-defined]
 
     Qt = types.SimpleNamespace()
-    Qt.AlignmentFlag = _flag_namespace(
-        AlignCenter=0x1,
-        AlignHCenter=0x1,
-        AlignLeft=0x2,
-        AlignRight=0x4,
-        AlignVCenter=0x8,
-    )
-    Qt.WindowType = _flag_namespace(
-        Window=0x0,
-        Dialog=0x10,
-        FramelessWindowHint=0x20,
-        WindowStaysOnTopHint=0x40,
-        WindowContextHelpButtonHint=0x80,
-        SplashScreen=0x100,
-    )
-    Qt.WindowState = _flag_namespace(WindowMinimized=0x1)
-    Qt.WidgetAttribute = _flag_namespace(
-        WA_NativeWindow=0x1,
-        WA_DontCreateNativeAncestors=0x2,
-        WA_DeleteOnClose=0x4,
-        WA_TranslucentBackground=0x8,
-        WA_TransparentForMouseEvents=0x10,
-    )
-    Qt.KeyboardModifier = _flag_namespace(ShiftModifier=0x1)
-    Qt.MouseButton = _flag_namespace(LeftButton=0x1)
-    Qt.FocusPolicy = _flag_namespace(StrongFocus=0x1)
-    Qt.MatchFlag = _flag_namespace(MatchExactly=0x1)
-    Qt.TransformationMode = _flag_namespace(SmoothTransformation=0x1)
-    Qt.WindowModality = _flag_namespace(NonModal=0x0)
-
-    Qt.AlignCenter = Qt.AlignmentFlag.AlignCenter
-    Qt.AlignHCenter = Qt.AlignmentFlag.AlignHCenter
-    Qt.AlignLeft = Qt.AlignmentFlag.AlignLeft
-    Qt.AlignRight = Qt.AlignmentFlag.AlignRight
-    Qt.AlignVCenter = Qt.AlignmentFlag.AlignVCenter
-    Qt.Dialog = Qt.WindowType.Dialog
-    Qt.Window = Qt.WindowType.Window
-    Qt.FramelessWindowHint = Qt.WindowType.FramelessWindowHint
-    Qt.WindowStaysOnTopHint = Qt.WindowType.WindowStaysOnTopHint
-    Qt.WindowContextHelpButtonHint = Qt.WindowType.WindowContextHelpButtonHint
-    Qt.SplashScreen = Qt.WindowType.SplashScreen
-    Qt.WindowMinimized = Qt.WindowState.WindowMinimized
-    Qt.WA_NativeWindow = Qt.WidgetAttribute.WA_NativeWindow
-    Qt.WA_DontCreateNativeAncestors = Qt.WidgetAttribute.WA_DontCreateNativeAncestors
-    Qt.WA_DeleteOnClose = Qt.WidgetAttribute.WA_DeleteOnClose
-    Qt.WA_TranslucentBackground = Qt.WidgetAttribute.WA_TranslucentBackground
-    Qt.WA_TransparentForMouseEvents = Qt.WidgetAttribute.WA_TransparentForMouseEvents
-    Qt.ShiftModifier = Qt.KeyboardModifier.ShiftModifier
-    Qt.LeftButton = Qt.MouseButton.LeftButton
-    Qt.StrongFocus = Qt.FocusPolicy.StrongFocus
-    Qt.MatchExactly = Qt.MatchFlag.MatchExactly
-    Qt.SmoothTransformation = Qt.TransformationMode.SmoothTransformation
-    Qt.NonModal = Qt.WindowModality.NonModal
-
+    Qt.__dict__.update(_QT_ATTR_DICT)
     qtcore.Qt = Qt
-    sys.modules["PyQt6.QtCore"] = qtcore
-    return qtcore
 
 
-def _install_qtgui_stub(qtcore):
-    if "PyQt6.QtGui" in sys.modules:
-        return sys.modules["PyQt6.QtGui"]
-
-    qtgui = types.ModuleType("PyQt6.QtGui")
-    qtgui.__package__ = "PyQt6"
-
+def _populate_qtgui(qtgui, qtcore):
     class QKeySequence:  # type: ignore
         def __init__(self, sequence: str = ""):
             self._sequence = sequence
@@ -355,24 +368,23 @@ def _install_qtgui_stub(qtcore):
     qtgui.QWindow = QWindow
     qtgui.QGuiApplication = QGuiApplication
 
-    sys.modules["PyQt6.QtGui"] = qtgui
-    return qtgui
-
-
-def _install_qtwidgets_stub(qtcore):
-    if "PyQt6.QtWidgets" in sys.modules:
-        return sys.modules["PyQt6.QtWidgets"]
-
-    qtwidgets = types.ModuleType("PyQt6.QtWidgets")
-    qtwidgets.__package__ = "PyQt6"
 
+def _populate_qtwidgets(qtwidgets, qtcore):
     class QWidget:  # type: ignore
-        def __init__(self, parent=None):
+        def __init__(self, *args, parent=None):
+            # QLabel("Text", parent) usw.: Eltern ist das letzte Argument, das kein Text ist
+            for arg in args:
+                if not isinstance(arg, str):
+                    parent = arg
             self._parent = parent
             self._layout = None
 
         def __getattr__(self, name):
-            return _dummy_signal_factory()
+            # Einmal anlegen und im Instanz-Dict ablegen: gleiche Signal Instanz
+            # fuer connect und emit, weitere Zugriffe laufen nicht mehr hier durch
+            sig = _dummy_signal_factory()
+            object.__setattr__(self, name, sig)
+            return sig
 
         def setLayout(self, layout):
             self._layout = layout
@@ -464,6 +476,19 @@ def _install_qtwidgets_stub(qtcore):
         def deleteLater(self):
             pass
 
+        def showEvent(self, _ev):
+            pass
+
+        def hideEvent(self, _ev):
+            pass
+
+        def closeEvent(self, _ev):
+            pass
+
+        def close(self):
+            self.closeEvent(None)
+            return True
+
     class _Layout:  # type: ignore
         def __init__(self, *_args, **_kwargs):
             pass
@@ -511,10 +536,19 @@ def _install_qtwidgets_stub(qtcore):
             return 1
 
         def accept(self):
-            pass
+            self.done(1)
 
         def reject(self):
-            pass
+            self.done(0)
+
+        def done(self, result):
+            self.finished.emit(result)
+
+        def close(self):
+            # wie Qt: Schliessen eines Dialogs laeuft ueber closeEvent und reject
+            self.closeEvent(None)
+            self.reject()
+            return True
 
     class QLabel(QWidget):  # type: ignore
         def setText(self, *_args, **_kwargs):
@@ -524,7 +558,8 @@ def _install_qtwidgets_stub(qtcore):
             pass
 
     class QPushButton(QWidget):  # type: ignore
-        pass
+        def setText(self, *_args, **_kwargs):
+            pass
 
     class QToolButton(QWidget):  # type: ignore
         pass
@@ -533,6 +568,12 @@ def _install_qtwidgets_stub(qtcore):
         def addItem(self, *_args, **_kwargs):
             pass
 
+        def setCurrentIndex(self, *_args, **_kwargs):
+            pass
+
+        def count(self):
+            return 0
+
         def currentData(self):
             return None
 
@@ -546,6 +587,12 @@ def _install_qtwidgets_stub(qtcore):
         def isChecked(self):
             return False
 
+        def setChecked(self, *_args, **_kwargs):
+            pass
+
+        def setText(self, *_args, **_kwargs):
+            pass
+
     class QLineEdit(QWidget):  # type: ignore
         def text(self):
             return ""
@@ -617,10 +664,19 @@ def _install_qtwidgets_stub(qtcore):
         def setPlainText(self, *_args, **_kwargs):
             pass
 
+        def setReadOnly(self, *_args, **_kwargs):
+            pass
+
+        def setMaximumBlockCount(self, *_args, **_kwargs):
+            pass
+
     class QTextEdit(QWidget):  # type: ignore
         def setPlainText(self, *_args, **_kwargs):
             pass
 
+        def setReadOnly(self, *_args, **_kwargs):
+            pass
+
     class QTableWidget(QWidget):  # type: ignore
         def setRowCount(self, *_args, **_kwargs):
             pass
@@ -718,17 +774,8 @@ def _install_qtwidgets_stub(qtcore):
     qtwidgets.QMenu = QMenu
     qtwidgets.QShortcut = QShortcut
 
-    sys.modules["PyQt6.QtWidgets"] = qtwidgets
-    return qtwidgets
-
-
-def _install_qtwe_stub(qtcore):
-    if "PyQt6.QtWebEngineWidgets" in sys.modules:
-        return sys.modules["PyQt6.QtWebEngineWidgets"]
-
-    qtwe = types.ModuleType("PyQt6.QtWebEngineWidgets")
-    qtwe.__package__ = "PyQt6"
 
+def _populate_qtwe(qtwe, qtcore):
     class QWebEngineView:  # type: ignore
         def __init__(self):
             self.loadStarted = _dummy_signal_factory()
@@ -746,17 +793,58 @@ def _install_qtwe_stub(qtcore):
             pass
 
     qtwe.QWebEngineView = QWebEngineView
-    sys.modules["PyQt6.QtWebEngineWidgets"] = qtwe
-    return qtwe
 
 
-try:  # pragma: no cover - allow real Qt installs to be used when available
-    import PyQt6  # type: ignore
-except Exception:  # pragma: no cover - provide stub for headless CI
-    qtcore = _install_qtcore_stub()
-    qtgui = _install_qtgui_stub(qtcore)
-    qtwidgets = _install_qtwidgets_stub(qtcore)
-    qtwe = _install_qtwe_stub(qtcore)
+class _LazyStubModule(types.ModuleType):
+    """Stub Modul, das seine Klassen erst beim ersten Attributzugriff anlegt."""
+
+    def __init__(self, name, populate, *args):
+        super().__init__(name)
+        self.__package__ = "PyQt6"
+        self._populate = (populate, args)
+
+    def __getattr__(self, name):
+        pending = self.__dict__.pop("_populate", None)
+        if pending is None:
+            raise AttributeError(name)
+        populate, args = pending
+        populate(self, *args)
+        return getattr(self, name)
+
+
+def _install_eager(name, populate, *args):
+    if name in sys.modules:
+        return sys.modules[name]
+    module = types.ModuleType(name)
+    module.__package__ = "PyQt6"
+    populate(module, *args)
+    sys.modules[name] = module
+    return module
+
+
+def _install_qtcore_stub():
+    return _install_eager("PyQt6.QtCore", _populate_qtcore)
+
+
+def _install_qtgui_stub(qtcore):
+    return _install_eager("PyQt6.QtGui", _populate_qtgui, qtcore)
+
+
+def _install_qtwidgets_stub(qtcore):
+    return _install_eager("PyQt6.QtWidgets", _populate_qtwidgets, qtcore)
+
+
+def _install_qtwe_stub(qtcore):
+    return _install_eager("PyQt6.QtWebEngineWidgets", _populate_qtwe, qtcore)
+
+
+def _install_all_stubs():
+    qtcore = _LazyStubModule("PyQt6.QtCore", _populate_qtcore)
+    qtgui = _LazyStubModule("PyQt6.QtGui", _populate_qtgui, qtcore)
+    qtwidgets = _LazyStubModule("PyQt6.QtWidgets", _populate_qtwidgets, qtcore)
+    qtwe = _LazyStubModule("PyQt6.QtWebEngineWidgets", _populate_qtwe, qtcore)
+    for module in (qtcore, qtgui, qtwidgets, qtwe):
+        sys.modules[module.__name__] = module
 
     stub_pkg = types.ModuleType("PyQt6")
     stub_pkg.__path__ = []  # type: ignore[attr-defined]
@@ -765,8 +853,12 @@ except Exception:  # pragma: no cover - provide stub for headless CI
     stub_pkg.QtGui = qtgui
     stub_pkg.QtWidgets = qtwidgets
     stub_pkg.QtWebEngineWidgets = qtwe
+    # Markierung fuer conftest: Stubs brauchen kein Display
+    stub_pkg._STUBS_READY = True  # type: ignore[attr-defined]
     sys.modules["PyQt6"] = stub_pkg
-else:  # pragma: no cover - ensure submodules exist even if incomplete
+
+
+def _patch_incomplete_qt():
     from PyQt6 import QtCore as _QtCore  # type: ignore
     from PyQt6 import QtGui as _QtGui  # type: ignore
     from PyQt6 import QtWidgets as _QtWidgets  # type: ignore
@@ -780,3 +872,12 @@ else:  # pragma: no cover - ensure submodules exist even if incomplete
         sys.modules["PyQt6.QtWidgets"] = _install_qtwidgets_stub(_QtCore)
     if not hasattr(_QtWebEngineWidgets, "QWebEngineView"):
         sys.modules["PyQt6.QtWebEngineWidgets"] = _install_qtwe_stub(_QtCore)
+
+
+# Echte Qt Installation zuerst pruefen, Stubs nur ohne Qt bauen
+try:  # pragma: no cover - allow real Qt installs to be used when available
+    import PyQt6  # type: ignore
+except Exception:  # pragma: no cover - provide stub for headless CI
+    _install_all_stubs()
+else:  # pragma: no cover - ensure submodules exist even if incomplete
+    _patch_incomplete_qt()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+
+def _qt_available() -> bool:
+    # Headless Stubs aus tests/__init__ brauchen kein Display
+    if getattr(sys.modules.get("PyQt6"), "_STUBS_READY", False):
+        return True
+    if sys.platform.startswith("win") or sys.platform == "darwin":
+        return True
+    if os.environ.get("QT_QPA_PLATFORM") in ("offscreen", "minimal"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "qt: Test braucht Qt Widgets (echtes Display oder Stubs)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if _qt_available():
+        return
+    skip = pytest.mark.skip(reason="no Qt display available")
+    for item in items:
+        if item.get_closest_marker("qt"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def sample_log(tmp_path_factory):
+    # Ein Logfile fuer alle Export-Tests, Archive landen im jeweiligen tmp_path
+    log_file = tmp_path_factory.mktemp("logs") / "20240101_1_kiosk.log"
+    log_file.write_text("2024-01-01 00:00:00 INFO bootstrap\n")
+    return log_file
+
+
+@pytest.fixture
+def base_settings(tmp_path):
+    # Gemeinsame Export-Basis, Tests tauschen Ziele per dataclasses.replace
+    from utils.config_loader import RemoteLogExportSettings
+
+    return RemoteLogExportSettings(
+        enabled=True,
+        include_history=1,
+        retention_count=1,
+        staging_dir=str(tmp_path / "exports"),
+    )
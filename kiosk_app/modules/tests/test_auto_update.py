@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import hashlib
 import io
+import os
 from pathlib import Path
-from typing import Dict, Optional
-from zipfile import ZipFile
+from typing import Dict, List, Optional
+
+import pytest
 
 from services import auto_update as auto_update_module
 from services.auto_update import AutoUpdateService
@@ -15,6 +16,7 @@ class DummyResponse:
     def __init__(self, *, json_data: Optional[Dict] = None, content: bytes = b"", status: int = 200):
         self._json = json_data
         self._content = content
+        self._chunks: Dict[int, List[bytes]] = {}
         self.status_code = status
 
     def json(self):
@@ -23,14 +25,21 @@ class DummyResponse:
         return self._json
 
     def iter_content(self, chunk_size: int = 65536):
-        for idx in range(0, len(self._content), chunk_size):
-            yield self._content[idx : idx + chunk_size]
+        # content ist unveraenderlich, Slices je chunk_size nur einmal bilden
+        chunks = self._chunks.get(chunk_size)
+        if chunks is None:
+            content = self._content
+            chunks = [content[idx : idx + chunk_size] for idx in range(0, len(content), chunk_size)]
+            self._chunks[chunk_size] = chunks
+        return iter(chunks)
 
     def close(self):  # pragma: no cover - compatibility hook
         pass
 
 
 def _create_package(**files: str) -> bytes:
+    from zipfile import ZipFile
+
     buffer = io.BytesIO()
     with ZipFile(buffer, "w") as archive:
         for name, content in files.items():
@@ -38,24 +47,16 @@ def _create_package(**files: str) -> bytes:
     return buffer.getvalue()
 
 
-def _auto_update_service(tmp_path: Path, feed_url: str = "https://updates.example.com/feed.json") -> AutoUpdateService:
-    settings = UpdateSettings(
-        enabled=True,
-        feed_url=feed_url,
-        verify_tls=False,
-        download_dir=str(tmp_path / "downloads"),
-    )
-    install_dir = tmp_path / "install"
-    install_dir.mkdir()
-    (install_dir / "app.txt").write_text("old")
-    return AutoUpdateService(settings, install_dir=install_dir, current_version="0.9.0")
-
+@pytest.fixture(scope="module")
+def release_package():
+    import hashlib
 
-def test_auto_update_installs_release(tmp_path: Path, monkeypatch):
     package_bytes = _create_package(**{"app.txt": "new", "new.txt": "fresh"})
-    sha = hashlib.sha256(package_bytes).hexdigest()
+    return package_bytes, hashlib.sha256(package_bytes).hexdigest()
 
-    responses = {
+
+def _release_responses(package_bytes: bytes, sha: str) -> Dict[str, DummyResponse]:
+    return {
         "https://updates.example.com/feed.json": DummyResponse(
             json_data={
                 "releases": [
@@ -71,13 +72,40 @@ def test_auto_update_installs_release(tmp_path: Path, monkeypatch):
         "https://updates.example.com/pkg.zip": DummyResponse(content=package_bytes),
     }
 
-    def fake_get(url, *args, **kwargs):
-        resp = responses.get(url)
-        if resp is None:
-            raise AssertionError(f"unexpected url {url}")
-        return resp
 
-    monkeypatch.setattr(auto_update_module.requests, "get", fake_get)
+@pytest.fixture
+def patched_requests(monkeypatch):
+    def install(responses: Dict[str, DummyResponse]) -> Dict[str, int]:
+        calls: Dict[str, int] = {}
+
+        def fake_get(url, *args, **kwargs):
+            calls[url] = calls.get(url, 0) + 1
+            resp = responses.get(url)
+            if resp is None:
+                raise AssertionError(f"unexpected url {url}")
+            return resp
+
+        monkeypatch.setattr(auto_update_module.requests, "get", fake_get)
+        return calls
+
+    return install
+
+
+def _auto_update_service(tmp_path: Path, feed_url: str = "https://updates.example.com/feed.json") -> AutoUpdateService:
+    settings = UpdateSettings(
+        enabled=True,
+        feed_url=feed_url,
+        verify_tls=False,
+        download_dir=str(tmp_path / "downloads"),
+    )
+    install_dir = tmp_path / "install"
+    install_dir.mkdir()
+    (install_dir / "app.txt").write_text("old")
+    return AutoUpdateService(settings, install_dir=install_dir, current_version="0.9.0")
+
+
+def test_auto_update_installs_release(tmp_path: Path, patched_requests, release_package):
+    patched_requests(_release_responses(*release_package))
 
     service = _auto_update_service(tmp_path)
     result = service.run_once()
@@ -87,37 +115,13 @@ def test_auto_update_installs_release(tmp_path: Path, monkeypatch):
     assert result.release is not None and result.release.version == "1.0.0"
 
     install_dir = Path(service.install_dir)
+    entries = {entry.name for entry in os.scandir(install_dir)}
+    assert {"app.txt", "new.txt"} <= entries
     assert (install_dir / "app.txt").read_text() == "new"
-    assert (install_dir / "new.txt").exists()
 
 
-def test_auto_update_rollback_on_failure(tmp_path: Path, monkeypatch):
-    package_bytes = _create_package(**{"app.txt": "new", "new.txt": "fresh"})
-    sha = hashlib.sha256(package_bytes).hexdigest()
-
-    responses = {
-        "https://updates.example.com/feed.json": DummyResponse(
-            json_data={
-                "releases": [
-                    {
-                        "version": "1.0.0",
-                        "channel": "stable",
-                        "url": "https://updates.example.com/pkg.zip",
-                        "sha256": sha,
-                    }
-                ]
-            }
-        ),
-        "https://updates.example.com/pkg.zip": DummyResponse(content=package_bytes),
-    }
-
-    def fake_get(url, *args, **kwargs):
-        resp = responses.get(url)
-        if resp is None:
-            raise AssertionError(f"unexpected url {url}")
-        return resp
-
-    monkeypatch.setattr(auto_update_module.requests, "get", fake_get)
+def test_auto_update_rollback_on_failure(tmp_path: Path, monkeypatch, patched_requests, release_package):
+    patched_requests(_release_responses(*release_package))
 
     original_copy2 = auto_update_module.shutil.copy2
 
@@ -137,32 +141,32 @@ def test_auto_update_rollback_on_failure(tmp_path: Path, monkeypatch):
     assert result.rolled_back is True
 
     install_dir = Path(service.install_dir)
+    entries = {entry.name for entry in os.scandir(install_dir)}
+    assert "app.txt" in entries
+    assert "new.txt" not in entries
     assert (install_dir / "app.txt").read_text() == "old"
-    assert not (install_dir / "new.txt").exists()
 
 
-def test_auto_update_no_new_version(tmp_path: Path, monkeypatch):
-    responses = {}
-
-    def fake_get(url, *args, **kwargs):
-        responses[url] = responses.get(url, 0) + 1
-        return DummyResponse(
-            json_data={
-                "releases": [
-                    {
-                        "version": "0.9.0",
-                        "channel": "stable",
-                        "url": "https://updates.example.com/pkg.zip",
-                        "sha256": "deadbeef",
-                    }
-                ]
-            }
-        )
-
-    monkeypatch.setattr(auto_update_module.requests, "get", fake_get)
+def test_auto_update_no_new_version(tmp_path: Path, patched_requests):
+    calls = patched_requests(
+        {
+            "https://updates.example.com/feed.json": DummyResponse(
+                json_data={
+                    "releases": [
+                        {
+                            "version": "0.9.0",
+                            "channel": "stable",
+                            "url": "https://updates.example.com/pkg.zip",
+                            "sha256": "deadbeef",
+                        }
+                    ]
+                }
+            )
+        }
+    )
 
     service = _auto_update_service(tmp_path)
     result = service.run_once()
 
     assert result is None
-    assert responses["https://updates.example.com/feed.json"] == 1
+    assert calls["https://updates.example.com/feed.json"] == 1
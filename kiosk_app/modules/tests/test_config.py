@@ -1,77 +1,110 @@
-from utils.config_loader import load_config, Config, DEFAULT_SHORTCUTS
+from utils.config_loader import load_config, load_config_from_dict, save_config, Config, DEFAULT_SHORTCUTS, UISettings
 from pathlib import Path
 import json
 import tempfile
 
-def test_valid_config_loads(tmp_path: Path):
-    cfg_data = {
-        "browser_urls": ["http://127.0.0.1:8000","http://127.0.0.1:8001","http://127.0.0.1:8002"],
-        "local_app": {"launch_cmd":"notepad.exe","embed_mode":"native_window","window_title_pattern":".*Notepad.*"},
-        "ui": {"start_mode":"single","sidebar_width":96, "split_enabled": False},
-        "kiosk": {"monitor_index":0,"disable_system_keys":True}
-    }
-    p = tmp_path / "config.json"
-    p.write_text(json.dumps(cfg_data))
-    cfg = load_config(p)
+import pytest
+
+_VALID_CFG = {
+    "browser_urls": ["http://127.0.0.1:8000","http://127.0.0.1:8001","http://127.0.0.1:8002"],
+    "local_app": {"launch_cmd":"notepad.exe","embed_mode":"native_window","window_title_pattern":".*Notepad.*"},
+    "ui": {"start_mode":"single","sidebar_width":96, "split_enabled": False},
+    "kiosk": {"monitor_index":0,"disable_system_keys":True}
+}
+
+
+def test_valid_config_loads():
+    cfg = load_config_from_dict(_VALID_CFG)
     assert isinstance(cfg, Config)
     assert cfg.ui.start_mode == "single"
     assert cfg.ui.split_enabled is False
 
-def test_invalid_urls(tmp_path: Path):
+
+@pytest.mark.parametrize(
+    "urls",
+    [["abc","def","ghi"], ["example.com", "127.0.0.1:8000"]],
+    ids=["bare-words", "missing-scheme"],
+)
+def test_legacy_urls_without_scheme_are_kept(urls):
+    # Altes Schema wird nicht abgewiesen: jede URL wird unveraendert zur Browser Quelle
     cfg_data = {
-        "browser_urls": ["abc","def","ghi"],
+        "browser_urls": urls,
         "local_app": {"launch_cmd":"notepad.exe"}
     }
-    p = tmp_path / "config.json"
-    p.write_text(json.dumps(cfg_data))
-    try:
-        load_config(p)
-    except Exception as e:
-        assert "http" in str(e)
+    cfg = load_config_from_dict(cfg_data)
+    browsers = [s for s in cfg.sources if s.type == "browser"]
+    assert [s.url for s in browsers] == urls
+    assert [s.name for s in browsers] == [f"Browser {i+1}" for i in range(len(urls))]
+    assert [(s.type, s.launch_cmd) for s in cfg.sources[len(urls):]] == [("local", "notepad.exe")]
 
 
-def test_shortcuts_override(tmp_path: Path):
-    cfg_data = {
-        "sources": [{"type": "browser", "name": "A", "url": "http://example.com"}],
-        "ui": {"shortcuts": {"toggle_kiosk": "Ctrl+F"}},
-    }
-    p = tmp_path / "config.json"
-    p.write_text(json.dumps(cfg_data))
-    cfg = load_config(p)
+def test_legacy_empty_url_falls_back_to_blank():
+    cfg = load_config_from_dict({"browser_urls": ["", None]})
+    assert [s.url for s in cfg.sources] == ["about:blank", "about:blank"]
+
+
+_CFG_SHORTCUTS = {
+    "sources": [{"type": "browser", "name": "A", "url": "http://example.com"}],
+    "ui": {"shortcuts": {"toggle_kiosk": "Ctrl+F"}},
+}
+
+
+def test_shortcuts_override():
+    cfg = load_config_from_dict(_CFG_SHORTCUTS)
     assert cfg.ui.shortcuts["toggle_kiosk"] == "Ctrl+F"
     assert cfg.ui.shortcuts["select_1"] == DEFAULT_SHORTCUTS["select_1"]
 
 
-def test_remote_logging_settings(tmp_path: Path):
-    cfg_data = {
-        "sources": [{"type": "browser", "name": "A", "url": "http://example.com"}],
-        "logging": {
-            "remote_export": {
-                "enabled": True,
-                "include_history": 2,
-                "source_glob": "*.log",
-                "schedule_minutes": 15,
-                "destinations": [
-                    {
-                        "type": "http",
-                        "name": "api",
-                        "url": "https://example.com/upload",
-                        "headers": {"X-Test": "1"},
-                    },
-                    {
-                        "type": "email",
-                        "smtp_host": "smtp.example.com",
-                        "email_from": "kiosk@example.com",
-                        "email_to": ["ops@example.com"],
-                        "use_tls": True,
-                    },
-                ],
-            }
+def test_shortcut_defaults_stay_frozen():
+    from dataclasses import asdict
+
+    cfg = load_config_from_dict(_CFG_SHORTCUTS)
+    with pytest.raises(TypeError):
+        cfg.ui.shortcuts.maps[1]["select_1"] = "X"
+    assert asdict(cfg)["ui"]["shortcuts"]["toggle_kiosk"] == "Ctrl+F"
+    assert UISettings().shortcuts["select_1"] == DEFAULT_SHORTCUTS["select_1"]
+
+
+def test_shortcuts_survive_save_roundtrip(tmp_path: Path):
+    cfg = load_config_from_dict(_CFG_SHORTCUTS)
+    target = tmp_path / "config.json"
+    save_config(target, cfg)
+
+    reloaded = load_config(target)
+    assert reloaded.ui.shortcuts["toggle_kiosk"] == "Ctrl+F"
+    assert reloaded.ui.shortcuts["select_1"] == DEFAULT_SHORTCUTS["select_1"]
+
+
+_CFG_REMOTE_LOGGING = {
+    "sources": [{"type": "browser", "name": "A", "url": "http://example.com"}],
+    "logging": {
+        "remote_export": {
+            "enabled": True,
+            "include_history": 2,
+            "source_glob": "*.log",
+            "schedule_minutes": 15,
+            "destinations": [
+                {
+                    "type": "http",
+                    "name": "api",
+                    "url": "https://example.com/upload",
+                    "headers": {"X-Test": "1"},
+                },
+                {
+                    "type": "email",
+                    "smtp_host": "smtp.example.com",
+                    "email_from": "kiosk@example.com",
+                    "email_to": ["ops@example.com"],
+                    "use_tls": True,
+                },
+            ],
         }
     }
-    p = tmp_path / "config.json"
-    p.write_text(json.dumps(cfg_data))
-    cfg = load_config(p)
+}
+
+
+def test_remote_logging_settings():
+    cfg = load_config_from_dict(_CFG_REMOTE_LOGGING)
     remote = cfg.logging.remote_export
     assert remote.enabled is True
     assert remote.include_history == 2
@@ -87,21 +120,21 @@ def test_remote_logging_settings(tmp_path: Path):
     assert email_dest.email_to == ["ops@example.com"]
 
 
-def test_remote_logging_retention(tmp_path: Path):
-    cfg_data = {
-        "sources": [{"type": "browser", "name": "A", "url": "http://example.com"}],
-        "logging": {
-            "remote_export": {
-                "enabled": True,
-                "retention_count": None,
-                "retention_days": -1,
-                "schedule_minutes": 0,
-            }
-        },
-    }
-    path = tmp_path / "config.json"
-    path.write_text(json.dumps(cfg_data))
-    cfg = load_config(path)
+_CFG_REMOTE_RETENTION = {
+    "sources": [{"type": "browser", "name": "A", "url": "http://example.com"}],
+    "logging": {
+        "remote_export": {
+            "enabled": True,
+            "retention_count": None,
+            "retention_days": -1,
+            "schedule_minutes": 0,
+        }
+    },
+}
+
+
+def test_remote_logging_retention():
+    cfg = load_config_from_dict(_CFG_REMOTE_RETENTION)
     remote = cfg.logging.remote_export
     assert remote.retention_count is None
     assert remote.retention_days is None
@@ -121,9 +154,7 @@ def test_update_settings_parse(tmp_path: Path):
             "auto_install": False,
         }
     }
-    path = tmp_path / "config.json"
-    path.write_text(json.dumps(cfg_data))
-    cfg = load_config(path)
+    cfg = load_config_from_dict(cfg_data)
     updates = cfg.updates
     assert updates.enabled is True
     assert updates.feed_url == "https://example.com/feed.json"
@@ -134,35 +165,35 @@ def test_update_settings_parse(tmp_path: Path):
     assert updates.auto_install is False
 
 
-def test_schedule_parsing(tmp_path: Path):
-    cfg_data = {
-        "sources": [
-            {"type": "browser", "name": "A", "url": "http://example.com"},
-            {"type": "browser", "name": "B", "url": "http://example.org"},
-            {"type": "browser", "name": "C", "url": "http://example.net"},
-        ],
-        "schedules": [
-            {
-                "pane": 0,
-                "default_source": "A",
-                "blocks": [
-                    {"start": "08:00", "end": "10:00", "source": "B"},
-                    {"start": "10:00", "end": "18:00", "source": "C"},
-                ],
-            },
-            {
-                "pane": 1,
-                "blocks": [
-                    {"start": "00:00", "end": "23:59", "source": "A"},
-                    {"start": "bad", "end": "value", "source": "ignored"},
-                ],
-            },
-            {"pane": -1, "blocks": [{"start": "00:00", "end": "01:00", "source": "B"}]},
-        ],
-    }
-    path = tmp_path / "config.json"
-    path.write_text(json.dumps(cfg_data))
-    cfg = load_config(path)
+_CFG_SCHEDULES = {
+    "sources": [
+        {"type": "browser", "name": "A", "url": "http://example.com"},
+        {"type": "browser", "name": "B", "url": "http://example.org"},
+        {"type": "browser", "name": "C", "url": "http://example.net"},
+    ],
+    "schedules": [
+        {
+            "pane": 0,
+            "default_source": "A",
+            "blocks": [
+                {"start": "08:00", "end": "10:00", "source": "B"},
+                {"start": "10:00", "end": "18:00", "source": "C"},
+            ],
+        },
+        {
+            "pane": 1,
+            "blocks": [
+                {"start": "00:00", "end": "23:59", "source": "A"},
+                {"start": "bad", "end": "value", "source": "ignored"},
+            ],
+        },
+        {"pane": -1, "blocks": [{"start": "00:00", "end": "01:00", "source": "B"}]},
+    ],
+}
+
+
+def test_schedule_parsing():
+    cfg = load_config_from_dict(_CFG_SCHEDULES)
 
     assert len(cfg.schedules) == 2
     first = cfg.schedules[0]
@@ -179,16 +210,20 @@ def test_schedule_parsing(tmp_path: Path):
     assert second.blocks[0].source == "A"
 
 
-def test_missing_config_uses_bundled_defaults(tmp_path: Path, monkeypatch):
-    bundled_payload = {
+_BUNDLED_JSON = json.dumps(
+    {
         "sources": [
             {"type": "browser", "name": "Example", "url": "https://example.com"}
         ],
         "ui": {"start_mode": "single"},
         "kiosk": {"monitor_index": 2},
     }
+).encode()
+
+
+def test_missing_config_uses_bundled_defaults(tmp_path: Path, monkeypatch):
     bundled_path = tmp_path / "bundled.json"
-    bundled_path.write_text(json.dumps(bundled_payload))
+    bundled_path.write_bytes(_BUNDLED_JSON)
 
     monkeypatch.setattr(
         "utils.config_loader.find_bundled_config", lambda: bundled_path
@@ -57,3 +57,9 @@ def test_compute_slot_assignments_fills_unused_slots():
     assert indices[0] == 2
     assert set(indices) == {0, 1, 2}
     assert conflicts
+
+
+def test_compute_slot_assignments_accepts_name_sequence():
+    indices, conflicts = compute_slot_assignments(3, {0: "C", 1: "A", 2: "B"}, ("A", "B", "C"))
+    assert indices == [2, 0, 1]
+    assert not conflicts
@@ -0,0 +1,176 @@
+import pytest
+
+from ui.log_viewer import _LEVELS, LogTailWorker, _count_levels, _iter_lines, _line_level
+
+
+def test_line_level_plain_and_json():
+    assert _line_level("2024-01-01 00:00:00,000 ERROR app: boom") == "ERROR"
+    assert _line_level("WARNING at start") == "WARNING"
+    assert _line_level('{"ts": "x", "level": "debug", "msg": "m"}') == "DEBUG"
+    assert _line_level("no level here") == "INFO"
+
+
+def test_count_levels_counts_one_level_per_line():
+    counts = dict.fromkeys(_LEVELS, 0)
+    data = (
+        b"2024-01-01 00:00:00,000 INFO app: mentions ERROR later\n"
+        b"2024-01-01 00:00:01,000 ERROR app: boom\n"
+        b'{"level": "WARNING", "msg": "w"}\n'
+        b"plain text\n"
+    )
+    _count_levels(data, counts)
+    assert counts == {"DEBUG": 0, "INFO": 1, "WARNING": 1, "ERROR": 1}
+
+
+def test_iter_lines_joins_lines_across_chunks():
+    import io
+
+    data = "erste Zeile\r\nzweite äöü\nletzte".encode("utf-8")
+    lines = list(_iter_lines(io.BytesIO(data), size=3))
+    assert lines == ["erste Zeile", "zweite äöü", "letzte"]
+
+
+def test_tail_worker_emits_complete_lines_and_stats(tmp_path):
+    log = tmp_path / "kiosk.log"
+    log.write_bytes(b"2024 INFO app: a\n2024 ERROR app: b\n2024 WARN")
+    worker = LogTailWorker(str(log), stats=True)
+    got = {}
+    worker.linesReady.connect(lambda lines: got.setdefault("lines", lines))
+    worker.statsReady.connect(lambda stats: got.setdefault("stats", stats))
+
+    worker.poll()
+
+    assert got["lines"] == ["2024 INFO app: a", "2024 ERROR app: b"]
+    assert got["stats"]["counts"]["ERROR"] == 1
+    assert got["stats"]["counts"]["INFO"] == 1
+
+
+def test_line_level_fast_paths_match_regex():
+    from ui.log_viewer import _LEVEL_RE
+
+    def slow(line):
+        m = _LEVEL_RE.search(line)
+        return "INFO" if m is None else (m.group(1) or m.group(2) or m.group(3)).upper()
+
+    lines = [
+        "2024-01-01 00:00:00.000 WARNING app: x | source=a",
+        "2024-01-01 00:00:00.000 warning app: x",
+        "DEBUGGING is not a level ERROR here",
+        "Error: something",
+        "ERROR_CODE 5",
+        "INFO",
+        "a b INFO",
+        "Dummy text",
+        '{"ts": "2024", "level": "ERROR", "msg": "INFO x"}',
+        "2024-01-01\tWarning 00:00:00 info :",
+        '2024"level":"ERROR" 00:00:00 INFO x',
+    ]
+    for line in lines:
+        assert _line_level(line) == slow(line), line
+
+
+def test_count_levels_agrees_with_line_level():
+    from ui.log_viewer import _LEVEL_RE
+
+    lines = [
+        "foo ERROR.",
+        "job WARNING:",
+        "job WARNING: then INFO here",
+        "2024-01-01 00:00:00.000 WARNING app: x | source=a",
+        "2024-01-01 00:00:00.000 warning app: x",
+        "DEBUGGING is not a level ERROR here",
+        "Error: something",
+        "ERROR_CODE 5",
+        "INFO",
+        "a b INFO",
+        "a\tDEBUG\tb",
+        "Dummy text",
+        '{"ts": "2024", "level": "ERROR", "msg": "INFO x"}',
+        '{"level" : "debug"}',
+        "",
+    ]
+    total = dict.fromkeys(_LEVELS, 0)
+    for line in lines:
+        single = dict.fromkeys(_LEVELS, 0)
+        _count_levels(line.encode("utf-8") + b"\n", single)
+        counted = [lvl for lvl, n in single.items() if n]
+        if _LEVEL_RE.search(line) is None:
+            assert counted == [], line
+        else:
+            assert counted == [_line_level(line)], line
+        for lvl, n in single.items():
+            total[lvl] += n
+
+    # ueber den ganzen Block gezaehlt wie Zeile fuer Zeile
+    block = dict.fromkeys(_LEVELS, 0)
+    _count_levels("\n".join(lines).encode("utf-8") + b"\n", block)
+    assert block == total
+
+
+def test_stop_request_interrupts_reading(tmp_path):
+    log = tmp_path / "kiosk.log"
+    log.write_bytes(b"2024 INFO app: a\n" * 1000)
+    worker = LogTailWorker(str(log), stats=True)
+    got = []
+    worker.reloaded.connect(got.append)
+    worker.linesReady.connect(got.append)
+    worker.statsReady.connect(got.append)
+
+    worker.request_stop()
+    worker.reload()
+    worker.poll()
+
+    assert got == []
+    assert worker._pos == 0
+
+
+def test_tail_worker_counts_stats_from_mapped_file(tmp_path):
+    log = tmp_path / "kiosk.log"
+    log.write_bytes(b"2024-01-01 00:00:00.000 Error app: a\nDEBUG x\n2024 INFO app: partial")
+    worker = LogTailWorker(str(log), lines=False, stats=True)
+    got = []
+    worker.statsReady.connect(got.append)
+
+    worker.poll()
+    with open(log, "ab") as f:
+        f.write(b"\nWARNING y\n")
+    worker.poll()
+
+    assert got[0]["counts"] == {"DEBUG": 1, "INFO": 0, "WARNING": 0, "ERROR": 1}
+    assert got[1]["counts"] == {"DEBUG": 1, "INFO": 1, "WARNING": 1, "ERROR": 1}
+
+
+def _open_viewer(tmp_path, monkeypatch):
+    import ui.log_viewer as lv
+
+    log = tmp_path / "kiosk.log"
+    log.write_text("2024 INFO app: a\n")
+    monkeypatch.setattr(lv, "get_log_path", lambda: str(log))
+    return lv, lv.LogViewer()
+
+
+@pytest.mark.qt
+def test_closing_viewer_stops_open_stats_worker(tmp_path, monkeypatch):
+    lv, viewer = _open_viewer(tmp_path, monkeypatch)
+    viewer._open_stats_window()
+    stats = viewer._stats_windows[0]
+    threads = [viewer._tail_thread, stats._tail_thread]
+    assert all(t.isRunning() for t in threads)
+
+    viewer.close()
+
+    assert not any(t.isRunning() for t in threads)
+    assert not any(t is e[0] for t in threads for e in lv._RUNNING_THREADS)
+    assert viewer._stats_windows == []
+
+
+@pytest.mark.qt
+def test_destroyed_owner_stops_worker(tmp_path, monkeypatch):
+    lv, viewer = _open_viewer(tmp_path, monkeypatch)
+    thread = viewer._tail_thread
+
+    # Elternfenster weg: Qt zerstoert den Dialog ohne closeEvent
+    viewer.destroyed.emit()
+
+    assert not thread.isRunning()
+    assert all(e[0] is not thread for e in lv._RUNNING_THREADS)
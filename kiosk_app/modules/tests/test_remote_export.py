@@ -1,26 +1,18 @@
-import time
+import dataclasses
+import threading
 from datetime import datetime, timezone
-from pathlib import Path
 from types import SimpleNamespace
 
 from utils import remote_export as remote_export_module
-from utils.config_loader import RemoteLogDestination, RemoteLogExportSettings
+from utils.config_loader import RemoteLogDestination
 from utils.remote_export import RemoteLogExporter, RemoteExportResult
 
 
-def _create_log(tmp_path: Path) -> Path:
-    log_file = tmp_path / "20240101_1_kiosk.log"
-    log_file.write_text("2024-01-01 00:00:00 INFO bootstrap\n")
-    return log_file
-
-
-def test_remote_export_http_success(tmp_path, monkeypatch):
-    log_file = _create_log(tmp_path)
-    settings = RemoteLogExportSettings(
-        enabled=True,
-        include_history=1,
+def test_remote_export_http_success(tmp_path, monkeypatch, sample_log, base_settings):
+    log_file = sample_log
+    settings = dataclasses.replace(
+        base_settings,
         retention_count=3,
-        staging_dir=str(tmp_path / "exports"),
         destinations=[
             RemoteLogDestination(
                 type="http",
@@ -58,8 +50,8 @@ def test_remote_export_http_success(tmp_path, monkeypatch):
     assert len(archives) == 1
 
 
-def test_remote_export_sftp(monkeypatch, tmp_path):
-    log_file = _create_log(tmp_path)
+def test_remote_export_sftp(monkeypatch, sample_log, base_settings):
+    log_file = sample_log
     uploads = {}
 
     class DummyTransport:
@@ -99,9 +91,8 @@ def test_remote_export_sftp(monkeypatch, tmp_path):
         ),
     )
 
-    settings = RemoteLogExportSettings(
-        enabled=True,
-        include_history=1,
+    settings = dataclasses.replace(
+        base_settings,
         retention_count=2,
         destinations=[
             RemoteLogDestination(
@@ -125,8 +116,8 @@ def test_remote_export_sftp(monkeypatch, tmp_path):
     assert uploads["put"][1] == "/tmp/export.zip"
 
 
-def test_remote_export_email(monkeypatch, tmp_path):
-    log_file = _create_log(tmp_path)
+def test_remote_export_email(monkeypatch, sample_log, base_settings):
+    log_file = sample_log
     sent = {}
 
     class DummySMTP:
@@ -152,9 +143,8 @@ def test_remote_export_email(monkeypatch, tmp_path):
 
     monkeypatch.setattr(remote_export_module.smtplib, "SMTP", DummySMTP)
 
-    settings = RemoteLogExportSettings(
-        enabled=True,
-        include_history=1,
+    settings = dataclasses.replace(
+        base_settings,
         destinations=[
             RemoteLogDestination(
                 type="email",
@@ -183,15 +173,17 @@ def test_remote_export_email(monkeypatch, tmp_path):
     assert attachments[0].get_filename().endswith(".zip")
 
 
-def test_remote_export_schedule(monkeypatch, tmp_path):
-    log_file = _create_log(tmp_path)
-    settings = RemoteLogExportSettings(enabled=True, include_history=1, retention_count=1)
-    exporter = RemoteLogExporter(settings, log_path=log_file)
+def test_remote_export_schedule(monkeypatch, sample_log, base_settings):
+    log_file = sample_log
+    exporter = RemoteLogExporter(base_settings, log_path=log_file)
 
     calls = []
+    done = threading.Event()
 
     def fake_export(reason="manual"):
         calls.append(reason)
+        if reason == "scheduled":
+            done.set()
         return RemoteExportResult(
             archive=log_file,
             files=[log_file],
@@ -206,7 +198,7 @@ def test_remote_export_schedule(monkeypatch, tmp_path):
 
     try:
         exporter.start_periodic_export(interval_seconds=0.05)
-        time.sleep(0.12)
+        assert done.wait(timeout=1.0)
     finally:
         exporter.stop_periodic_export()
 
@@ -6,6 +6,9 @@ class ViewMode(str, Enum):
     SINGLE = "single"
     QUAD = "quad"
 
+# Wert -> Enum ohne Enum.__call__ pro Zugriff
+_MODE_MAP = {v.value: v for v in ViewMode}
+
 @dataclass
 class AppState:
     start_mode: Literal["single","quad"] = "single"
@@ -13,11 +16,15 @@ class AppState:
 
     @property
     def mode(self) -> ViewMode:
-        return ViewMode(self.start_mode)
+        mode = _MODE_MAP.get(self.start_mode)
+        if mode is None:
+            return ViewMode(self.start_mode)  # ValueError wie bisher
+        return mode
 
     def toggle_mode(self):
         self.start_mode = "quad" if self.start_mode == "single" else "single"
 
     def set_active(self, idx: int):
-        self.active_index = max(0, min(3, idx))
+        # reine Vergleiche statt max/min Aufrufe, laeuft bei jedem Tastendruck
+        self.active_index = 0 if idx < 0 else 3 if idx > 3 else idx
 # This module defines the application state for the Kiosk application.
\ No newline at end of file
@@ -1,12 +1,16 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from modules.qt import Qt, QtGui, QtWidgets, QtWebEngineWidgets
+from modules.qt import Qt, QtGui, QtWidgets
 
 QMovie = QtGui.QMovie
 QWidget = QtWidgets.QWidget
 QStackedLayout = QtWidgets.QStackedLayout
 QLabel = QtWidgets.QLabel
-QWebEngineView = QtWebEngineWidgets.QWebEngineView
+
+if TYPE_CHECKING:  # nur fuer Annotationen, die View wird von aussen gesetzt
+    from modules.qt import QtWebEngineWidgets
+
+    QWebEngineView = QtWebEngineWidgets.QWebEngineView
 
 from modules.utils.i18n import tr, i18n
 
@@ -17,7 +21,7 @@ class BrowserHostWidget(QWidget):
         super().__init__(parent)
         self._placeholder_enabled = placeholder_enabled
         self._gif_path = gif_path
-        self._view: Optional[QWebEngineView] = None
+        self._view: Optional["QWebEngineView"] = None
 
         self.stack = QStackedLayout(self)
         self.stack.setContentsMargins(0, 0, 0, 0)
@@ -44,7 +48,7 @@ class BrowserHostWidget(QWidget):
         i18n.language_changed.connect(self._on_language_changed)
         self._apply_translations()
 
-    def set_view(self, view: QWebEngineView):
+    def set_view(self, view: "QWebEngineView"):
         self._view = view
         self.stack.removeWidget(self.stack.widget(1))
         self.stack.insertWidget(1, view)
@@ -55,6 +59,10 @@ class BrowserHostWidget(QWidget):
         if self._placeholder_enabled:
             self.stack.setCurrentIndex(0)
 
+    def show_placeholder_on_error(self, _message: str = ""):
+        """Slot fuer page_error, die Fehlermeldung selbst wird nicht angezeigt."""
+        self.show_placeholder()
+
     def show_view(self):
         self.stack.setCurrentIndex(1)
 
@@ -1,11 +1,18 @@
 # modules/ui/log_viewer.py
 from __future__ import annotations
-from typing import Optional, List
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
+import codecs
+import mmap
 import os
 import re
-from modules.qt import Qt, QtCore, QtGui, QtWidgets
+from collections import Counter, deque
+from modules.qt import Qt, QtCore, QtGui, QtWidgets, Signal, Slot
 
+QCoreApplication = QtCore.QCoreApplication
+QFileSystemWatcher = QtCore.QFileSystemWatcher
+QObject = QtCore.QObject
+QThread = QtCore.QThread
 QTimer = QtCore.QTimer
 QTextCursor = QtGui.QTextCursor
 QDialog = QtWidgets.QDialog
@@ -17,6 +24,7 @@ QLineEdit = QtWidgets.QLineEdit
 QCheckBox = QtWidgets.QCheckBox
 QPushButton = QtWidgets.QPushButton
 QTextEdit = QtWidgets.QTextEdit
+QPlainTextEdit = QtWidgets.QPlainTextEdit
 QFileDialog = QtWidgets.QFileDialog
 QMessageBox = QtWidgets.QMessageBox
 QWidget = QtWidgets.QWidget
@@ -33,6 +41,116 @@ _LEVEL_CHOICES = [
 ]
 
 
+# Obergrenze fuer angezeigte und gepufferte Zeilen, aeltere fallen vorne raus
+_MAX_LINES = 50000
+# Lesepuffer fuer das Log, 64 KB je Systemaufruf
+_CHUNK_SIZE = 65536
+# Statistik im Mapping: so viele Bytes je findall, dazwischen wird ein Stopp geprueft
+_COUNT_STEP = 64 * _CHUNK_SIZE
+# So lange wartet der UI Thread hoechstens auf das Ende eines Workers
+_STOP_WAIT_MS = 2000
+
+_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+# Level am Zeilenanfang, zwischen Leerraum (Plain Format) oder als JSON Feld.
+# [^\S\n] statt \s, damit die Bytes Variante unten nie ueber ein Zeilenende greift.
+_LEVEL_ALT = "DEBUG|INFO|WARNING|ERROR"
+_LEVEL_PATTERN = (
+    rf'^({_LEVEL_ALT})\b'
+    rf'|[ \t]({_LEVEL_ALT})[ \t]'
+    rf'|"level"[^\S\n]*:[^\S\n]*"({_LEVEL_ALT})"'
+)
+_LEVEL_RE = re.compile(_LEVEL_PATTERN, re.IGNORECASE)
+# Statistik: dieselben Regeln, vor den ersten Treffer je Zeile ein nicht gieriger Praefix.
+# ^ im MULTILINE Modus erlaubt so hoechstens einen Treffer pro Zeile, und der Treffer ist
+# derselbe, den _LEVEL_RE.search auf der Zeile findet. findall zaehlt in C ueber den ganzen Block.
+_LEVEL_LINE_RE_B = re.compile(
+    rb"^[^\n]*?(?:" + _LEVEL_PATTERN.encode("ascii") + rb")",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+# Anfangsbuchstabe in beiden Schreibweisen, damit pro Zeile kein upper() noetig ist
+_LEVEL_BY_INITIAL = {**{lvl[0]: lvl for lvl in _LEVELS}, **{lvl[0].lower(): lvl for lvl in _LEVELS}}
+_LEVEL_SET = frozenset(_LEVELS)
+_FAST_PATH_BREAKERS = frozenset('\t"')
+
+
+def _line_level(line: str) -> str:
+    # Schnellweg: Level am Zeilenanfang, erkannt am ersten Zeichen
+    lvl = _LEVEL_BY_INITIAL.get(line[:1])
+    if lvl is not None:
+        n = len(lvl)
+        nxt = line[n:n + 1]
+        if (line.startswith(lvl) or line[:n].upper() == lvl) and not (nxt.isalnum() or nxt == "_"):
+            return lvl
+    # Schnellweg: Plain Format "datum zeit LEVEL name: ..."; der Logger schreibt Gross
+    parts = line.split(" ", 3)
+    # Tab oder Anfuehrungszeichen davor koennten schon einen frueheren Regex Treffer bilden
+    if (len(parts) == 4 and parts[0][:1].isdigit() and parts[1][:1].isdigit()
+            and not _FAST_PATH_BREAKERS.intersection(parts[0] + parts[1])):
+        head = parts[2]
+        if head in _LEVEL_SET:
+            return head
+        head = head.upper()
+        if head in _LEVEL_SET:
+            return head
+    m = _LEVEL_RE.search(line)
+    if m is None:
+        return "INFO"  # neutrale Vorgabe
+    return (m.group(1) or m.group(2) or m.group(3)).upper()
+
+
+def _count_levels(data, counts: Dict[str, int], pos: int = 0, endpos: Optional[int] = None) -> None:
+    """Zaehlt Level in vollstaendigen Zeilen und addiert sie auf counts.
+
+    data darf bytes oder ein mmap sein; pos muss auf einem Zeilenanfang liegen.
+    """
+    if endpos is None:
+        endpos = len(data)
+    # wenige verschiedene Treffer (Gruppe und Gross/Klein Variante), erst danach normalisieren
+    for groups, n in Counter(_LEVEL_LINE_RE_B.findall(data, pos, endpos)).items():
+        key = groups[0] or groups[1] or groups[2]
+        counts[key.decode("ascii").upper()] += n
+
+
+class _TailStopped(Exception):
+    """Lesen abgebrochen, weil der Worker beendet wird."""
+
+
+def _read_chunks(f, size: int = _CHUNK_SIZE, stop: Optional[Callable[[], bool]] = None) -> bytes:
+    """Liest ab der aktuellen Position bis EOF in festen Bloecken. stop() wird je Block geprueft."""
+    buf = bytearray()
+    read = f.read
+    while True:
+        if stop is not None and stop():
+            raise _TailStopped()
+        chunk = read(size)
+        if not chunk:
+            return bytes(buf)
+        buf += chunk
+
+
+def _iter_lines(f, size: int = _CHUNK_SIZE, stop: Optional[Callable[[], bool]] = None) -> Iterator[str]:
+    """Zeilen blockweise dekodieren, ohne die ganze Datei als bytes und str zu halten."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    tail = ""
+    read = f.read
+    while True:
+        if stop is not None and stop():
+            raise _TailStopped()
+        chunk = read(size)
+        if not chunk:
+            break
+        text = tail + decoder.decode(chunk)
+        lines = text.splitlines()
+        # angebrochene letzte Zeile (auch ein getrenntes \r\n) in den naechsten Block mitnehmen
+        tail = lines.pop() if lines and not text.endswith("\n") else ""
+        yield from lines
+    text = tail + decoder.decode(b"", final=True)
+    if text:
+        yield from text.splitlines()
+
+
 def _human_size(n: int) -> str:
     units = ["B", "KB", "MB", "GB", "TB"]
     size = float(max(0, n))
@@ -45,9 +163,227 @@ def _human_size(n: int) -> str:
     return f"{size:.2f} {units[idx]}"
 
 
+class LogTailWorker(QObject):
+    """Liest das Log in einem eigenen Thread; die UI bekommt nur fertige Zeilen bzw. Zaehler.
+
+    Lebt per moveToThread in einem QThread, Watcher und Timer werden erst in start()
+    und damit im Worker Thread angelegt. Gelesen wird auf fileChanged; der langsame
+    Timer haengt den Pfad nach Rotation wieder an und faengt verpasste Events ab.
+    Signale an die UI laufen ueber Thread Grenzen automatisch als QueuedConnection.
+    """
+
+    linesReady = Signal(list)
+    reloaded = Signal(list)
+    truncated = Signal()
+    statsReady = Signal(dict)
+
+    def __init__(self, path: str, interval_ms: int = 2000, lines: bool = True, stats: bool = False):
+        super().__init__()
+        self._path = path
+        self._interval = interval_ms
+        self._lines = lines
+        self._stats = stats
+        self._pos = 0
+        self._counts: Dict[str, int] = dict.fromkeys(_LEVELS, 0)
+        self._timer: Optional[QTimer] = None
+        self._kick: Optional[QTimer] = None
+        self._watcher: Optional[QFileSystemWatcher] = None
+        self.paused = False  # wird aus dem UI Thread gesetzt, ein bool reicht
+        self._stop_requested = False  # ebenso; bricht laufendes Lesen zwischen zwei Bloecken ab
+
+    def request_stop(self) -> None:
+        """Aus dem UI Thread: laufendes Lesen beim naechsten Block beenden."""
+        self._stop_requested = True
+
+    def _stopping(self) -> bool:
+        return self._stop_requested
+
+    # @Slot: unter PyQt6 laufen undekorierte Slots sonst im Thread, in dem verbunden wurde
+    @Slot()
+    def start(self) -> None:
+        # fileChanged kann pro Schreibvorgang kommen, daher kurz sammeln
+        self._kick = QTimer(self)
+        self._kick.setSingleShot(True)
+        self._kick.setInterval(50)
+        self._kick.timeout.connect(self.poll)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._timer = QTimer(self)
+        self._timer.setInterval(self._interval)
+        self._timer.timeout.connect(self._check_watch)
+        self._timer.start()
+        self._watch()
+        if self._lines:
+            self.reload()
+        else:
+            self.poll()
+
+    def _watch(self) -> None:
+        watcher = self._watcher
+        if watcher is not None and self._path not in watcher.files() and os.path.exists(self._path):
+            watcher.addPath(self._path)
+
+    def _on_file_changed(self, _path: str) -> None:
+        if not self._kick.isActive():
+            self._kick.start()
+
+    def _check_watch(self) -> None:
+        # nach Rotation oder Neuanlage faellt die Datei aus dem Watcher
+        self._watch()
+        self.poll()
+
+    @Slot()
+    def reload(self) -> None:
+        """Komplette Datei lesen, nur die letzten _MAX_LINES Zeilen gehen an die UI."""
+        if self._stop_requested:
+            return
+        lines: deque = deque(maxlen=_MAX_LINES)
+        pos = 0
+        try:
+            with open(self._path, "rb", buffering=_CHUNK_SIZE) as f:
+                lines.extend(_iter_lines(f, stop=self._stopping))
+                pos = f.tell()
+        except _TailStopped:
+            return
+        except Exception:
+            pass
+        self._pos = pos
+        self.reloaded.emit(list(lines))
+
+    @Slot()
+    def poll(self) -> None:
+        """Neuen Anhang lesen; nur vollstaendige Zeilen, der Rest folgt beim naechsten Tick."""
+        if self.paused or self._stop_requested:
+            return
+        try:
+            size = os.stat(self._path).st_size
+        except FileNotFoundError:
+            self._reset()
+            if self._stats:
+                self.statsReady.emit({"missing": True})
+            return
+        except Exception as ex:
+            if self._stats:
+                self.statsReady.emit({"error": str(ex)})
+            return
+        if size < self._pos:
+            # Datei geleert oder rotiert: von vorne lesen
+            self._reset()
+            self.truncated.emit()
+        if size > self._pos and not self._lines:
+            try:
+                self._count_mapped()
+            except Exception as ex:
+                self.statsReady.emit({"error": str(ex)})
+                return
+        elif size > self._pos:
+            try:
+                with open(self._path, "rb", buffering=_CHUNK_SIZE) as f:
+                    f.seek(self._pos)
+                    data = _read_chunks(f, stop=self._stopping)
+            except _TailStopped:
+                return
+            except Exception as ex:
+                if self._stats:
+                    self.statsReady.emit({"error": str(ex)})
+                return
+            end = data.rfind(b"\n") + 1
+            if end:
+                data = data[:end]
+                self._pos += end
+                if self._stats:
+                    _count_levels(data, self._counts)
+                if self._lines:
+                    new_lines = data.decode("utf-8", errors="ignore").splitlines()
+                    if new_lines:
+                        self.linesReady.emit(new_lines)
+        if self._stats:
+            self.statsReady.emit({"size": size, "counts": dict(self._counts)})
+
+    def _count_mapped(self) -> None:
+        """Nur Statistik: Datei mappen und direkt im Mapping zaehlen, ohne Kopie des Anhangs."""
+        with open(self._path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = mm.rfind(b"\n", self._pos) + 1
+                # abschnittsweise an Zeilengrenzen, damit ein Stopp nicht den ganzen Anhang abwarten muss
+                while self._pos < end and not self._stop_requested:
+                    step_end = self._pos + _COUNT_STEP
+                    if step_end < end:
+                        step_end = mm.find(b"\n", step_end - 1, end) + 1
+                    else:
+                        step_end = end
+                    _count_levels(mm, self._counts, self._pos, step_end)
+                    self._pos = step_end
+
+    def _reset(self) -> None:
+        self._counts = dict.fromkeys(_LEVELS, 0)
+        self._pos = 0
+
+
+# Laufende Worker Threads mit ihrem Worker. Bewusst ohne Qt Eltern, ein noch laufender QThread
+# darf nie mit seinem Dialog zerstoert werden (qFatal). Die Liste haelt sie am Leben, bis sie
+# wirklich beendet sind.
+_RUNNING_THREADS: List[Tuple[QThread, LogTailWorker]] = []
+_quit_hooked = False
+
+
+def _prune_finished() -> None:
+    # Threads, die nach dem begrenzten Warten noch liefen, erst hier loslassen
+    _RUNNING_THREADS[:] = [e for e in _RUNNING_THREADS if not e[0].isFinished()]
+
+
+def _start_worker(worker: LogTailWorker, owner: QObject) -> QThread:
+    """Worker in eigenen Thread schieben und starten. Signale vorher verbinden."""
+    _prune_finished()
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.started.connect(worker.start)
+    thread.finished.connect(worker.deleteLater)
+    _RUNNING_THREADS.append((thread, worker))
+    # Besitzer ohne closeEvent zerstoert (Elternfenster zu) oder App beendet: Thread trotzdem stoppen
+    owner.destroyed.connect(lambda *_args, t=thread: _stop_worker(t))
+    _hook_app_quit()
+    thread.start()
+    return thread
+
+
+def _stop_worker(thread: Optional[QThread]) -> None:
+    if thread is None:
+        return
+    for entry in _RUNNING_THREADS:
+        if entry[0] is thread:
+            entry[1].request_stop()
+    try:
+        thread.quit()
+        # begrenzt warten; ein laufender Lesevorgang bricht am naechsten Block ab
+        if not thread.wait(_STOP_WAIT_MS):
+            return   # bleibt in _RUNNING_THREADS, bis _prune_finished ihn beendet sieht
+    except Exception:
+        pass
+    _RUNNING_THREADS[:] = [e for e in _RUNNING_THREADS if e[0] is not thread]
+
+
+def _stop_all_workers() -> None:
+    for thread, _worker in list(_RUNNING_THREADS):
+        _stop_worker(thread)
+
+
+def _hook_app_quit() -> None:
+    global _quit_hooked
+    if _quit_hooked:
+        return
+    app = QCoreApplication.instance()
+    if app is None:
+        return
+    app.aboutToQuit.connect(_stop_all_workers)
+    _quit_hooked = True
+
+
 class LogStatsDialog(QDialog):
     """Live Log Statistik mit Dateigroesse und Level Zaehlern."""
 
+    pollRequested = Signal()
+
     def __init__(self, log_path: str, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._path = log_path
@@ -70,13 +406,15 @@ class LogStatsDialog(QDialog):
         btns.addWidget(self.btn_close)
         layout.addLayout(btns)
 
-        self._timer = QTimer(self)
-        self._timer.setInterval(1000)
-        self._timer.timeout.connect(self._refresh)
-        self._timer.start()
-
         i18n.language_changed.connect(self._handle_language_changed)
-        self._refresh()
+        self.lbl_info.setText(tr("File: {path}", path=log_path))
+
+        # Zaehler wachsen im Worker mit der Datei, gelesen wird nur der neue Anhang
+        self._tail = LogTailWorker(log_path, lines=False, stats=True)
+        self._tail.statsReady.connect(self._on_stats)
+        self.pollRequested.connect(self._tail.poll)
+        self._tail.paused = True   # erst ab showEvent lesen
+        self._tail_thread = _start_worker(self._tail, self)
 
     def _apply_translations(self):
         self.setWindowTitle(tr("Log Statistics"))
@@ -85,60 +423,59 @@ class LogStatsDialog(QDialog):
     def _handle_language_changed(self, _lang: str) -> None:
         self._apply_translations()
 
+    # versteckt (minimiert, Elternfenster zu) kein Lesen; beim Zeigen sofort nachziehen
+    def showEvent(self, ev):
+        self._tail.paused = False
+        self.pollRequested.emit()
+        super().showEvent(ev)
+
+    def hideEvent(self, ev):
+        self._tail.paused = True
+        super().hideEvent(ev)
+
     def closeEvent(self, ev):
-        try:
-            self._timer.stop()
-        except Exception:
-            pass
+        self._stop_tail()
         super().closeEvent(ev)
 
-    def _refresh(self):
+    def done(self, result):
+        # Escape/reject schliesst ohne closeEvent
+        self._stop_tail()
+        super().done(result)
+
+    def _stop_tail(self) -> None:
+        thread, self._tail_thread = self._tail_thread, None
+        _stop_worker(thread)
+
+    def _on_stats(self, stats: dict) -> None:
         path = self._path
-        info = warn = err = dbg = 0
-        size = 0
-        exists = os.path.isfile(path)
-        if exists:
-            try:
-                size = os.path.getsize(path)
-            except Exception:
-                size = 0
-        try:
-            if exists:
-                with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                    for line in f:
-                        u = line.upper()
-                        if " DEBUG " in u or u.startswith("DEBUG") or '"LEVEL": "DEBUG"' in u:
-                            dbg += 1
-                        elif " INFO " in u or u.startswith("INFO") or '"LEVEL": "INFO"' in u:
-                            info += 1
-                        elif " WARNING " in u or u.startswith("WARNING") or '"LEVEL": "WARNING"' in u:
-                            warn += 1
-                        elif " ERROR " in u or u.startswith("ERROR") or '"LEVEL": "ERROR"' in u:
-                            err += 1
-            total = info + warn + err + dbg
+        self.lbl_info.setText(tr("File: {path}", path=path))
+        if stats.get("missing"):
+            text = tr("No log file found")
+        elif "error" in stats:
+            text = tr("Error reading log file:\n{ex}", ex=stats["error"])
+        else:
+            counts = stats["counts"]
+            size = stats["size"]
+            total = sum(counts.values())
             human = _human_size(size)
-            self.lbl_info.setText(tr("File: {path}", path=path))
             text_lines = [
                 tr("Size: {human} ({bytes} Bytes)", human=human, bytes=size),
                 tr("Total: {count}", count=total),
-                tr("Info: {count}", count=info),
-                tr("Warning: {count}", count=warn),
-                tr("Error: {count}", count=err),
-                tr("Debug: {count}", count=dbg),
+                tr("Info: {count}", count=counts["INFO"]),
+                tr("Warning: {count}", count=counts["WARNING"]),
+                tr("Error: {count}", count=counts["ERROR"]),
+                tr("Debug: {count}", count=counts["DEBUG"]),
             ]
             text = "\n".join(text_lines)
-        except FileNotFoundError:
-            self.lbl_info.setText(tr("File: {path}", path=path))
-            text = tr("No log file found")
-        except Exception as ex:
-            self.lbl_info.setText(tr("File: {path}", path=path))
-            text = tr("Error reading log file:\n{ex}", ex=ex)
-
         self.view.setPlainText(text)
 
 
 class LogViewer(QDialog):
     """Einfacher Log Viewer mit Filtern und Live Update."""
+
+    reloadRequested = Signal()
+    pollRequested = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle(tr("Logs"))
@@ -146,9 +483,12 @@ class LogViewer(QDialog):
         self.setMinimumSize(800, 480)
 
         self._path = get_log_path()
-        self._buffer: List[str] = []   # Rohzeilen fuer Refilter
-        self._file_pos = 0
+        self._buffer: deque = deque(maxlen=_MAX_LINES)   # Rohzeilen fuer Refilter
+        self._folded: deque = deque(maxlen=_MAX_LINES)   # parallel dazu casefold(), fuer die Suche ohne Gross/Klein
+        self._joined_cache: Optional[str] = None   # ungefilterter Text, None sobald sich der Puffer aendert
         self._paused = False
+        self._hidden = True   # bis zum ersten showEvent
+        self._stats_windows: List[LogStatsDialog] = []
 
         # Kopfzeile mit Filtern
         top = QHBoxLayout()
@@ -185,18 +525,25 @@ class LogViewer(QDialog):
         top.addWidget(self.btn_stats)
 
         # Textansicht
-        self.view = QTextEdit(self)
+        self.view = QPlainTextEdit(self)
         self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(_MAX_LINES)
 
         root = QVBoxLayout(self)
         root.addLayout(top)
         root.addWidget(self.view, 1)
 
+        # Suchfeld entprellen: erst nach kurzer Tipp Pause neu rendern
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filters_now)
+
         # Events
-        self.level_combo.currentIndexChanged.connect(self._apply_filters)
-        self.search_edit.textChanged.connect(self._apply_filters)
-        self.regex_cb.toggled.connect(self._apply_filters)
-        self.case_cb.toggled.connect(self._apply_filters)
+        self.level_combo.currentIndexChanged.connect(self._apply_filters_now)
+        self.search_edit.textChanged.connect(self._schedule_filters)
+        self.regex_cb.toggled.connect(self._apply_filters_now)
+        self.case_cb.toggled.connect(self._apply_filters_now)
         self.auto_cb.toggled.connect(self._toggle_auto)
         self.pause_cb.toggled.connect(self._toggle_pause)
         self.btn_refresh.clicked.connect(self._reload_all)
@@ -206,14 +553,22 @@ class LogViewer(QDialog):
 
         i18n.language_changed.connect(self._handle_language_changed)
         self._apply_translations()
-
-        # Timer Polling
-        self._timer = QTimer(self)
-        self._timer.setInterval(500)
-        self._timer.timeout.connect(self._poll_append)
-        self._timer.start()
-
-        # Live Bridge
+        self._rebuild_filter()
+
+        # Datei wird im Worker Thread gelesen, hier kommen nur fertige Zeilen an
+        self._tail = LogTailWorker(self._path)
+        self._tail.linesReady.connect(self._poll_append)
+        self._tail.reloaded.connect(self._on_reloaded)
+        self._tail.truncated.connect(self._on_truncated)
+        self.reloadRequested.connect(self._tail.reload)
+        self.pollRequested.connect(self._tail.poll)
+
+        # Live Bridge, Zeilen werden gesammelt und alle 30 ms gebuendelt angehaengt
+        self._pending: deque = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(30)
+        self._flush_timer.timeout.connect(self._flush_pending)
         try:
             bridge = get_log_bridge()
             if bridge is not None:
@@ -221,8 +576,9 @@ class LogViewer(QDialog):
         except Exception:
             pass
 
-        # Initial laden
-        self._reload_all()
+        # Initial laden uebernimmt der Worker beim Start, Anhaenge erst ab showEvent
+        self._sync_tail_paused()
+        self._tail_thread = _start_worker(self._tail, self)
 
     # ---------- Bedienung ----------
     def _toggle_auto(self, _checked: bool):
@@ -230,6 +586,11 @@ class LogViewer(QDialog):
 
     def _toggle_pause(self, checked: bool):
         self._paused = bool(checked)
+        self._sync_tail_paused()
+
+    def _sync_tail_paused(self) -> None:
+        # Worker liest nur, solange der Viewer sichtbar und nicht pausiert ist
+        self._tail.paused = self._paused or self._hidden
 
     def _open_external(self):
         path = self._path
@@ -252,122 +613,176 @@ class LogViewer(QDialog):
         try:
             with open(self._path, "w", encoding="utf-8") as f:
                 f.write("")
-            self._buffer.clear()
-            self._file_pos = 0
-            self.view.clear()
+            self._on_truncated()
+            self._reload_all()
         except Exception as ex:
             QMessageBox.warning(self, tr("Info"), tr("The log file could not be cleared:\n{ex}", ex=ex))
 
+    def showEvent(self, ev):
+        self._hidden = False
+        self._sync_tail_paused()
+        self.pollRequested.emit()
+        super().showEvent(ev)
+
+    def hideEvent(self, ev):
+        self._hidden = True
+        self._sync_tail_paused()
+        super().hideEvent(ev)
+
+    def closeEvent(self, ev):
+        self._shutdown()
+        super().closeEvent(ev)
+
+    def done(self, result):
+        # Escape/reject schliesst ohne closeEvent
+        self._shutdown()
+        super().done(result)
+
+    def _shutdown(self) -> None:
+        # offene Statistikfenster sind Kinder des Viewers und wuerden sonst ohne closeEvent zerstoert
+        windows, self._stats_windows = self._stats_windows, []
+        for dlg in windows:
+            try:
+                dlg.close()
+            except RuntimeError:
+                pass   # bereits vom Benutzer geschlossen und geloescht
+        thread, self._tail_thread = self._tail_thread, None
+        _stop_worker(thread)
+
     def _reload_all(self):
-        """Komplette Datei neu laden und anzeigen."""
-        self._buffer.clear()
-        self._file_pos = 0
-        try:
-            if os.path.isfile(self._path):
-                with open(self._path, "r", encoding="utf-8", errors="ignore") as f:
-                    data = f.read()
-                self._buffer = data.splitlines()
-                self._file_pos = len(data.encode("utf-8", errors="ignore"))
-        except Exception:
-            pass
+        """Komplette Datei im Worker neu laden, Anzeige folgt in _on_reloaded."""
+        self.reloadRequested.emit()
+
+    def _on_reloaded(self, lines: List[str]) -> None:
+        self._clear_buffer()
+        self._extend_buffer(lines)
         self._render_all()
 
-    def _poll_append(self):
-        """Neuen Anhang von der Datei lesen."""
+    def _on_truncated(self) -> None:
+        self._clear_buffer()
+        self.view.clear()
+
+    def _clear_buffer(self) -> None:
+        self._buffer.clear()
+        self._folded.clear()
+        self._joined_cache = None
+
+    def _extend_buffer(self, lines: List[str]) -> List[str]:
+        """Rohzeilen und ihre casefold() Fassung gemeinsam puffern, gleiche maxlen haelt sie deckungsgleich."""
+        folded = [ln.casefold() for ln in lines]
+        self._buffer.extend(lines)
+        self._folded.extend(folded)
+        self._joined_cache = None
+        return folded
+
+    def _poll_append(self, new_lines: List[str]):
+        """Neue Zeilen aus dem Worker uebernehmen."""
         if self._paused:
             return
-        try:
-            if not os.path.isfile(self._path):
-                return
-            with open(self._path, "rb") as f:
-                f.seek(self._file_pos)
-                chunk = f.read()
-                if not chunk:
-                    return
-                self._file_pos += len(chunk)
-                text = chunk.decode("utf-8", errors="ignore")
-                new_lines = text.splitlines()
-                if not new_lines:
-                    return
-                self._buffer.extend(new_lines)
-                # Nur neue Zeilen reinfiltern und an View anhaengen
-                to_add = [ln for ln in new_lines if self._passes_filters(ln)]
-                if to_add:
-                    cursor = self.view.textCursor()
-                    cursor.movePosition(QTextCursor.End)
-                    self.view.setTextCursor(cursor)
-                    self.view.append("\n".join(to_add))
-                    if self.auto_cb.isChecked():
-                        cursor = self.view.textCursor()
-                        cursor.movePosition(QTextCursor.End)
-                        self.view.setTextCursor(cursor)
-        except Exception:
-            # still sein, Viewer soll robust sein
-            pass
+        self._add_lines(new_lines)
+
+    def _add_lines(self, new_lines: List[str]) -> None:
+        folded = self._extend_buffer(new_lines)
+        # Nur neue Zeilen reinfiltern und an View anhaengen
+        if self._filter_active:
+            to_add = [ln for ln, fl in zip(new_lines, folded) if self._passes_filters(ln, fl)]
+        else:
+            to_add = new_lines
+        if to_add:
+            self._append_lines(to_add)
 
     def _on_bridge_line(self, line: str):
         """Live Zeile aus Logger Bridge. Auch in Datei Poll moeglich, daher doppelt egal."""
         if self._paused:
             return
-        self._buffer.append(line)
-        if self._passes_filters(line):
-            cursor = self.view.textCursor()
+        # sammeln und gebuendelt einfuegen, bei vielen Zeilen pro Sekunde ein Update statt vieler
+        self._pending.append(line)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        lines = list(self._pending)
+        self._pending.clear()
+        self._add_lines(lines)
+
+    def _append_lines(self, lines: List[str]) -> None:
+        """Zeilen in einem Rutsch ans Ende haengen, Neuzeichnen erst danach."""
+        view = self.view
+        view.setUpdatesEnabled(False)
+        try:
+            view.appendPlainText("\n".join(lines))
+        finally:
+            view.setUpdatesEnabled(True)
+        if self.auto_cb.isChecked():
+            cursor = view.textCursor()
             cursor.movePosition(QTextCursor.End)
-            self.view.setTextCursor(cursor)
-            self.view.append(line)
-            if self.auto_cb.isChecked():
-                cursor = self.view.textCursor()
-                cursor.movePosition(QTextCursor.End)
-                self.view.setTextCursor(cursor)
+            view.setTextCursor(cursor)
 
     # ---------- Filtern und Rendern ----------
     def _render_all(self):
-        filtered = [ln for ln in self._buffer if self._passes_filters(ln)]
-        self.view.setPlainText("\n".join(filtered))
+        if self._filter_active:
+            passes = self._passes_filters
+            text = "\n".join([ln for ln, fl in zip(self._buffer, self._folded) if passes(ln, fl)])
+        else:
+            text = self._joined_cache
+            if text is None:
+                text = self._joined_cache = "\n".join(self._buffer)
+        self.view.setPlainText(text)
         if self.auto_cb.isChecked():
             cursor = self.view.textCursor()
             cursor.movePosition(QTextCursor.End)
             self.view.setTextCursor(cursor)
 
-    def _apply_filters(self):
+    def _schedule_filters(self, _text: str = "") -> None:
+        self._filter_timer.start()
+
+    def _apply_filters_now(self, *_args) -> None:
+        self._filter_timer.stop()
+        self._rebuild_filter()
         self._render_all()
 
-    def _passes_filters(self, line: str) -> bool:
+    def _rebuild_filter(self) -> None:
+        """Filterzustand einmal pro Aenderung aus den Widgets lesen und Regex kompilieren."""
+        self._lvl_sel = (self.level_combo.currentData() or "ALL").upper()
+        patt = self.search_edit.text().strip()
+        case = self.case_cb.isChecked()
+        self._case = case
+        self._regex_mode = bool(patt) and self.regex_cb.isChecked()
+        self._re: Optional[re.Pattern[str]] = None
+        self._needle = ""
+        if self._regex_mode:
+            try:
+                self._re = re.compile(patt, 0 if case else re.IGNORECASE)
+            except re.error:
+                # ungueltige Regex behandelt wie kein Treffer
+                self._re = None
+        elif patt:
+            self._needle = patt if case else patt.casefold()
+        # ohne Level- und Textfilter passiert jede Zeile, Filterlauf sparen
+        self._filter_active = self._lvl_sel != "ALL" or bool(patt)
+
+    def _passes_filters(self, line: str, folded: Optional[str] = None) -> bool:
         # Level Filter
-        lvl_sel = (self.level_combo.currentData() or "ALL").upper()
+        lvl_sel = self._lvl_sel
         if lvl_sel != "ALL":
-            if self._line_level(line) != lvl_sel:
+            if _line_level(line) != lvl_sel:
                 return False
         # Text Filter
-        patt = self.search_edit.text().strip()
-        if patt:
-            if self.regex_cb.isChecked():
-                flags = 0 if self.case_cb.isChecked() else re.IGNORECASE
-                try:
-                    if not re.search(patt, line, flags=flags):
-                        return False
-                except re.error:
-                    # ungueltige Regex behandelt wie kein Treffer
-                    return False
+        if self._regex_mode:
+            rx = self._re
+            return rx is not None and rx.search(line) is not None
+        needle = self._needle
+        if needle:
+            if self._case:
+                hay = line
             else:
-                hay = line if self.case_cb.isChecked() else line.lower()
-                needle = patt if self.case_cb.isChecked() else patt.lower()
-                if needle not in hay:
-                    return False
+                hay = folded if folded is not None else line.casefold()
+            if needle not in hay:
+                return False
         return True
 
-    def _line_level(self, line: str) -> str:
-        u = line.upper()
-        if '"LEVEL": "DEBUG"' in u or " DEBUG " in u or u.startswith("DEBUG"):
-            return "DEBUG"
-        if '"LEVEL": "INFO"' in u or " INFO " in u or u.startswith("INFO"):
-            return "INFO"
-        if '"LEVEL": "WARNING"' in u or " WARNING " in u or u.startswith("WARNING"):
-            return "WARNING"
-        if '"LEVEL": "ERROR"' in u or " ERROR " in u or u.startswith("ERROR"):
-            return "ERROR"
-        return "INFO"  # neutrale Vorgabe
-
     def _apply_translations(self):
         self.setWindowTitle(tr("Logs"))
         self.lbl_level.setText(tr("Level"))
@@ -391,4 +806,12 @@ class LogViewer(QDialog):
         dlg = LogStatsDialog(self._path, self)
         dlg.setModal(False)
         dlg.setAttribute(Qt.WA_DeleteOnClose, True)
+        self._stats_windows.append(dlg)
+        dlg.finished.connect(lambda _result, d=dlg: self._forget_stats_window(d))
         dlg.show()
+
+    def _forget_stats_window(self, dlg: LogStatsDialog) -> None:
+        try:
+            self._stats_windows.remove(dlg)
+        except ValueError:
+            pass
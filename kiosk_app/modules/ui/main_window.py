@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import copy
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from modules.qt import Qt, QtCore, QtGui, QtWidgets, Signal, Slot
 
 QTimer = QtCore.QTimer
+QEvent = QtCore.QEvent
 QKeySequence = QtGui.QKeySequence
 QMainWindow = QtWidgets.QMainWindow
 QWidget = QtWidgets.QWidget
@@ -36,9 +37,10 @@ from modules.utils.config_loader import (
     Config,
     SourceSpec,
     save_config,
-    load_config,
+    load_config_from_dict,
     DEFAULT_SHORTCUTS,
     parse_schedule_definitions,
+    shortcut_map,
 )
 from modules.utils.logger import get_logger, init_logging
 from modules.utils.i18n import tr, i18n
@@ -47,17 +49,62 @@ from modules.version import __version__
 
 
 def _clear_layout(layout):
-    while layout.count():
-        item = layout.takeAt(0)
-        w = item.widget()
+    # von hinten abbauen, takeAt(0) verschiebt bei jedem Schritt die restlichen Eintraege
+    for i in range(layout.count() - 1, -1, -1):
+        item = layout.takeAt(i)
+        w = item.widget() if item is not None else None
         if w:
-            w.setParent(None)
+            # Widget wird direkt wieder eingehaengt, Umparenten ist unnoetig
+            w.hide()
+
+
+_THEME_STYLESHEETS = {
+    "light": """
+                QWidget { background: #f4f4f4; color: #202020; }
+                QToolButton, QPushButton { background: #ffffff; border: 1px solid #d0d0d0; padding: 6px; }
+                QLineEdit { background: #ffffff; border: 1px solid #d0d0d0; padding: 4px; }
+                QCheckBox::indicator { width: 16px; height: 16px; border: 1px solid #999; background: #fff; }
+                QCheckBox::indicator:checked { background: #0078d4; image: none; }
+            """,
+    "dark": """
+                QWidget { background: #121212; color: #e0e0e0; }
+                QToolButton, QPushButton { background: #1f1f1f; border: 1px solid #2a2a2a; padding: 6px; }
+                QLineEdit { background: #1b1b1b; border: 1px solid #2a2a2a; padding: 4px; }
+                QCheckBox::indicator { width: 16px; height: 16px; border: 1px solid #5a5a5a; background: #2a2a2a; }
+                QCheckBox::indicator:checked { background: #3b82f6; image: none; border: 1px solid #3b82f6; }
+            """,
+}
+
+
+def _optional_str(value) -> Optional[str]:
+    if not value:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+# Schluessel, ueber die eine Config Quellen definieren kann (neues und altes Format)
+_SOURCE_KEYS = ("sources", "browser_urls", "local_app")
+
+
+def _declares_sources(raw: dict) -> bool:
+    if any(raw.get(k) for k in _SOURCE_KEYS):
+        return True
+    count = raw.get("count")
+    if not isinstance(count, (int, float, str)):
+        return False
+    try:
+        return int(count) > 0
+    except (ValueError, OverflowError):
+        return False
+
 
 def _attach(widget: QWidget, host_layout):
     widget.setParent(host_layout.parentWidget())
     host_layout.addWidget(widget)
     widget.show()
 
+
 class MainWindow(QMainWindow):
     request_quit = Signal()
     initial_load_finished = Signal()
@@ -69,6 +116,7 @@ class MainWindow(QMainWindow):
         self.log = get_logger(__name__)
         self.setObjectName("MainWindow")
         self._auto_update_service: Optional[AutoUpdateService] = None
+        self._save_executor: Optional[ThreadPoolExecutor] = None
 
         if config_path is not None:
             self.cfg_path = Path(config_path).resolve()
@@ -83,20 +131,27 @@ class MainWindow(QMainWindow):
         self.num_sources = len(self.sources)
         self._display_indices: List[int] = list(range(self.num_sources))
         self._source_index_by_name: Dict[str, int] = {s.name: idx for idx, s in enumerate(self.sources)}
+        self._source_titles: List[str] = [s.name for s in self.sources]
         self._scheduler: Optional[ContentScheduler] = None
         self._schedule_timer: Optional[QTimer] = None
         self.current_page = 0
         self.page_size = 4
+        self._max_page = max(0, (self.num_sources - 1) // self.page_size)
         if not self.cfg.ui.split_enabled:
             self.state.start_mode = "single"
 
-        # Widgets fuer Quellen
-        self.source_widgets: List[QWidget] = []
+        # Widgets fuer Quellen; Browser Slots bleiben None, bis sie das erste Mal angezeigt werden
+        self.source_widgets: List[QWidget | None] = []
         self.browser_services: List[BrowserService | None] = []
+        # Browser Services und lokale Apps mit start/stop/heartbeat, waechst mit _ensure_widget
+        self._all_services: List[BrowserService | LocalAppWidget] = []
+        self._services_started = False
+        self._local_app_indices: Set[int] = set()
         self._create_source_widgets()
 
         # Initiales Lade-Tracking
-        self._initial_loading_flags: List[bool] = []
+        self._initial_ready_mask = 0     # Bit i gesetzt = Quelle i bereit
+        self._initial_ready_target = 0
         self._initial_loading_timer: Optional[QTimer] = None
         self._initial_loading_complete = False
         self._setup_initial_loading_tracker()
@@ -109,8 +164,14 @@ class MainWindow(QMainWindow):
 
         self.grid = QWidget(self)
         self.grid_layout = QGridLayout(self.grid)
+        self._quad_attached: Optional[tuple] = None   # (Seite, Quellindizes) der aktuell im Raster haengenden Widgets
+        self._quad_placeholder: Optional[QLabel] = None
         self.grid_layout.setContentsMargins(0, 0, 0, 0)
         self.grid_layout.setSpacing(0)
+        # 2x2 Raster mit gleich verteilten Zeilen und Spalten, aendert sich nie
+        for i in range(2):
+            self.grid_layout.setRowStretch(i, 1)
+            self.grid_layout.setColumnStretch(i, 1)
 
         self.mode_stack = QStackedWidget(self)
         self.mode_stack.addWidget(self.single_host)  # 0
@@ -153,7 +214,7 @@ class MainWindow(QMainWindow):
 
     # ---------- Root und Sidebar ----------
     def _build_root_and_sidebar(self):
-        titles = [s.name for s in self.sources]
+        titles = self._source_titles
 
         old = self.centralWidget()
         if old:
@@ -187,10 +248,28 @@ class MainWindow(QMainWindow):
 
         self._place_overlay_burger()
 
+    def _sidebar_layout_key(self) -> tuple:
+        """Alle UI Felder, aus denen _build_root_and_sidebar das Layout baut."""
+        ui = self.cfg.ui
+        return (ui.nav_orientation, ui.enable_hamburger, ui.logo_path, ui.sidebar_width, ui.split_enabled)
+
     def resizeEvent(self, ev):
         super().resizeEvent(ev)
         self._place_overlay_burger()
 
+    def showEvent(self, ev):
+        super().showEvent(ev)
+        self._sync_watchdog_timer()
+
+    def hideEvent(self, ev):
+        super().hideEvent(ev)
+        self._sync_watchdog_timer()
+
+    def changeEvent(self, ev):
+        super().changeEvent(ev)
+        if ev.type() == QEvent.Type.WindowStateChange:
+            self._sync_watchdog_timer()
+
     def _place_overlay_burger(self):
         margin = 8
         self.overlay_burger.move(margin, margin)
@@ -214,9 +293,11 @@ class MainWindow(QMainWindow):
 
     def _open_overlay_menu(self):
         m = QMenu(self)
-        for idx, title in enumerate([s.name for s in self.sources]):
+        # Quellen tragen ihren Index als Action Daten, ein gemeinsamer Slot fuer alle
+        m.triggered.connect(self._on_overlay_action)
+        for idx, title in enumerate(self._source_titles):
             act = m.addAction(title)
-            act.triggered.connect(lambda _=False, i=idx: self.on_select_view(i))
+            act.setData(idx)
         m.addSeparator()
         act_show = m.addAction(tr("Show bar"))
         act_show.triggered.connect(lambda: self.set_sidebar_collapsed(False))
@@ -228,27 +309,27 @@ class MainWindow(QMainWindow):
         pos = self.overlay_burger.mapToGlobal(self.overlay_burger.rect().bottomLeft())
         m.exec(pos)
 
+    def _on_overlay_action(self, action):
+        idx = action.data()
+        if isinstance(idx, int):
+            self.on_select_view(idx)
+
     def _nudge_local_apps(self):
-    # nur sichtbare Widgets der aktuellen Ansicht anstossen
-        visible_widgets = []
+        # nur sichtbare Widgets der aktuellen Ansicht anstossen
+        local = self._local_app_indices
+        if not local:
+            return
         if self.state.mode == ViewMode.SINGLE:
-            idx = self.state.active_index
-            actual = self._resolve_display_index(idx)
-            if 0 <= actual < len(self.source_widgets):
-                visible_widgets.append(self.source_widgets[actual])
+            slots = (self.state.active_index,)
         else:
             # Quad Seite
             start = self.current_page * self.page_size
-            for i in range(4):
-                slot = start + i
-                if 0 <= slot < self.num_sources:
-                    actual = self._resolve_display_index(slot)
-                    if 0 <= actual < len(self.source_widgets):
-                        visible_widgets.append(self.source_widgets[actual])
+            slots = range(start, min(start + 4, self.num_sources))
 
-        for w in visible_widgets:
-            if isinstance(w, LocalAppWidget):
-                w.force_fit()
+        for slot in slots:
+            actual = self._resolve_display_index(slot)
+            if actual in local:
+                self.source_widgets[actual].force_fit()
 
 
     # ---------- Erstellung der Quellenwidgets ----------
@@ -257,48 +338,58 @@ class MainWindow(QMainWindow):
         self.browser_services.clear()
         for s in self.sources:
             if s.type == "browser":
-                view = make_webview()
-                host = BrowserHostWidget(
-                    placeholder_enabled=self.cfg.ui.placeholder_enabled,
-                    gif_path=self.cfg.ui.placeholder_gif_path
-                )
-                host.set_view(view)
-                if self.cfg.ui.placeholder_enabled:
-                    host.show_placeholder()
-                self.source_widgets.append(host)
-
-                svc = BrowserService(view, s.url, name=f"Browser:{s.name}")
-                svc.page_loading.connect(host.show_placeholder)
-                svc.page_ready.connect(host.show_view)
-                svc.page_error.connect(lambda _msg, h=host: h.show_placeholder())
-                self.browser_services.append(svc)
+                # WebEngine Views sind teuer (eigener Renderer Prozess), daher erst bei Bedarf
+                self.source_widgets.append(None)
+                self.browser_services.append(None)
             else:
-                # Lokale App inklusive aller Konfigurationsfelder abbilden
-                launch_cmd = str(getattr(s, "launch_cmd", "") or "").strip()
-                args = str(getattr(s, "args", "") or "").strip()
-
-                def _normalise_optional_str(value):
-                    if not value:
-                        return None
-                    text = str(value).strip()
-                    return text or None
-
+                # Lokale App inklusive aller Konfigurationsfelder abbilden, SourceSpec liefert alle Felder mit Defaults
                 spec = LocalAppSpec(
-                    launch_cmd=launch_cmd,
-                    args=args,
-                    embed_mode=str(getattr(s, "embed_mode", "native_window") or "native_window"),
-                    window_title_pattern=_normalise_optional_str(getattr(s, "window_title_pattern", None)) or ".*",
-                    window_class_pattern=_normalise_optional_str(getattr(s, "window_class_pattern", None)),
-                    child_window_class_pattern=_normalise_optional_str(getattr(s, "child_window_class_pattern", None)),
-                    child_window_title_pattern=_normalise_optional_str(getattr(s, "child_window_title_pattern", None)),
-                    follow_children=bool(getattr(s, "follow_children", True)),
-                    web_url=_normalise_optional_str(getattr(s, "web_url", None)),
-                    allow_global_fallback=bool(getattr(s, "allow_global_fallback", False)),
+                    launch_cmd=str(s.launch_cmd or "").strip(),
+                    args=str(s.args or "").strip(),
+                    embed_mode=str(s.embed_mode or "native_window"),
+                    window_title_pattern=_optional_str(s.window_title_pattern) or ".*",
+                    window_class_pattern=_optional_str(s.window_class_pattern),
+                    child_window_class_pattern=_optional_str(s.child_window_class_pattern),
+                    child_window_title_pattern=_optional_str(s.child_window_title_pattern),
+                    follow_children=bool(s.follow_children),
+                    web_url=_optional_str(s.web_url),
+                    allow_global_fallback=bool(s.allow_global_fallback),
                 )
 
                 w = LocalAppWidget(spec)
                 self.source_widgets.append(w)
                 self.browser_services.append(None)
+        self._local_app_indices = {idx for idx, w in enumerate(self.source_widgets) if isinstance(w, LocalAppWidget)}
+        self._all_services = [self.source_widgets[idx] for idx in sorted(self._local_app_indices)]
+
+    def _ensure_widget(self, idx: int) -> QWidget | None:
+        """Widget fuer Quelle idx liefern und Browser Quellen beim ersten Zugriff bauen."""
+        if not (0 <= idx < len(self.source_widgets)):
+            return None
+        w = self.source_widgets[idx]
+        if w is not None or not (0 <= idx < len(self.sources)):
+            return w
+        s = self.sources[idx]
+        view = make_webview()
+        host = BrowserHostWidget(
+            placeholder_enabled=self.cfg.ui.placeholder_enabled,
+            gif_path=self.cfg.ui.placeholder_gif_path
+        )
+        host.set_view(view)
+        if self.cfg.ui.placeholder_enabled:
+            host.show_placeholder()
+        self.source_widgets[idx] = host
+
+        svc = BrowserService(view, s.url, name=f"Browser:{s.name}")
+        svc.page_loading.connect(host.show_placeholder)
+        svc.page_ready.connect(host.show_view)
+        svc.page_error.connect(host.show_placeholder_on_error)
+        svc.page_ready.connect(lambda i=idx: self._mark_source_ready(i))
+        self.browser_services[idx] = svc
+        self._all_services.append(svc)
+        if self._services_started:
+            svc.start()
+        return host
 
     def _cleanup_sources(self):
         for svc in getattr(self, "browser_services", []):
@@ -307,7 +398,19 @@ class MainWindow(QMainWindow):
                     svc.stop()
                 except Exception:
                     pass
+                # Verbindungen zu Host und Fenster loesen, damit View und Renderer sofort freigegeben werden
+                for sig in (svc.page_loading, svc.page_ready, svc.page_error):
+                    try:
+                        sig.disconnect()
+                    except Exception:
+                        pass
+                try:
+                    svc.deleteLater()
+                except Exception:
+                    pass
         for w in getattr(self, "source_widgets", []):
+            if w is None:
+                continue
             try:
                 if isinstance(w, LocalAppWidget):
                     w.stop()
@@ -324,13 +427,12 @@ class MainWindow(QMainWindow):
         if hasattr(self, "single_layout"):
             _clear_layout(self.single_layout)
         if hasattr(self, "grid_layout"):
-            while self.grid_layout.count():
-                it = self.grid_layout.takeAt(0)
-                w = it.widget()
-                if w:
-                    w.setParent(None)
+            self._clear_grid()
         self.source_widgets = []
         self.browser_services = []
+        self._all_services = []
+        self._services_started = False
+        self._local_app_indices = set()
         if getattr(self, "_initial_loading_timer", None):
             try:
                 self._initial_loading_timer.stop()
@@ -338,7 +440,8 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self._initial_loading_timer = None
-        self._initial_loading_flags = []
+        self._initial_ready_mask = 0
+        self._initial_ready_target = 0
         self._initial_loading_complete = False
         if getattr(self, "_schedule_timer", None):
             try:
@@ -391,8 +494,8 @@ class MainWindow(QMainWindow):
                 pass
             self._schedule_timer = None
 
+        # _source_index_by_name und _source_titles werden nur beim Setzen von self.sources neu gebaut
         schedules = getattr(self.cfg, "schedules", []) or []
-        self._source_index_by_name = {s.name: idx for idx, s in enumerate(self.sources)}
 
         scheduler = ContentScheduler(schedules)
         if scheduler.has_rules:
@@ -447,7 +550,9 @@ class MainWindow(QMainWindow):
         self.num_sources = len(self.sources)
         self._display_indices = list(range(self.num_sources))
         self._source_index_by_name = {s.name: idx for idx, s in enumerate(self.sources)}
+        self._source_titles = [s.name for s in self.sources]
         self.current_page = 0
+        self._max_page = max(0, (self.num_sources - 1) // self.page_size)
         self.state.set_active(0 if self.num_sources else 0)
 
         start_mode = getattr(cfg.ui, "start_mode", "single") or "single"
@@ -499,25 +604,19 @@ class MainWindow(QMainWindow):
         if not isinstance(raw, dict):
             raise ValueError(tr("Selected file is not a valid configuration."))
 
-        has_sources = bool(raw.get("sources"))
-        has_browser = bool(raw.get("browser_urls"))
-        has_local = bool(raw.get("local_app"))
-        has_count = False
-        try:
-            has_count = int(raw.get("count", 0)) > 0
-        except Exception:
-            has_count = False
-
-        if not (has_sources or has_browser or has_local or has_count):
+        if not _declares_sources(raw):
             raise ValueError(tr("Configuration must define at least one source."))
 
-        cfg = load_config(path)
+        # bereits geparstes JSON weiterverwenden statt die Datei ein zweites Mal zu lesen
+        cfg = load_config_from_dict(raw)
         if not cfg.sources:
             raise ValueError(tr("Configuration must define at least one source."))
         return cfg
 
     def _apply_restored_config(self, cfg: Config):
-        old_cfg = copy.deepcopy(self.cfg)
+        # _apply_config_object ersetzt self.cfg nur und veraendert die alte Instanz nicht,
+        # die Referenz reicht daher fuer den Rollback
+        old_cfg = self.cfg
         try:
             self._cleanup_sources()
             self._apply_config_object(cfg)
@@ -530,6 +629,8 @@ class MainWindow(QMainWindow):
                 self.log.exception("failed to rollback UI after restore error", extra={"source": "config"})
             raise
 
+        # ein noch laufendes Speichern im Hintergrund darf die Wiederherstellung nicht ueberschreiben
+        self._flush_config_saves()
         try:
             save_config(self.cfg_path, cfg)
         except Exception as ex:
@@ -552,41 +653,56 @@ class MainWindow(QMainWindow):
             return
         _clear_layout(self.single_layout)
         actual = self._resolve_display_index(idx)
-        if 0 <= actual < len(self.source_widgets):
-            _attach(self.source_widgets[actual], self.single_layout)
-
-    def _attach_quad_page(self, page: int):
+        # Widget kann aus dem Raster stammen, Raster beim naechsten Quad Aufruf neu fuellen
+        self._quad_attached = None
+        w = self._ensure_widget(actual)
+        if w is not None:
+            _attach(w, self.single_layout)
+
+    def _attach_quad_page(self, page: int) -> bool:
+        """Seite ins Raster haengen. False, wenn genau diese Belegung schon haengt."""
         self.current_page = page
-        while self.grid_layout.count():
-            it = self.grid_layout.takeAt(0)
-            w = it.widget()
-            if w:
-                w.setParent(None)
+        start = page * self.page_size
+        key = (page, tuple(self._resolve_display_index(slot) for slot in range(start, min(start + 4, self.num_sources))))
+        if key == self._quad_attached:
+            return False
+        # alle Umbauten in einem Layout- und Paint-Durchgang
+        self.grid.setUpdatesEnabled(False)
+        try:
+            self._fill_quad_grid(page)
+        finally:
+            self.grid.setUpdatesEnabled(True)
+            self.grid.update()
+        self._quad_attached = key
+        return True
+
+    def _clear_grid(self):
+        _clear_layout(self.grid_layout)
+        self._quad_attached = None
+
+    def _fill_quad_grid(self, page: int):
+        self._clear_grid()
 
         start = page * self.page_size
         items: List[QWidget] = []
         for i in range(4):
             slot = start + i
             if slot < self.num_sources:
-                actual = self._resolve_display_index(slot)
-                if 0 <= actual < len(self.source_widgets):
-                    items.append(self.source_widgets[actual])
+                w = self._ensure_widget(self._resolve_display_index(slot))
+                if w is not None:
+                    items.append(w)
 
         n = len(items)
 
-        for r in range(2):
-            self.grid_layout.setRowStretch(r, 0)
-        for c in range(2):
-            self.grid_layout.setColumnStretch(c, 0)
-
         if n == 0:
-            ph = QLabel("leer", self.grid)
-            ph.setAlignment(Qt.AlignCenter)
-            ph.setStyleSheet("background:#202020; color:#808080; border:1px solid #2a2a2a;")
-            self.grid_layout.addWidget(ph, 0, 0, 1, 2)
-            self.grid_layout.setRowStretch(0, 1)
-            self.grid_layout.setColumnStretch(0, 1)
-            self.grid_layout.setColumnStretch(1, 1)
+            ph = self._quad_placeholder
+            if ph is None:
+                ph = QLabel("leer", self.grid)
+                ph.setAlignment(Qt.AlignCenter)
+                ph.setStyleSheet("background:#202020; color:#808080; border:1px solid #2a2a2a;")
+                self._quad_placeholder = ph
+            self.grid_layout.addWidget(ph, 0, 0, 2, 2)
+            ph.show()
             return
 
         if n == 1:
@@ -603,11 +719,8 @@ class MainWindow(QMainWindow):
             self.grid_layout.addWidget(items[1], 0, 1)
             self.grid_layout.addWidget(items[2], 1, 0)
             self.grid_layout.addWidget(items[3], 1, 1)
-
-        self.grid_layout.setRowStretch(0, 1)
-        self.grid_layout.setRowStretch(1, 1)
-        self.grid_layout.setColumnStretch(0, 1)
-        self.grid_layout.setColumnStretch(1, 1)
+        for w in items:
+            w.show()
 
     # ---------- Einstellungen ----------
     def open_settings(self):
@@ -627,7 +740,7 @@ class MainWindow(QMainWindow):
             shortcuts=self.cfg.ui.shortcuts,
             remote_export=logging_cfg.remote_export if logging_cfg else None,
             schedule_data=schedule_payload,
-            source_names=[s.name for s in self.sources],
+            source_names=self._source_titles,
             backup_handler=self._backup_config,
             restore_handler=self._restore_config,
             parent=self
@@ -657,6 +770,7 @@ class MainWindow(QMainWindow):
                 QTimer.singleShot(0, self.close)
                 return
 
+            old_ui = self._sidebar_layout_key()
             self.cfg.ui.theme = res["theme"]
             self.cfg.ui.nav_orientation = res["nav_orientation"]
             self.cfg.ui.enable_hamburger = res["enable_hamburger"]
@@ -664,7 +778,8 @@ class MainWindow(QMainWindow):
             self.cfg.ui.placeholder_gif_path = res["placeholder_gif_path"]
             self.cfg.ui.language = res["language"]
             self.cfg.ui.logo_path = res["logo_path"]
-            self.cfg.ui.shortcuts = res.get("shortcuts", self.cfg.ui.shortcuts)
+            if res.get("shortcuts") is not None:
+                self.cfg.ui.shortcuts = shortcut_map(res["shortcuts"])
 
             schedule_res = res.get("schedule")
             if schedule_res is not None:
@@ -694,57 +809,93 @@ class MainWindow(QMainWindow):
                             extra={"source": "logging"},
                         )
 
-            # Anwenden
-            self.apply_theme(self.cfg.ui.theme)
-            i18n.set_language(self.cfg.ui.language)
-            self._build_root_and_sidebar()
-            self._setup_scheduler()
-            if not self.cfg.ui.enable_hamburger:
-                self.set_sidebar_collapsed(False)
-
-            for w in self.source_widgets:
-                if isinstance(w, BrowserHostWidget):
-                    w.set_placeholder_enabled(self.cfg.ui.placeholder_enabled)
-                    w.set_placeholder_gif(self.cfg.ui.placeholder_gif_path)
-                    if not self.cfg.ui.placeholder_enabled:
-                        w.show_view()
-
-            self._setup_shortcuts()
+            # Anwenden, Theme, Sprache und Umbau in einem einzigen Repaint
+            self.setUpdatesEnabled(False)
+            try:
+                self.apply_theme(self.cfg.ui.theme)
+                i18n.set_language(self.cfg.ui.language)
+                # Root und Sidebar nur neu bauen, wenn sich deren Aufbau wirklich geaendert hat
+                if self._sidebar_layout_key() != old_ui:
+                    self._build_root_and_sidebar()
+                self._setup_scheduler()
+                if not self.cfg.ui.enable_hamburger:
+                    self.set_sidebar_collapsed(False)
+
+                for w in self.source_widgets:
+                    if isinstance(w, BrowserHostWidget):
+                        w.set_placeholder_enabled(self.cfg.ui.placeholder_enabled)
+                        w.set_placeholder_gif(self.cfg.ui.placeholder_gif_path)
+                        if not self.cfg.ui.placeholder_enabled:
+                            w.show_view()
+
+                self._setup_shortcuts()
+            finally:
+                self.setUpdatesEnabled(True)
+                self.update()
+            self._save_config_async()
+
+    def _save_config_async(self) -> None:
+        """Config im Hintergrund schreiben; ein Worker haelt die Reihenfolge der Speichervorgaenge."""
+        try:
+            # asdict kopiert tief, spaetere Aenderungen an self.cfg landen nicht im laufenden Schreibvorgang
+            data = asdict(self.cfg)
+        except Exception as ex:
+            self.log.error("failed to persist config update: %s", ex, extra={"source": "config"})
+            return
+        path = self.cfg_path
 
+        def _write():
             try:
-                save_config(self.cfg_path, self.cfg)
+                save_config(path, data)
             except Exception as ex:
                 self.log.error("failed to persist config update: %s", ex, extra={"source": "config"})
 
-    def _setup_shortcuts(self):
-        # vorhandene Shortcuts entfernen
-        for sc in getattr(self, "_shortcuts", {}).values():
-            try:
-                sc.setParent(None)
-            except Exception:
-                pass
-        self._shortcuts = {}
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ConfigSave")
+        self._save_executor.submit(_write)
+
+    def _flush_config_saves(self) -> None:
+        executor, self._save_executor = self._save_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
 
+    def _setup_shortcuts(self):
         mapping = DEFAULT_SHORTCUTS.copy()
         try:
             mapping.update({k: v for k, v in self.cfg.ui.shortcuts.items() if v})
         except Exception:
             pass
 
-        def _add(action: str, seq: str | None, handler):
-            if not seq:
-                return
+        handlers = {f"select_{i+1}": (lambda i=i: self._select_by_position(i)) for i in range(4)}
+        handlers["next_page"] = lambda: self._page_delta(+1)
+        handlers["prev_page"] = lambda: self._page_delta(-1)
+        if self.cfg.ui.split_enabled:
+            handlers["toggle_mode"] = self.on_toggle_mode
+        handlers["toggle_kiosk"] = self.toggle_kiosk
+        wanted = {action: mapping.get(action) for action in handlers if mapping.get(action)}
+
+        # unveraenderte Bindungen behalten, nur geaenderte oder entfallene abbauen
+        previous = getattr(self, "_shortcut_mapping", {})
+        shortcuts = {}
+        for action, sc in getattr(self, "_shortcuts", {}).items():
+            if action in wanted and wanted[action] == previous.get(action):
+                shortcuts[action] = sc
+                continue
+            try:
+                sc.setEnabled(False)
+                sc.deleteLater()
+            except Exception:
+                pass
+
+        for action, seq in wanted.items():
+            if action in shortcuts:
+                continue
             sc = QShortcut(QKeySequence(seq), self)
-            sc.activated.connect(handler)
-            self._shortcuts[action] = sc
+            sc.activated.connect(handlers[action])
+            shortcuts[action] = sc
 
-        for i in range(4):
-            _add(f"select_{i+1}", mapping.get(f"select_{i+1}"), lambda i=i: self._select_by_position(i))
-        _add("next_page", mapping.get("next_page"), lambda: self._page_delta(+1))
-        _add("prev_page", mapping.get("prev_page"), lambda: self._page_delta(-1))
-        if self.cfg.ui.split_enabled:
-            _add("toggle_mode", mapping.get("toggle_mode"), self.on_toggle_mode)
-        _add("toggle_kiosk", mapping.get("toggle_kiosk"), self.toggle_kiosk)
+        self._shortcuts = shortcuts
+        self._shortcut_mapping = wanted
 
     def _on_language_changed(self, _lang: str) -> None:
         self.retranslate_ui()
@@ -758,22 +909,11 @@ class MainWindow(QMainWindow):
                 pass
 
     def apply_theme(self, theme: str):
-        if theme == "light":
-            self.setStyleSheet("""
-                QWidget { background: #f4f4f4; color: #202020; }
-                QToolButton, QPushButton { background: #ffffff; border: 1px solid #d0d0d0; padding: 6px; }
-                QLineEdit { background: #ffffff; border: 1px solid #d0d0d0; padding: 4px; }
-                QCheckBox::indicator { width: 16px; height: 16px; border: 1px solid #999; background: #fff; }
-                QCheckBox::indicator:checked { background: #0078d4; image: none; }
-            """)
-        else:
-            self.setStyleSheet("""
-                QWidget { background: #121212; color: #e0e0e0; }
-                QToolButton, QPushButton { background: #1f1f1f; border: 1px solid #2a2a2a; padding: 6px; }
-                QLineEdit { background: #1b1b1b; border: 1px solid #2a2a2a; padding: 4px; }
-                QCheckBox::indicator { width: 16px; height: 16px; border: 1px solid #5a5a5a; background: #2a2a2a; }
-                QCheckBox::indicator:checked { background: #3b82f6; image: none; border: 1px solid #3b82f6; }
-            """)
+        sheet = _THEME_STYLESHEETS["light" if theme == "light" else "dark"]
+        # unveraendertes Stylesheet nicht neu setzen, Qt wuerde sonst alle Widgets neu polishen
+        if self.styleSheet() == sheet:
+            return
+        self.setStyleSheet(sheet)
 
     # ---------- Paging Helfer ----------
     def _page_delta(self, delta: int):
@@ -783,8 +923,7 @@ class MainWindow(QMainWindow):
             else:
                 self.sidebar.prev_page()
         else:
-            max_page = max(0, (self.num_sources - 1) // self.page_size)
-            new_page = max(0, min(max_page, self.current_page + delta))
+            new_page = max(0, min(self._max_page, self.current_page + delta))
             if new_page != self.current_page:
                 self.current_page = new_page
                 if self.state.mode == ViewMode.QUAD:
@@ -798,8 +937,8 @@ class MainWindow(QMainWindow):
 
     @Slot(int)
     def on_page_changed(self, page: int):
-        if self.state.mode == ViewMode.QUAD:
-            self._attach_quad_page(page)
+        # Sidebar meldet dieselbe Seite auch beim Aufbau erneut, dann nichts umhaengen
+        if self.state.mode == ViewMode.QUAD and self._attach_quad_page(page):
             # Nach Seitenwechsel hart nachskalieren
             self._nudge_local_apps()
 
@@ -845,12 +984,9 @@ class MainWindow(QMainWindow):
         self.setGeometry(geo)
 
     def _start_services(self):
-        for svc in self.browser_services:
-            if svc is not None:
-                svc.start()
-        for w in self.source_widgets:
-            if isinstance(w, LocalAppWidget):
-                w.start()
+        self._services_started = True
+        for svc in self._all_services:
+            svc.start()
 
     def _setup_initial_loading_tracker(self):
         if getattr(self, "_initial_loading_timer", None):
@@ -862,7 +998,8 @@ class MainWindow(QMainWindow):
             self._initial_loading_timer = None
 
         total = len(self.source_widgets)
-        self._initial_loading_flags = [False] * total
+        self._initial_ready_mask = 0
+        self._initial_ready_target = (1 << total) - 1
         self._initial_loading_complete = False
 
         if total == 0:
@@ -877,22 +1014,25 @@ class MainWindow(QMainWindow):
         for idx, widget in enumerate(self.source_widgets):
             if isinstance(widget, LocalAppWidget):
                 widget.ready.connect(lambda i=idx: self._mark_source_ready(i))
-            else:
-                svc = self.browser_services[idx] if idx < len(self.browser_services) else None
-                if svc is not None:
-                    svc.page_ready.connect(lambda i=idx: self._mark_source_ready(i))
-                else:
-                    self._mark_source_ready(idx)
+            elif widget is not None:
+                self._mark_source_ready(idx)
+            # None: Browser meldet sich nach _ensure_widget selbst ueber page_ready
 
         self._initial_loading_timer.start()
+        # was nach dem ersten Anzeigen noch nicht gebaut ist, haelt den Start nicht auf
+        QTimer.singleShot(0, self._mark_unbuilt_sources_ready)
+
+    def _mark_unbuilt_sources_ready(self):
+        for idx, widget in enumerate(self.source_widgets):
+            if widget is None:
+                self._mark_source_ready(idx)
 
     def _mark_source_ready(self, idx: int):
-        if not (0 <= idx < len(self._initial_loading_flags)):
+        bit = 1 << idx if idx >= 0 else 0
+        if not (bit & self._initial_ready_target) or bit & self._initial_ready_mask:
             return
-        if self._initial_loading_flags[idx]:
-            return
-        self._initial_loading_flags[idx] = True
-        if all(self._initial_loading_flags):
+        self._initial_ready_mask |= bit
+        if self._initial_ready_mask == self._initial_ready_target:
             self._emit_initial_loading_complete()
 
     def _emit_initial_loading_complete(self):
@@ -910,7 +1050,8 @@ class MainWindow(QMainWindow):
         self.initial_load_finished.emit()
 
     def _on_initial_loading_timeout(self):
-        pending = [idx for idx, ready in enumerate(self._initial_loading_flags) if not ready]
+        missing = self._initial_ready_target & ~self._initial_ready_mask
+        pending = [idx for idx in range(missing.bit_length()) if missing >> idx & 1]
         if pending:
             self.log.warning(
                 "timeout while waiting for sources to embed; pending indices=%s",
@@ -978,12 +1119,21 @@ class MainWindow(QMainWindow):
         return Path(__file__).resolve().parents[2]
 
     def _tick_watchdogs(self):
-        for svc in self.browser_services:
-            if svc is not None:
-                svc.heartbeat()
-        for w in self.source_widgets:
-            if isinstance(w, LocalAppWidget):
-                w.heartbeat()
+        for svc in self._all_services:
+            svc.heartbeat()
+
+    def _sync_watchdog_timer(self):
+        """Watchdog nur laufen lassen, solange das Fenster sichtbar und nicht minimiert ist."""
+        timer = getattr(self, "reconnect_timer", None)
+        if timer is None:
+            return
+        active = self.isVisible() and not self.isMinimized()
+        if active and not timer.isActive():
+            timer.start()
+            # verpasste Pruefungen beim Zurueckkehren sofort nachholen
+            self._tick_watchdogs()
+        elif not active and timer.isActive():
+            timer.stop()
 
     def enter_kiosk(self):
         self.showFullScreen()
@@ -1004,12 +1154,10 @@ class MainWindow(QMainWindow):
             if not mods & Qt.ShiftModifier:
                 ev.ignore()
                 return
-        for svc in self.browser_services:
-            if svc is not None:
-                svc.stop()
-        for w in self.source_widgets:
-            if isinstance(w, LocalAppWidget):
-                w.stop()
+        for svc in self._all_services:
+            svc.stop()
+        # ausstehende Config Schreibvorgaenge vor dem Beenden abschliessen
+        self._flush_config_saves()
         super().closeEvent(ev)
 
     # ---------- Fenster Spy nur aus Einstellungen ----------
@@ -17,10 +17,10 @@ QMessageBox = QtWidgets.QMessageBox
 QAbstractItemView = QtWidgets.QAbstractItemView
 QWidget = QtWidgets.QWidget
 
-from modules.services.local_app_service import (
+from modules.services._win32 import (
     EnumWindowsProc, EnumWindows, GetWindowThreadProcessId, DWORD,
-    IsWindowVisible, GetAncestor, GA_ROOT, GetWindowTextW, GetClassNameW,
-    snapshot_processes
+    IsWindowVisible, window_text, class_name,
+    snapshot_processes, collect_pid_tree
 )
 from modules.utils.logger import get_logger
 from modules.utils.i18n import tr, i18n
@@ -107,18 +107,10 @@ class WindowSpyDialog(QDialog):
         if not self.pid_root:
             return set()
         try:
-            parent_map, _ = snapshot_processes()
+            _, _, children_map = snapshot_processes()
         except Exception:
             return {self.pid_root}
-        res = {self.pid_root}
-        queue = [self.pid_root]
-        while queue:
-            cur = queue.pop()
-            for child, parent in parent_map.items():
-                if parent == cur and child not in res:
-                    res.add(child)
-                    queue.append(child)
-        return res
+        return collect_pid_tree(self.pid_root, children_map)
 
     def _on_language_changed(self, _lang: str) -> None:
         self._apply_translations()
@@ -139,11 +131,9 @@ class WindowSpyDialog(QDialog):
 
         def _cb(hwnd, _lparam):
             try:
+                # EnumWindows liefert nur Top-Level Fenster, keine Root Pruefung noetig
                 if not IsWindowVisible(hwnd):
                     return True
-                root = GetAncestor(hwnd, GA_ROOT)
-                if not root or root != hwnd:
-                    return True
 
                 # PID
                 proc_id = DWORD(0)
@@ -152,15 +142,8 @@ class WindowSpyDialog(QDialog):
                 if fam and pid not in fam:
                     return True
 
-                # Titel
-                tbuf = ctypes.create_unicode_buffer(512)
-                GetWindowTextW(hwnd, tbuf, 512)
-                title = tbuf.value or ""
-
-                # Klasse
-                cbuf = ctypes.create_unicode_buffer(256)
-                GetClassNameW(hwnd, cbuf, 256)
-                cls = cbuf.value or ""
+                title = window_text(hwnd)
+                cls = class_name(hwnd)
 
                 rows.append((int(hwnd), pid, cls, title))
             except Exception:
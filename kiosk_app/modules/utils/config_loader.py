@@ -1,18 +1,27 @@
 # modules/utils/config_loader.py
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import re
 import sys
+from collections import ChainMap
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from modules.utils.resource_loader import (
     get_resource_path,
     load_resource_text,
 )
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - stdlib json als Fallback
+    orjson = None  # type: ignore
+
 log = logging.getLogger(__name__)
 
 
@@ -50,6 +59,14 @@ def find_bundled_config() -> Optional[Path]:
     return get_resource_path("config.json")
 
 
+def _read_json(path: Path) -> Any:
+    # orjson arbeitet direkt auf Bytes, sonst stdlib json
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
 def _load_default_config_payload() -> Optional[Dict[str, Any]]:
     bundled = find_bundled_config()
     if not bundled:
@@ -61,8 +78,7 @@ def _load_default_config_payload() -> Optional[Dict[str, Any]]:
         except Exception:
             return None
     try:
-        with bundled.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        return _read_json(bundled)
     except Exception as ex:
         log.warning(
             "Failed to read bundled default config '%s': %s",
@@ -72,8 +88,8 @@ def _load_default_config_payload() -> Optional[Dict[str, Any]]:
         )
         return None
 
-# Standard Tastaturkuerzel
-DEFAULT_SHORTCUTS: Dict[str, str] = {
+# Standard Tastaturkuerzel, nach aussen schreibgeschuetzt (Kopie per .copy())
+_DEFAULT_SHORTCUT_MAP: Dict[str, str] = {
     "select_1": "Ctrl+1",
     "select_2": "Ctrl+2",
     "select_3": "Ctrl+3",
@@ -83,6 +99,23 @@ DEFAULT_SHORTCUTS: Dict[str, str] = {
     "toggle_mode": "Ctrl+Q",
     "toggle_kiosk": "F11",
 }
+DEFAULT_SHORTCUTS: Mapping[str, str] = MappingProxyType(_DEFAULT_SHORTCUT_MAP)
+
+
+class _ShortcutMap(ChainMap):
+    """Eigene Kuerzel vorne, Rest faellt auf die eingefrorenen Defaults durch (keine Kopie).
+
+    Den Proxy koennen deepcopy/asdict nicht kopieren; er ist unveraenderlich und wird geteilt.
+    """
+
+    def __deepcopy__(self, memo):
+        return type(self)(copy.deepcopy(self.maps[0], memo), *self.maps[1:])
+
+
+def shortcut_map(user: Optional[Mapping[str, str]] = None) -> Mapping[str, str]:
+    """Kuerzel ueber den Defaults; leere Eintraege gelten als nicht gesetzt."""
+    own = {str(k): v for k, v in (user or {}).items() if v}
+    return _ShortcutMap(own, DEFAULT_SHORTCUTS)
 
 # =========================
 # Datenklassen
@@ -141,7 +174,7 @@ class UISettings:
     theme: str = "light"                     # "light" oder "dark"
     language: str = ""                       # z.B. "de" oder "en"; leer = Systemstandard
     logo_path: str = ""
-    shortcuts: Dict[str, str] = field(default_factory=lambda: DEFAULT_SHORTCUTS.copy())
+    shortcuts: Mapping[str, str] = field(default_factory=lambda: shortcut_map())
 
 
 @dataclass
@@ -260,6 +293,7 @@ __all__ = [
     "KioskConfig",
     "LoggingConfig",
     "load_config",
+    "load_config_from_dict",
     "save_config",
     "find_bundled_config",
     "_parse_sources",
@@ -268,6 +302,7 @@ __all__ = [
     "_parse_logging",
     "_parse_updates",
     "DEFAULT_SHORTCUTS",
+    "shortcut_map",
 ]
 
 # =========================
@@ -333,18 +368,19 @@ def _as_opt_int(value: Any) -> Optional[int]:
         return None
 
 
+# HH:MM (Stunde/Minute ein- oder zweistellig), einmal beim Import kompiliert
+_HHMM_RE = re.compile(r"^\s*(\d{1,2}):(\d{1,2})\s*$")
+
+
 def _parse_schedule_time(value: str) -> Optional[int]:
-    try:
-        parts = value.split(":", 1)
-        if len(parts) != 2:
-            return None
-        hour = int(parts[0])
-        minute = int(parts[1])
-        if not (0 <= hour < 24 and 0 <= minute < 60):
-            return None
-        return hour * 60 + minute
-    except Exception:
+    m = _HHMM_RE.match(value) if isinstance(value, str) else None
+    if m is None:
         return None
+    hour = int(m.group(1))
+    minute = int(m.group(2))
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return None
+    return hour * 60 + minute
 
 
 def _parse_schedule_block(raw: Any, *, strict: bool = False) -> Optional[ScheduleBlock]:
@@ -538,8 +574,7 @@ def _parse_ui(data: Dict[str, Any]) -> UISettings:
                 shortcuts[str(k)] = _safe_str(v)
             except Exception:
                 continue
-    merged = DEFAULT_SHORTCUTS.copy()
-    merged.update({k: v for k, v in shortcuts.items() if v})
+    merged = shortcut_map(shortcuts)
 
     return UISettings(
         start_mode=_safe_str(ui.get("start_mode") or "quad"),
@@ -688,7 +723,8 @@ def _parse_remote_export(lg: Dict[str, Any]) -> RemoteLogExportSettings:
 
 def _parse_logging(data: Dict[str, Any]) -> LoggingSettings:
     lg = data.get("logging") or {}
-    defaults = LoggingSettings()
+    # Einfache Defaults liegen als Klassenattribute vor, keine Wegwerf-Instanz noetig
+    defaults = LoggingSettings
     mask_raw = lg.get("mask_keys")
     mask_keys = defaults.mask_keys
     if mask_raw is not None:
@@ -754,18 +790,11 @@ def _defaults_config() -> Config:
 # Oeffentliche API
 # =========================
 
-def load_config(path: Path) -> Config:
+def load_config_from_dict(raw: Dict[str, Any]) -> Config:
     """
-    Laedt eine Config von Pfad. Heilt fehlende Felder und erzeugt bei Bedarf Defaults.
+    Baut eine Config aus bereits geparstem JSON. Heilt fehlende Felder und erzeugt bei Bedarf Defaults.
     """
     try:
-        if not path.exists():
-            log.info("config file not found at %s. using defaults", path)
-            return _defaults_config()
-
-        with path.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
-
         cfg = Config(
             sources=_parse_sources(raw),
             schedules=parse_schedule_definitions(raw),
@@ -785,6 +814,30 @@ def load_config(path: Path) -> Config:
         return _defaults_config()
 
 
+def load_config(path: Path) -> Config:
+    """
+    Laedt eine Config von Pfad. Heilt fehlende Felder und erzeugt bei Bedarf Defaults.
+    """
+    try:
+        if not path.exists():
+            log.info("config file not found at %s. using defaults", path)
+            return _defaults_config()
+
+        raw = _read_json(path)
+    except Exception as ex:
+        log.error("Fehler beim Laden der Config: %s. Verwende Defaults.", ex)
+        return _defaults_config()
+
+    return load_config_from_dict(raw)
+
+
+def _json_default(obj: Any) -> Any:
+    # ChainMap (shortcuts) und andere Mappings flach speichern
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def save_config(path: Path, cfg: Config | Dict[str, Any]) -> None:
     """
     Schreibt die Config als JSON. Akzeptiert entweder ein Config Objekt oder ein dict.
@@ -797,7 +850,7 @@ def save_config(path: Path, cfg: Config | Dict[str, Any]) -> None:
         else:
             data = asdict(cfg)
         with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(data, f, ensure_ascii=False, indent=2, default=_json_default)
     except Exception as ex:
         log.error("Konnte Config nicht speichern: %s", ex)
         raise
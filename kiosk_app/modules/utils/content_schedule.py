@@ -5,27 +5,20 @@ be unit tested without a running event loop.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
-from .config_loader import PaneSchedule
+from .config_loader import PaneSchedule, _parse_schedule_time
 
 Minutes = int
 
 
-def _time_to_minutes(value: str) -> Optional[Minutes]:
-    try:
-        parts = value.split(":", 1)
-        if len(parts) != 2:
-            return None
-        hour = int(parts[0])
-        minute = int(parts[1])
-        if not (0 <= hour < 24 and 0 <= minute < 60):
-            return None
-        return hour * 60 + minute
-    except Exception:
-        return None
+# gleiche HH:MM Auswertung wie beim Laden der Config
+_time_to_minutes: Callable[[str], Optional[Minutes]] = _parse_schedule_time
+
+
+_DAY_MINUTES = 24 * 60
 
 
 @dataclass
@@ -33,14 +26,15 @@ class _PreparedBlock:
     start: Minutes
     end: Minutes
     source: str
+    # Laenge des Fensters ab start, start == end gilt als ganzer Tag
+    span: Minutes = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.span = (self.end - self.start) % _DAY_MINUTES or _DAY_MINUTES
 
     def is_active(self, minute: Minutes) -> bool:
-        if self.start == self.end:
-            return True
-        if self.start < self.end:
-            return self.start <= minute < self.end
-        # wrap around midnight
-        return minute >= self.start or minute < self.end
+        # deckt auch Bloecke ueber Mitternacht ab
+        return (minute - self.start) % _DAY_MINUTES < self.span
 
 
 class ContentScheduler:
@@ -102,10 +96,13 @@ class ContentScheduler:
 def compute_slot_assignments(
     num_sources: int,
     assignments: Dict[int, str],
-    name_to_index: Dict[str, int],
+    name_to_index: Union[Mapping[str, int], Sequence[str]],
 ) -> Tuple[List[int], List[Tuple[int, str, str]]]:
     """Resolve the schedule mapping to concrete source indices.
 
+    ``name_to_index`` is either a prebuilt name -> index mapping (callers that
+    evaluate repeatedly should cache one) or the ordered source names.
+
     Returns a tuple ``(indices, conflicts)`` where ``indices`` is a list mapping
     each pane index to a source index, and ``conflicts`` describes entries that
     could not be honoured exactly (unknown sources, duplicates, ...).
@@ -114,6 +111,9 @@ def compute_slot_assignments(
     if num_sources <= 0:
         return [], []
 
+    if not isinstance(name_to_index, Mapping):
+        name_to_index = {name: idx for idx, name in enumerate(name_to_index)}
+
     indices: List[int] = list(range(num_sources))
     conflicts: List[Tuple[int, str, str]] = []
     used: Dict[int, int] = {}
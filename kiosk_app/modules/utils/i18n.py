@@ -46,8 +46,11 @@ class LanguageManager(QObject):
         self._meta: Dict[str, Dict[str, str]] = {}
         self._fallback = "en"
         self._lang = "en"
+        # aufgeloeste Texte der aktiven Sprache (inkl. Fallback), wird bei Sprachwechsel geleert
+        self._resolved: Dict[str, str] = {}
         self.reload()
         self._lang = _detect_system_language(self._translations.keys(), self._fallback)
+        self._resolved = {}
 
     def reload(self) -> None:
         translations: Dict[str, Dict[str, str]] = {}
@@ -94,6 +97,7 @@ class LanguageManager(QObject):
 
         self._translations = translations
         self._meta = meta
+        self._resolved = {}
 
         if self._fallback not in self._translations:
             self._fallback = "en" if "en" in self._translations else next(iter(self._translations.keys()))
@@ -114,11 +118,14 @@ class LanguageManager(QObject):
         return langs
 
     def tr(self, key: str, **kwargs) -> str:
-        text = self._translations.get(self._lang, {}).get(key)
-        if text is None and self._fallback:
-            text = self._translations.get(self._fallback, {}).get(key)
+        text = self._resolved.get(key)
         if text is None:
-            text = key
+            text = self._translations.get(self._lang, {}).get(key)
+            if text is None and self._fallback:
+                text = self._translations.get(self._fallback, {}).get(key)
+            if text is None:
+                text = key
+            self._resolved[key] = text
         if kwargs:
             try:
                 return text.format(**kwargs)
@@ -134,6 +141,7 @@ class LanguageManager(QObject):
             normalized = self._fallback
         if normalized and normalized != self._lang:
             self._lang = normalized
+            self._resolved = {}
             self.language_changed.emit(normalized)
 
     def get_language(self) -> str:
@@ -23,6 +23,10 @@ except Exception:  # pragma: no cover - resolved lazily in _send_sftp
     paramiko = None  # type: ignore
 
 
+# Dateien unter dieser Groesse landen unkomprimiert im Archiv
+_STORE_BELOW_BYTES = 4096
+
+
 class RemoteExportError(RuntimeError):
     """Fehler beim Remote Export."""
 
@@ -177,18 +181,22 @@ class RemoteLogExporter:
         compression = ZIP_DEFLATED if self.settings.compress else ZIP_STORED
         with ZipFile(archive_path, "w", compression=compression) as zf:
             for file in files:
-                zf.write(file, arcname=file.name)
+                compress_type = compression
+                if compression != ZIP_STORED:
+                    try:
+                        # Kleine Dateien lohnen Deflate nicht, nur speichern
+                        if file.stat().st_size < _STORE_BELOW_BYTES:
+                            compress_type = ZIP_STORED
+                    except OSError:
+                        pass
+                zf.write(file, arcname=file.name, compress_type=compress_type)
         return archive_path
 
     def _send_to_destination(self, dest: RemoteLogDestination, archive: Path) -> None:
-        if dest.type == "http":
-            self._send_http(dest, archive)
-        elif dest.type == "sftp":
-            self._send_sftp(dest, archive)
-        elif dest.type == "email":
-            self._send_email(dest, archive)
-        else:
+        method_name = _TRANSPORTS.get(dest.type)
+        if method_name is None:
             raise RemoteExportError(f"unknown destination type: {dest.type}")
+        getattr(self, method_name)(dest, archive)
 
     def _send_http(self, dest: RemoteLogDestination, archive: Path) -> None:
         if not dest.url:
@@ -349,5 +357,13 @@ class RemoteLogExporter:
             self.logger.debug("notification callback failed", exc_info=True)
 
 
+# Versandmethode je Zieltyp; Aufruf ueber getattr, damit Unterklassen und Patches greifen
+_TRANSPORTS: Dict[str, str] = {
+    "http": "_send_http",
+    "sftp": "_send_sftp",
+    "email": "_send_email",
+}
+
+
 import smtplib  # noqa: E402  # isort:skip (after smtplib usage)
 